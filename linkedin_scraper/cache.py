@@ -0,0 +1,225 @@
+import collections
+import pickle
+import sqlite3
+import threading
+import time
+
+from . import serialization
+from .urls import canonicalize_url
+
+
+class MemoryCache(object):
+    """Thread safe LRU cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, maxsize=1024, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, max_age=None):
+        entry = self.get_entry(key, max_age)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, key, max_age=None):
+        """`(value, stored_at)` of a fresh entry, or None."""
+        max_age = max_age if max_age is not None else self.ttl
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, stored_at = entry
+            if max_age is not None and time.time() - stored_at > max_age:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, value, stored_at=None):
+        with self._lock:
+            self._entries[key] = (value, stored_at or time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class SQLiteCache(object):
+    """Pickled values in a sqlite file, expiring after `ttl` seconds."""
+
+    def __init__(self, path="linkedin_scraper_cache.db", ttl=None):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB, stored_at REAL)"
+        )
+
+    def get(self, key, max_age=None):
+        entry = self.get_entry(key, max_age)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, key, max_age=None):
+        """`(value, stored_at)` of a fresh entry, or None."""
+        max_age = max_age if max_age is not None else self.ttl
+        with self._lock:
+            row = self.db.execute("SELECT value, stored_at FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        value, stored_at = row
+        if max_age is not None and time.time() - stored_at > max_age:
+            return None
+        return pickle.loads(value), stored_at
+
+    def set(self, key, value, stored_at=None):
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO cache (key, value, stored_at) VALUES (?, ?, ?)",
+                (key, blob, stored_at or time.time()),
+            )
+
+    def delete(self, key):
+        with self._lock, self.db:
+            self.db.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def close(self):
+        self.db.close()
+
+
+class TieredCache(object):
+    """
+    Looks caches up in order (e.g. memory, then disk) and copies hits into
+    the faster tiers in front of them, keeping their original age. Writes go
+    to every tier.
+    """
+
+    def __init__(self, *tiers):
+        self.tiers = tiers
+
+    def get(self, key, max_age=None):
+        entry = self.get_entry(key, max_age)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, key, max_age=None):
+        for i, tier in enumerate(self.tiers):
+            entry = tier.get_entry(key, max_age=max_age)
+            if entry is not None:
+                for faster in self.tiers[:i]:
+                    faster.set(key, entry[0], stored_at=entry[1])
+                return entry
+        return None
+
+    def set(self, key, value, stored_at=None):
+        for tier in self.tiers:
+            tier.set(key, value, stored_at=stored_at)
+
+    def delete(self, key):
+        for tier in self.tiers:
+            tier.delete(key)
+
+
+class _Call(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """Runs at most one call per key at a time; concurrent callers share its outcome."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        """Return `(result, leader)`, where `leader` is True for the caller that ran `fn`."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, False
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, True
+
+
+HOUR = 60 * 60
+DEFAULT_MAX_AGE = {
+    "person": 7 * 24 * HOUR,
+    "company": 30 * 24 * HOUR,
+    "job": 24 * HOUR,
+}
+
+
+class ResultCache(object):
+    """
+    Read-through cache of scraped results, shared by `Person`, `Company` and
+    `Job` through their `cache` argument. A stored result younger than the
+    max-age of its kind is returned instead of scraping; concurrent requests
+    for the same url in this process trigger a single scrape.
+
+        cache = ResultCache(SQLiteCache("results_cache.db"), max_age={"person": 3600})
+        person = Person(url, driver=driver, cache=cache)
+    """
+
+    def __init__(self, backend=None, max_age=None):
+        self.backend = backend if backend is not None else MemoryCache(maxsize=10000)
+        self.max_age = dict(DEFAULT_MAX_AGE, **(max_age or {}))
+        self._flight = SingleFlight()
+
+    @staticmethod
+    def key(kind, url):
+        return f"{kind}:{canonicalize_url(url)}"
+
+    def get(self, kind, url):
+        data = self.backend.get(self.key(kind, url), max_age=self.max_age.get(kind))
+        return serialization.loads(data) if data is not None else None
+
+    def set(self, kind, url, result):
+        self.backend.set(self.key(kind, url), serialization.dumps(result))
+
+    def fetch(self, kind, url, scrape):
+        """
+        A fresh cached result for `url`, or the result of `scrape()`, which
+        is stored only if it is complete: a result with sections that
+        failed, timed out or were skipped is scraped again next time.
+        """
+        key = self.key(kind, url)
+        max_age = self.max_age.get(kind)
+        data = self.backend.get(key, max_age=max_age)
+        if data is not None:
+            return serialization.loads(data)
+
+        def load():
+            data = self.backend.get(key, max_age=max_age)
+            if data is not None:
+                return None, data
+            result = scrape()
+            data = serialization.dumps(result)
+            if getattr(result, "complete", True):
+                self.backend.set(key, data)
+            return result, data
+
+        (result, data), leader = self._flight.do(key, load)
+        if leader and result is not None:
+            return result
+        return serialization.loads(data)
@@ -0,0 +1,153 @@
+import argparse
+import os
+import sys
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+from .company import Company
+from .export import CSVWriter, NDJSONWriter
+from .jobs import Job
+from .runner import SCRAPERS, run_queue_workers
+from .stats import Throughput
+from .storage import SQLiteSink
+from .urls import url_kind
+from .work_queue import SQLiteWorkQueue
+
+KINDS = ["auto", "job_search"] + list(SCRAPERS)
+
+
+def headless_chrome():
+    options = Options()
+    options.add_argument("--headless=new")
+    return webdriver.Chrome(options=options)
+
+
+def read_tasks(path, kind="auto", options=None):
+    """(kind, target, options) for every non-empty line of `path`; lines that are not urls are job searches."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            target = line.strip()
+            if not target or target.startswith("#"):
+                continue
+            task_kind = kind
+            if task_kind == "auto":
+                task_kind = url_kind(target) or "job_search"
+            yield task_kind, target, (options or {}).get(task_kind, {})
+
+
+class CSVPerKind(object):
+    """
+    One `CSVWriter` per kind of result ("person", "company" or "job"), since
+    their columns differ: results.csv becomes results.person.csv,
+    results.company.csv, ... Each file is created when its first row comes.
+    """
+
+    def __init__(self, path, flush_every=1):
+        self.path = path
+        self.flush_every = flush_every
+        self.writers = {}
+
+    def path_of(self, kind):
+        directory, name = os.path.split(self.path)
+        stem = name[:name.index(".csv")]
+        return os.path.join(directory, f"{stem}.{kind}{name[len(stem):]}")
+
+    def write(self, result):
+        kind = "company" if isinstance(result, Company) else "job" if isinstance(result, Job) else "person"
+        if kind not in self.writers:
+            self.writers[kind] = CSVWriter(self.path_of(kind), flush_every=self.flush_every)
+        self.writers[kind].write(result)
+
+    def close(self):
+        for writer in self.writers.values():
+            writer.close()
+
+
+def open_output(path):
+    # a task is acked as soon as its result is written, so write every result through at once
+    name = os.path.basename(path)
+    if name.endswith((".db", ".sqlite", ".sqlite3")):
+        return SQLiteSink(path, batch_size=1)
+    if ".csv" in name:
+        return CSVPerKind(path, flush_every=1)
+    return NDJSONWriter(path, flush_every=1)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="linkedin-scraper",
+        description="Scrape a file of LinkedIn person/company/job urls or job search terms.",
+    )
+    parser.add_argument("input", help="file with one url or search term per line")
+    parser.add_argument("-o", "--output", default="results.ndjson",
+                        help="output file: .ndjson, .csv (one file per kind, optionally .gz) or a sqlite .db (default: %(default)s)")
+    parser.add_argument("-k", "--kind", default="auto", choices=KINDS,
+                        help="what the input lines are (default: detect from the url)")
+    parser.add_argument("-w", "--workers", type=int, default=4, help="number of browser processes (default: %(default)s)")
+    parser.add_argument("--checkpoint", help="work queue file used to resume (default: <output>.queue.db)")
+    parser.add_argument("--pacing", help="file the workers share their navigation rate through (default: <output>.pacing.db)")
+    parser.add_argument("--employees", action="store_true", help="also enumerate company employees")
+    parser.add_argument("--headless", action="store_true", help="run Chrome headless")
+    parser.add_argument("--email", default=os.getenv("LINKEDIN_USER"))
+    parser.add_argument("--password", default=os.getenv("LINKEDIN_PASSWORD"))
+    parser.add_argument("--cookie", default=os.getenv("LINKEDIN_COOKIE"), help="li_at cookie to log in with")
+    parser.add_argument("--max-attempts", type=int, default=3)
+    parser.add_argument("-q", "--quiet", action="store_true", help="do not print progress")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    checkpoint = args.checkpoint or args.output + ".queue.db"
+    pacing = args.pacing or args.output + ".pacing.db"
+
+    work_queue = SQLiteWorkQueue(checkpoint, max_attempts=args.max_attempts)
+    added = work_queue.put_many(read_tasks(args.input, args.kind, {"company": {"get_employees": args.employees}}))
+    counts = work_queue.counts()
+    if not args.quiet:
+        print(f"{added} new tasks, {counts.get('done', 0)} already done", file=sys.stderr)
+
+    throughput = Throughput()
+    output = open_output(args.output)
+    try:
+        for item in run_queue_workers(
+            checkpoint,
+            workers=args.workers,
+            driver_factory=headless_chrome if args.headless else webdriver.Chrome,
+            email=args.email,
+            password=args.password,
+            cookie=args.cookie,
+            max_attempts=args.max_attempts,
+            pacing=pacing,
+            ack=False,
+        ):
+            throughput.record(item.elapsed, item.ok)
+            if item.ok:
+                for result in item.result if isinstance(item.result, list) else [item.result]:
+                    output.write(result)
+                # only now, so a crash before the write leaves the task to be retried
+                work_queue.ack(item.task)
+            elif not args.quiet:
+                print(f"\nfailed {item.kind} {item.url}: {item.error}", file=sys.stderr)
+            if not args.quiet:
+                print(f"\r{throughput}", end="", file=sys.stderr, flush=True)
+    finally:
+        output.close()
+
+    counts = work_queue.counts()
+    work_queue.close()
+    dead = counts.get("dead", 0)
+    # left when the workers stopped at an auth wall or a checkpoint
+    unfinished = counts.get("pending", 0) + counts.get("leased", 0)
+    if not args.quiet:
+        print(f"\r{throughput}", file=sys.stderr)
+        if dead:
+            print(f"{dead} tasks failed {args.max_attempts} times, see {checkpoint}", file=sys.stderr)
+        if unfinished:
+            print(f"{unfinished} tasks not finished, run again to resume from {checkpoint}", file=sys.stderr)
+    return 1 if dead or unfinished else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,14 +2,19 @@ import requests
 from lxml import html
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from .objects import Scraper
 from .person import Person
+from .urls import detail_url
+from .deadline import Deadline
+from .scheduler import page_boundary
 import time
 import os
 import json
+import itertools
+import re
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 
 AD_BANNER_CLASSNAME = ('ad-banner-container', '__ad')
 
@@ -17,9 +22,7 @@ def getchildren(elem):
     return elem.find_elements(By.XPATH, ".//*")
 
 class CompanySummary(object):
-    linkedin_url = None
-    name = None
-    followers = None
+    __slots__ = ("linkedin_url", "name", "followers")
 
     def __init__(self, linkedin_url = None, name = None, followers = None):
         self.linkedin_url = linkedin_url
@@ -32,6 +35,13 @@ class CompanySummary(object):
         else:
             return """ {name} {followers} """.format(name = self.name, followers = self.followers)
 
+    def to_dict(self):
+        return {
+            "linkedin_url": self.linkedin_url,
+            "name": self.name,
+            "followers": self.followers,
+        }
+
 class Company(Scraper):
     linkedin_url = None
     name = None
@@ -47,9 +57,22 @@ class Company(Scraper):
     showcase_pages = []
     affiliated_companies = []
     employees = []
+    employees_reused = False
     headcount = None
-
-    def __init__(self, linkedin_url = None, name = None, about_us =None, website = None, phone = None, headquarters = None, founded = None, industry = None, company_type = None, company_size = None, specialties = None, showcase_pages =[], affiliated_companies = [], driver = None, scrape = True, get_employees = True, close_on_complete = True):
+    # the people list stops after this many results, however many match
+    PEOPLE_RESULT_CAP = 1000
+    HEADCOUNT_COVERAGE = 0.9
+    SHARD_FACETS = ("facetGeoRegion", "facetCurrentFunction", "facetSchool")
+    SECTION_FIELDS = {
+        "about": (
+            "name", "about_us", "website", "phone", "headquarters", "founded", "industry",
+            "company_type", "company_size", "specialties", "headcount",
+        ),
+        "company_pages": ("showcase_pages", "affiliated_companies"),
+        "employees": ("employees", "employees_reused"),
+    }
+
+    def __init__(self, linkedin_url = None, name = None, about_us =None, website = None, phone = None, headquarters = None, founded = None, industry = None, company_type = None, company_size = None, specialties = None, showcase_pages = None, affiliated_companies = None, driver = None, scrape = True, get_employees = True, close_on_complete = True, previous = None, cache = None, deadline = None, sections = None):
         self.linkedin_url = linkedin_url
         self.name = name
         self.about_us = about_us
@@ -61,8 +84,12 @@ class Company(Scraper):
         self.company_type = company_type
         self.company_size = company_size
         self.specialties = specialties
-        self.showcase_pages = showcase_pages
-        self.affiliated_companies = affiliated_companies
+        self.showcase_pages = showcase_pages or []
+        self.affiliated_companies = affiliated_companies or []
+        self.section_status = {}
+        self.section_errors = {}
+        self.deadline = Deadline.of(deadline)
+        self.sections = sections
 
         if driver is None:
             try:
@@ -75,11 +102,17 @@ class Company(Scraper):
             except:
                 driver = webdriver.Chrome()
 
-        driver.get(linkedin_url)
         self.driver = driver
 
-        if scrape:
-            self.scrape(get_employees=get_employees, close_on_complete=close_on_complete)
+        def get_and_scrape():
+            self._get(linkedin_url)
+            if scrape:
+                self.scrape(get_employees=get_employees, close_on_complete=close_on_complete, previous=previous)
+
+        if scrape and cache is not None:
+            self._read_through(cache, "company", get_and_scrape, close=driver.close if close_on_complete else None)
+        else:
+            get_and_scrape()
 
     def __get_text_under_subtitle(self, elem):
         return "\n".join(elem.text.split("\n")[1:])
@@ -87,11 +120,13 @@ class Company(Scraper):
     def __get_text_under_subtitle_by_class(self, driver, class_name):
         return self.__get_text_under_subtitle(driver.find_element(By.CLASS_NAME, class_name))
 
-    def scrape(self, get_employees=True, close_on_complete=True):
+    def scrape(self, get_employees=True, close_on_complete=True, previous=None, deadline=None):
+        if deadline is not None:
+            self.deadline = Deadline.of(deadline)
         if self.is_signed_in():
-            self.scrape_logged_in(get_employees = get_employees, close_on_complete = close_on_complete)
+            self.scrape_logged_in(get_employees = get_employees, close_on_complete = close_on_complete, previous = previous)
         else:
-            self.scrape_not_logged_in(get_employees = get_employees, close_on_complete = close_on_complete)
+            self.scrape_not_logged_in(get_employees = get_employees, close_on_complete = close_on_complete, previous = previous)
 
     def __parse_employee__(self, employee_raw):
 
@@ -118,75 +153,254 @@ class Company(Scraper):
             # print(e)
             return None
 
-    def get_employees(self, wait_time=10):
-        total = []
+    def _people_url(self, facets=None):
+        url = detail_url(self.linkedin_url, "people")
+        if facets:
+            url += "/?" + urllib.parse.urlencode(facets)
+        return url
+
+    def iter_employees(self, wait_time=10, facets=None, driver=None):
+        """
+        Yield employees from the people page as they are loaded. `facets`
+        filters the people list, e.g. {"facetGeoRegion": "103644278"}, and
+        `driver` overrides the company's own driver.
+        """
+        count = 0
         list_css = "list-style-none"
         next_xpath = '//button[@aria-label="Next"]'
-        driver = self.driver
+        driver = driver or self.driver
 
         try:
             see_all_employees = driver.find_element(By.XPATH,'//a[@data-control-name="topcard_see_all_employees"]')
         except:
             pass
-        driver.get(os.path.join(self.linkedin_url, "people"))
+        self._get(self._people_url(facets), driver)
 
-        _ = WebDriverWait(driver, 3).until(EC.presence_of_all_elements_located((By.XPATH, '//span[@dir="ltr"]')))
+        _ = self.wait_for_all_elements_to_load(by=By.XPATH, name='//span[@dir="ltr"]', base=driver, timeout=3)
 
         driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));")
-        time.sleep(1)
+        time.sleep(self._timeout(1))
         driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight*3/4));")
-        time.sleep(1)
+        time.sleep(self._timeout(1))
 
         results_list = driver.find_element(By.CLASS_NAME, list_css)
         results_li = results_list.find_elements(By.TAG_NAME, "li")
         for res in results_li:
-            total.append(self.__parse_employee__(res))
+            count += 1
+            yield self.__parse_employee__(res)
 
         def is_loaded(previous_results):
           loop = 0
           driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight));")
           results_li = results_list.find_elements(By.TAG_NAME, "li")
           while len(results_li) == previous_results and loop <= 5:
+            self._check_deadline()
             time.sleep(1)
             driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight));")
             results_li = results_list.find_elements(By.TAG_NAME, "li")
             loop += 1
           return loop <= 5
 
-        def get_data(previous_results):
-            results_li = results_list.find_elements(By.TAG_NAME, "li")
-            for res in results_li[previous_results:]:
-                total.append(self.__parse_employee__(res))
-
         results_li_len = len(results_li)
         while is_loaded(results_li_len):
+            self._check_deadline()
+            if page_boundary(driver):
+                # the driver ran a more urgent task in between
+                results_list = self._reload_people_list(driver, facets, results_li_len, wait_time)
             try:
                 driver.find_element(By.XPATH,next_xpath).click()
             except:
                 pass
-            _ = WebDriverWait(driver, wait_time).until(EC.presence_of_element_located((By.CLASS_NAME, list_css)))
+            _ = self.wait_for_element_to_load(name=list_css, base=driver, timeout=wait_time)
 
             driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));")
-            time.sleep(1)
+            time.sleep(self._timeout(1))
             driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight*2/3));")
-            time.sleep(1)
+            time.sleep(self._timeout(1))
             driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight*3/4));")
-            time.sleep(1)
+            time.sleep(self._timeout(1))
             driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight));")
-            time.sleep(1)
+            time.sleep(self._timeout(1))
 
-            get_data(results_li_len)
-            results_li_len = len(total)
-        return total
+            results_li = results_list.find_elements(By.TAG_NAME, "li")
+            for res in results_li[results_li_len:]:
+                count += 1
+                yield self.__parse_employee__(res)
+            results_li_len = count
+
+    def _reload_people_list(self, driver, facets, count, wait_time=10):
+        """Load the people page again and page through it until `count` employees are listed."""
+        self._get(self._people_url(facets), driver)
+        results_list = self.wait_for_element_to_load(name="list-style-none", base=driver, timeout=wait_time)
+        loaded = -1
+        while loaded < count:
+            results_li = results_list.find_elements(By.TAG_NAME, "li")
+            if len(results_li) == loaded:
+                break
+            loaded = len(results_li)
+            try:
+                driver.find_element(By.XPATH, '//button[@aria-label="Next"]').click()
+            except:
+                pass
+            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight));")
+            time.sleep(self._timeout(1))
+        return results_list
 
+    def get_employees(self, wait_time=10):
+        return list(self.iter_employees(wait_time=wait_time))
+
+    def get_people_facets(self, facet="facetGeoRegion", driver=None, facets=None):
+        """Values of `facet` offered as filters on the people page, filtered by `facets`."""
+        driver = driver or self.driver
+        self._get(self._people_url(facets), driver)
+        _ = self.wait_for_all_elements_to_load(by=By.XPATH, name='//span[@dir="ltr"]', base=driver, timeout=3)
+        values = re.findall(re.escape(facet) + r"(?:=|%3D)(\d+)", driver.page_source)
+        return list(dict.fromkeys(values))
+
+    def get_employees_sharded(self, pool, shards=None, facet="facetGeoRegion", wait_time=10):
+        """
+        Enumerate the people list split by `facet` (facetGeoRegion,
+        facetCurrentFunction, facetSchool), one shard per driver of `pool`,
+        merged and de-duplicated by profile url. Only employees matching one of
+        the `shards` values are returned, so prefer a facet every profile has.
+        With fewer than two values the whole list is enumerated instead.
+
+        A shard that reaches `PEOPLE_RESULT_CAP` was cut off, so it is split
+        again by the other `SHARD_FACETS`. A shard that cannot be split any
+        further leaves `section_status["employees"]` as "partial", with the
+        truncated shards in `section_errors["employees"]`.
+
+        Employees without any of the facet values fall outside every shard.
+        When `headcount` is known and fewer than `HEADCOUNT_COVERAGE` of it
+        were found, the unfiltered list is enumerated as well, and the section
+        is left "partial" if the count still falls short.
+        """
+        if shards is None:
+            with pool.acquire() as driver:
+                shards = self.get_people_facets(facet, driver=driver)
+        split_facets = [facet] + [other for other in self.SHARD_FACETS if other != facet]
+
+        def enumerate_shard(facets):
+            with pool.acquire() as driver:
+                shard = list(self.iter_employees(wait_time=wait_time, facets=facets, driver=driver))
+                if len(shard) < self.PEOPLE_RESULT_CAP:
+                    return shard, []
+                for split in split_facets:
+                    if split in facets:
+                        continue
+                    values = self.get_people_facets(split, driver=driver, facets=facets)
+                    if len(values) > 1:
+                        return shard, [dict(facets, **{split: value}) for value in values]
+                return shard, None
+
+        pending = [{facet: value} for value in shards] if len(shards) > 1 else [{}]
+        employees = {}
+        truncated = []
+        with ThreadPoolExecutor(max_workers=max(len(pool), 1)) as executor:
+            while pending:
+                splits = []
+                for facets, (shard, children) in zip(pending, executor.map(enumerate_shard, pending)):
+                    for employee in shard:
+                        if employee and employee.get("linkedin_url"):
+                            employees.setdefault(employee["linkedin_url"].split("?")[0], employee)
+                    if children is None:
+                        truncated.append(facets)
+                    else:
+                        splits.extend(children)
+                pending = splits
+
+        def short_of_headcount():
+            return bool(self.headcount) and len(employees) < self.headcount * self.HEADCOUNT_COVERAGE
+
+        if len(shards) > 1 and short_of_headcount():
+            with pool.acquire() as driver:
+                for employee in self.iter_employees(wait_time=wait_time, facets={}, driver=driver):
+                    if employee and employee.get("linkedin_url"):
+                        employees.setdefault(employee["linkedin_url"].split("?")[0], employee)
+
+        errors = []
+        if truncated:
+            errors.append("%d shard(s) reached the %d result cap: %s" % (
+                len(truncated), self.PEOPLE_RESULT_CAP, ", ".join(urllib.parse.urlencode(facets) or "all" for facets in truncated)
+            ))
+        if short_of_headcount():
+            errors.append("%d of %d employees enumerated" % (len(employees), self.headcount))
+        if errors:
+            self.section_status["employees"] = "partial"
+            self.section_errors["employees"] = "; ".join(errors)
+        else:
+            self.section_status["employees"] = "complete"
+            self.section_errors.pop("employees", None)
+        return list(employees.values())
+
+    def refresh_employees(self, previous, wait_time=10, sample_size=12):
+        """
+        Reuse `previous.employees` when they were enumerated completely and
+        the headcount and the first `sample_size` employees are unchanged,
+        otherwise keep enumerating.
+        """
+        employees = self.iter_employees(wait_time=wait_time)
+        sample = list(itertools.islice(employees, sample_size))
+
+        def urls(items):
+            return [employee and employee.get("linkedin_url") for employee in items]
+
+        previous_employees = getattr(previous, "employees", None) or []
+        if (
+            self._completed(previous, "employees")
+            and self.headcount is not None
+            and self.headcount == getattr(previous, "headcount", None)
+            and urls(sample) == urls(previous_employees[:sample_size])
+        ):
+            employees.close()
+            self.employees_reused = True
+            return list(previous_employees)
+
+        self.employees_reused = False
+        return sample + list(employees)
+
+    def _scrape_employees(self, previous=None):
+        if previous is not None:
+            self.employees = self.refresh_employees(previous)
+            return
+        # filled page by page, so a deadline leaves the employees found so far
+        self.employees = []
+        for employee in self.iter_employees():
+            self.employees.append(employee)
+
+    def scrape_logged_in(self, get_employees = True, close_on_complete = True, previous = None):
+        """
+        Scrape in order of priority: about page, showcase/affiliated pages,
+        then employees. With a `deadline` the waits are capped by the time
+        left, and `section_status` tells which sections are complete. With
+        `sections`, only those are scraped and the rest come from `previous`.
+        """
+        driver = self.driver
+        self.section_status = {}
+        self.section_errors = {}
+        self._reuse_sections(previous)
+
+        if self.sections is not None and "about" not in self.sections:
+            # showcase/affiliated pages are listed on the about page
+            self._get(detail_url(self.linkedin_url, "about"))
+        self._run_section("about", self._scrape_about)
+        self._run_section("company_pages", self._scrape_company_pages)
+
+        if get_employees:
+            self._run_section("employees", self._scrape_employees, previous)
 
+        if self.deadline is None:
+            self._get(self.linkedin_url, check=False)
 
-    def scrape_logged_in(self, get_employees = True, close_on_complete = True):
+        if close_on_complete:
+            driver.close()
+
+    def _scrape_about(self):
         driver = self.driver
 
-        driver.get(self.linkedin_url)
+        self._get(self.linkedin_url)
 
-        _ = WebDriverWait(driver, 3).until(EC.presence_of_all_elements_located((By.XPATH, '//div[@dir="ltr"]')))
+        _ = self.wait_for_all_elements_to_load(by=By.XPATH, name='//div[@dir="ltr"]', timeout=3)
 
         navigation = driver.find_element(By.CLASS_NAME, "org-page-navigation__items ")
 
@@ -199,10 +413,10 @@ class Company(Scraper):
             navigation.find_elements(By.XPATH, "//a[@data-control-name='org_about_module_see_all_view_link']"),
           ).click()
         except:
-          driver.get(os.path.join(self.linkedin_url, "about"))
+          self._get(detail_url(self.linkedin_url, "about"))
 
-        _ = WebDriverWait(driver, 3).until(EC.presence_of_all_elements_located((By.TAG_NAME, 'section')))
-        time.sleep(3)
+        _ = self.wait_for_all_elements_to_load(by=By.TAG_NAME, name='section', timeout=3)
+        time.sleep(self._timeout(3))
 
         if 'Cookie Policy' in driver.find_elements(By.TAG_NAME, "section")[1].text or any(classname in driver.find_elements(By.TAG_NAME, "section")[1].get_attribute('class') for classname in AD_BANNER_CLASSNAME):
             section_id = 4
@@ -249,15 +463,16 @@ class Company(Scraper):
             for span in spans:
                 txt = span.text.strip()
                 if "See all" in txt and "employees on LinkedIn" in txt:
-                    self.headcount = int(txt.replace("See all", "").replace("employees on LinkedIn", "").strip())
+                    self.headcount = int(txt.replace("See all", "").replace("employees on LinkedIn", "").replace(",", "").strip())
         except NoSuchElementException: # Does not exist in page, skip it
             pass
 
         driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));")
 
-
+    def _scrape_company_pages(self):
+        driver = self.driver
         try:
-            _ = WebDriverWait(driver, 3).until(EC.presence_of_element_located((By.CLASS_NAME, 'company-list')))
+            _ = self.wait_for_element_to_load(name='company-list', timeout=3)
             showcase, affiliated = driver.find_elements(By.CLASS_NAME, "company-list")
             driver.find_element(By.ID,"org-related-companies-module__show-more-btn").click()
 
@@ -272,7 +487,7 @@ class Company(Scraper):
 
             # affiliated company
 
-            for affiliated_company in showcase.find_element(By.CLASS_NAME, "org-company-card"):
+            for affiliated_company in affiliated.find_elements(By.CLASS_NAME, "org-company-card"):
                 companySummary = CompanySummary(
                          linkedin_url = affiliated_company.find_element(By.CLASS_NAME, "company-name-link").get_attribute("href"),
                         name = affiliated_company.find_element(By.CLASS_NAME, "company-name-link").text.strip(),
@@ -280,22 +495,15 @@ class Company(Scraper):
                         )
                 self.affiliated_companies.append(companySummary)
 
-        except:
+        except (TimeoutException, NoSuchElementException, ValueError):
+            # no related companies module, or not both lists
             pass
 
-        if get_employees:
-            self.employees = self.get_employees()
-
-        driver.get(self.linkedin_url)
-
-        if close_on_complete:
-            driver.close()
-
-    def scrape_not_logged_in(self, close_on_complete = True, retry_limit = 10, get_employees = True):
+    def scrape_not_logged_in(self, close_on_complete = True, retry_limit = 10, get_employees = True, previous = None):
         driver = self.driver
         retry_times = 0
         while self.is_signed_in() and retry_times <= retry_limit:
-            page = driver.get(self.linkedin_url)
+            page = self._get(self.linkedin_url, check=False)
             retry_times = retry_times + 1
 
         self.name = driver.find_element(By.CLASS_NAME, "name").text.strip()
@@ -313,7 +521,7 @@ class Company(Scraper):
         # get showcase
         try:
             driver.find_element(By.ID,"view-other-showcase-pages-dialog").click()
-            WebDriverWait(driver, 3).until(EC.presence_of_element_located((By.ID, 'dialog')))
+            self.wait_for_element_to_load(by=By.ID, name='dialog', timeout=3)
 
             showcase_pages = driver.find_elements(By.CLASS_NAME, "company-showcase-pages")[1]
             for showcase_company in showcase_pages.find_elements(By.TAG_NAME, "li"):
@@ -344,27 +552,33 @@ class Company(Scraper):
             pass
 
         if get_employees:
-            self.employees = self.get_employees()
+            self._scrape_employees(previous)
 
-        driver.get(self.linkedin_url)
+        self._get(self.linkedin_url, check=False)
 
         if close_on_complete:
             driver.close()
 
+    def to_dict(self):
+        return {
+            "linkedin_url": self.linkedin_url,
+            "name": self.name,
+            "about_us": self.about_us,
+            "specialties": self.specialties,
+            "website": self.website,
+            "phone": self.phone,
+            "industry": self.industry,
+            "company_type": self.company_type,
+            "headquarters": self.headquarters,
+            "company_size": self.company_size,
+            "founded": self.founded,
+            "showcase_pages": [page.to_dict() for page in self.showcase_pages],
+            "affiliated_companies": [page.to_dict() for page in self.affiliated_companies],
+            "employees": self.employees,
+            "headcount": self.headcount,
+            "section_status": dict(getattr(self, "section_status", {})),
+            "section_errors": dict(getattr(self, "section_errors", {})),
+        }
+
     def __repr__(self):
-        _output = {}
-        _output['name'] = self.name
-        _output['about_us'] = self.about_us
-        _output['specialties'] = self.specialties
-        _output['website'] = self.website
-        _output['phone'] = self.phone
-        _output['industry'] = self.industry
-        _output['company_type'] = self.name
-        _output['headquarters'] = self.headquarters
-        _output['company_size'] = self.company_size
-        _output['founded'] = self.founded
-        _output['affiliated_companies'] = self.affiliated_companies
-        _output['employees'] = self.employees
-        _output['headcount'] = self.headcount
-        
-        return json.dumps(_output).replace('\n', '')
+        return json.dumps(self.to_dict()).replace('\n', '')
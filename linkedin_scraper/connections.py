@@ -0,0 +1,85 @@
+import threading
+import time
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.wait import WebDriverWait
+
+from .objects import Contact, Scraper
+from .pacing import default_pacer, navigate
+
+CONNECTIONS_URL = "https://www.linkedin.com/mynetwork/invite-connect/connections/"
+
+_cache = {}
+_lock = threading.Lock()
+
+
+def _parse_connection_card(card):
+    anchor = card.find_element(By.CLASS_NAME, "mn-connection-card__link")
+    details = card.find_element(By.CLASS_NAME, "mn-connection-card__details")
+    return Contact(
+        name=details.find_element(By.CLASS_NAME, "mn-connection-card__name").text.strip(),
+        occupation=details.find_element(By.CLASS_NAME, "mn-connection-card__occupation").text.strip(),
+        url=anchor.get_attribute("href"),
+    )
+
+
+def iter_connections(driver, timeout=5, patience=5):
+    """
+    Yield a `Contact` for every connection of the logged in account,
+    scrolling the connections page until no more cards load.
+    """
+    navigate(driver, CONNECTIONS_URL, Scraper.pacer if Scraper.pacer is not None else default_pacer())
+    try:
+        container = WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CLASS_NAME, "mn-connections"))
+        )
+    except TimeoutException:
+        return
+
+    seen = 0
+    idle = 0
+    while idle <= patience:
+        cards = container.find_elements(By.CLASS_NAME, "mn-connection-card")
+        if len(cards) == seen:
+            idle += 1
+            try:
+                driver.find_element(By.XPATH, "//button[contains(@class, 'scaffold-finite-scroll__load-button')]").click()
+            except Exception:
+                pass
+            time.sleep(1)
+        else:
+            idle = 0
+            for card in cards[seen:]:
+                try:
+                    yield _parse_connection_card(card)
+                except NoSuchElementException:
+                    continue
+            seen = len(cards)
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+
+
+def get_connections(driver, ttl=3600, refresh=False):
+    """
+    All connections of the account logged in on `driver`, scraped once and
+    memoized per driver session for `ttl` seconds.
+    """
+    key = getattr(driver, "session_id", None) or id(driver)
+    with _lock:
+        entry = _cache.get(key)
+    if entry is not None and not refresh and time.time() - entry[1] <= ttl:
+        return list(entry[0])
+
+    contacts = list(iter_connections(driver))
+    with _lock:
+        _cache[key] = (contacts, time.time())
+    return list(contacts)
+
+
+def clear_connections_cache(driver=None):
+    with _lock:
+        if driver is None:
+            _cache.clear()
+        else:
+            _cache.pop(getattr(driver, "session_id", None) or id(driver), None)
@@ -0,0 +1,134 @@
+import datetime
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+# a month name, in full or abbreviated ("Sep", "Sept", "September"), nothing else
+_MONTH = r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sep(?:t|tember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
+_DATE = r"(?:%s\.?\s+)?\d{4}" % _MONTH
+_RANGE = re.compile(
+    r"(?P<start>%s)(?:\s*[-–—]\s*(?P<end>%s|present|current|now))?" % (_DATE, _DATE),
+    re.IGNORECASE,
+)
+_MONTH_YEAR = re.compile(r"(?:(?P<month>%s)\.?\s+)?(?P<year>\d{4})" % _MONTH, re.IGNORECASE)
+_DURATION = re.compile(r"(?:(?P<years>\d+)\s*yrs?)?\s*(?:(?P<months>\d+)\s*mos?)?", re.IGNORECASE)
+_DATE_LINE = re.compile(
+    r"^\s*(?:%s(?:\s*[-–—]\s*(?:%s|present|current|now))?|(?:\d+\s*yrs?\s*)?(?:\d+\s*mos?)?)\s*(?:·.*)?$"
+    % (_DATE, _DATE),
+    re.IGNORECASE,
+)
+
+
+class DateRange(NamedTuple):
+    from_date: str = ""
+    to_date: str = ""
+    duration: Optional[str] = None
+    start: Optional[datetime.date] = None
+    end: Optional[datetime.date] = None
+    is_current: bool = False
+    duration_months: Optional[int] = None
+
+    def fields(self):
+        """Keyword arguments for the date fields of `Experience` and `Education`."""
+        return {
+            "from_date": self.from_date,
+            "to_date": self.to_date,
+            "start_date": self.start,
+            "end_date": self.end,
+            "is_current": self.is_current,
+            "duration_months": self.duration_months,
+        }
+
+
+def _to_date(text):
+    match = _MONTH_YEAR.fullmatch(text.strip())
+    if not match:
+        return None, False
+    month = match.group("month")
+    if month is None:
+        return datetime.date(int(match.group("year")), 1, 1), False
+    return datetime.date(int(match.group("year")), MONTHS[month[:3].lower()], 1), True
+
+
+def _months_between(start, end):
+    """Months from `start` to `end`, both months counted."""
+    return (end.year - start.year) * 12 + end.month - start.month + 1
+
+
+def parse_date_range(text, today=None):
+    """
+    Parse a LinkedIn date line such as "Jan 2020 - Present · 3 yrs 2 mos" or
+    "2015 - 2019". `start`/`end` are the first day of the month (January when
+    only the year is shown); `duration_months` is the stated duration, or
+    computed for month ranges, up to `today` for open ones. A line that is
+    not a date range (e.g. "Joined 2012") has no dates.
+
+    >>> parse_date_range("Jan 2020 - Mar 2021 · 1 yr 3 mos").duration_months
+    15
+    """
+    dates, start_has_month = _parse_date_range(text)
+    if dates.is_current and dates.duration_months is None and start_has_month:
+        months = _months_between(dates.start, today or datetime.date.today())
+        dates = dates._replace(duration_months=max(months, 1))
+    return dates
+
+
+@lru_cache(maxsize=65536)
+def _parse_date_range(text):
+    if not text:
+        return DateRange(), False
+    times, _, duration = text.partition("·")
+    duration = duration.strip() or None
+
+    match = _RANGE.fullmatch(times.strip())
+    if not match:
+        if duration is None and _duration_months(times):
+            duration = times.strip()
+        return DateRange(duration=duration, duration_months=_duration_months(duration)), False
+
+    from_date = match.group("start").strip()
+    to_date = (match.group("end") or "").strip()
+    is_current = to_date.lower() in ("present", "current", "now")
+    start, start_has_month = _to_date(from_date)
+    end, end_has_month = (None, False) if is_current else _to_date(to_date)
+
+    months = _duration_months(duration)
+    if months is None and start and end and start_has_month and end_has_month:
+        months = _months_between(start, end)
+    return DateRange(from_date, to_date, duration, start, end, is_current, months), start_has_month
+
+
+def _duration_months(duration):
+    if not duration:
+        return None
+    match = _DURATION.search(duration)
+    if not match or not (match.group("years") or match.group("months")):
+        return None
+    return int(match.group("years") or 0) * 12 + int(match.group("months") or 0)
+
+
+def parse_date_ranges(texts):
+    """`parse_date_range` over a whole list, e.g. every date line of a batch."""
+    return [parse_date_range(text) for text in texts]
+
+
+def is_date_line(text):
+    """Whether a line of profile text is a date range and/or a duration."""
+    return bool(text and text.strip() and _DATE_LINE.match(text))
+
+
+def normalize_records(records):
+    """Fill the structured date fields of already built experiences/educations in place."""
+    for item in records:
+        text = " - ".join(part for part in (item.from_date, item.to_date) if part)
+        if getattr(item, "duration", None):
+            text += " · " + item.duration
+        for name, value in parse_date_range(text).fields().items():
+            if name not in ("from_date", "to_date"):
+                setattr(item, name, value)
+    return records
@@ -0,0 +1,42 @@
+import time
+
+from selenium.common.exceptions import TimeoutException
+
+
+class DeadlineExceeded(TimeoutException):
+    """Raised when a scrape has used up its `deadline`."""
+
+
+class Deadline(object):
+    """
+    Time budget of one scrape. Waits are capped at what is left of it, and
+    once it has passed the remaining sections are skipped.
+
+        person = Person(url, driver=driver, deadline=8)
+        person.section_status  # {"top_card": "complete", "experience": "timeout", ...}
+    """
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    @classmethod
+    def of(cls, deadline):
+        """A `Deadline` from seconds, an existing `Deadline` (shared budget) or None."""
+        if deadline is None or isinstance(deadline, Deadline):
+            return deadline
+        return cls(deadline)
+
+    def remaining(self):
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self):
+        return time.monotonic() >= self.expires_at
+
+    def timeout(self, default):
+        """`default` seconds, or less if the deadline comes first."""
+        return min(default, self.remaining())
+
+    def check(self):
+        if self.expired():
+            raise DeadlineExceeded(f"deadline of {self.seconds}s exceeded")
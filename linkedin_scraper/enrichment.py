@@ -0,0 +1,97 @@
+from .cache import MemoryCache, SQLiteCache, TieredCache
+from .company import Company
+from .page_state import PageStateError
+from .urls import canonicalize_url, url_kind
+
+MONTH = 30 * 24 * 60 * 60
+
+# Institution field -> Company attribute
+INSTITUTION_FIELDS = {
+    "website": "website",
+    "industry": "industry",
+    "type": "company_type",
+    "headquarters": "headquarters",
+    "company_size": "company_size",
+    "founded": "founded",
+}
+
+
+class CompanyEnricher(object):
+    """
+    Fills the `Institution` fields of experiences and educations by scraping
+    each distinct company once. Company details are memoized in an LRU and,
+    when `path` is given, in a sqlite cache on disk for `ttl` seconds.
+    Only companies whose about page was read completely are cached; the
+    errors of the others are kept in `errors`.
+    """
+
+    def __init__(self, driver, path=None, ttl=MONTH, maxsize=4096, cache=None):
+        self.driver = driver
+        self.ttl = ttl
+        if cache is None:
+            cache = MemoryCache(maxsize=maxsize, ttl=ttl)
+            if path is not None:
+                cache = TieredCache(cache, SQLiteCache(path, ttl=ttl))
+        self.cache = cache
+        # canonical company url -> error of its last failed scrape
+        self.errors = {}
+
+    def company_details(self, linkedin_url):
+        """
+        The details of a company, cached or scraped. A scrape whose about
+        page did not complete is returned as far as it got, but not cached,
+        and its section errors go into `errors`.
+        """
+        key = canonicalize_url(linkedin_url)
+        details = self.cache.get(key, max_age=self.ttl)
+        if details is not None:
+            self.errors.pop(key, None)
+            return details
+        details, errors = self.scrape_company_details(key)
+        if errors:
+            self.errors[key] = errors
+        else:
+            self.errors.pop(key, None)
+            self.cache.set(key, details)
+        return details
+
+    def scrape_company_details(self, linkedin_url):
+        """`(details, errors)` of a company's about page; `errors` is None if it was read completely."""
+        company = Company(
+            linkedin_url, driver=self.driver, get_employees=False, close_on_complete=False, sections=["about"]
+        )
+        details = {field: getattr(company, attribute) for field, attribute in INSTITUTION_FIELDS.items()}
+        if company.section_status.get("about") == "complete":
+            return details, None
+        errors = dict(company.section_errors) or {"about": company.section_status.get("about", "not scraped")}
+        return details, "; ".join(f"{name}: {error}" for name, error in errors.items())
+
+    def enrich(self, people):
+        """
+        Enrich the experiences and educations of `people` in place. A company
+        that cannot be scraped is left out and its error kept in `errors`;
+        pages that stop the whole session (auth wall, checkpoint, rate
+        limit) are raised.
+        """
+        records = {}
+        for person in people:
+            for institution in list(person.experiences) + list(person.educations):
+                if url_kind(institution.linkedin_url) == "company":
+                    records.setdefault(canonicalize_url(institution.linkedin_url), []).append(institution)
+
+        for linkedin_url, institutions in records.items():
+            try:
+                details = self.company_details(linkedin_url)
+            except PageStateError as e:
+                if e.retry:
+                    raise
+                self.errors[linkedin_url] = f"{type(e).__name__}: {e}"
+                continue
+            except Exception as e:
+                self.errors[linkedin_url] = f"{type(e).__name__}: {e}"
+                continue
+            for institution in institutions:
+                for field, value in details.items():
+                    if value is not None:
+                        setattr(institution, field, value)
+        return people
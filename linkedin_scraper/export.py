@@ -0,0 +1,103 @@
+import csv
+import dataclasses
+import gzip
+import io
+import json
+import os
+
+
+def to_dict(result):
+    """Plain dict of a scraped result, record or employee dict."""
+    if isinstance(result, dict):
+        return result
+    if hasattr(result, "to_dict"):
+        return result.to_dict()
+    if dataclasses.is_dataclass(result):
+        return dataclasses.asdict(result)
+    raise TypeError(f"cannot export {type(result).__name__}")
+
+
+def _open(path, compress=None):
+    if compress is None:
+        compress = str(path).endswith(".gz")
+    if compress:
+        return io.TextIOWrapper(gzip.open(path, "ab"), encoding="utf-8", newline="")
+    return open(path, "a", encoding="utf-8", newline="")
+
+
+class _Writer(object):
+    def __init__(self, path, compress=None, flush_every=100):
+        self.path = path
+        self.flush_every = flush_every
+        self.count = 0
+        self._file = _open(path, compress)
+
+    def write(self, result):
+        if result is None:
+            return
+        self._write(to_dict(result))
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self._file.flush()
+
+    def write_many(self, results):
+        for result in results:
+            self.write(result)
+        return self.count
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class NDJSONWriter(_Writer):
+    """
+    Appends one JSON object per line as results arrive; a `.gz` path is
+    gzip compressed.
+
+        with NDJSONWriter("employees.ndjson.gz") as writer:
+            writer.write_many(company.iter_employees())
+    """
+
+    def _write(self, row):
+        self._file.write(json.dumps(row, ensure_ascii=False, default=str))
+        self._file.write("\n")
+
+
+class CSVWriter(_Writer):
+    """
+    Appends results as CSV rows. Columns default to the keys of the first
+    result; nested values (experiences, employees, ...) are JSON encoded.
+    The header is only written to a new file.
+    """
+
+    def __init__(self, path, columns=None, compress=None, flush_every=100):
+        self.columns = columns
+        self._new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._csv = None
+        super().__init__(path, compress=compress, flush_every=flush_every)
+
+    def _write(self, row):
+        if self._csv is None:
+            self.columns = self.columns or list(row)
+            self._csv = csv.DictWriter(self._file, fieldnames=self.columns, extrasaction="ignore")
+            if self._new:
+                self._csv.writeheader()
+        self._csv.writerow({
+            key: json.dumps(value, ensure_ascii=False, default=str) if isinstance(value, (list, dict)) else value
+            for key, value in row.items()
+        })
+
+
+def export(results, path, format=None, **kwargs):
+    """Stream `results` to `path` as "ndjson" or "csv" (guessed from the extension)."""
+    if format is None:
+        format = "csv" if ".csv" in os.path.basename(path) else "ndjson"
+    writer_class = CSVWriter if format == "csv" else NDJSONWriter
+    with writer_class(path, **kwargs) as writer:
+        return writer.write_many(results)
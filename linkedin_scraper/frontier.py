@@ -0,0 +1,130 @@
+import collections
+import hashlib
+import math
+import sqlite3
+import time
+
+from .company import Company
+from .jobs import Job
+from .page_state import AuthWallError, CheckpointError
+from .person import Person
+from .runner import BatchResult
+from .urls import canonicalize_url, url_kind
+
+
+class BloomFilter(object):
+    """A fixed size bloom filter over strings."""
+
+    def __init__(self, capacity=1000000, error_rate=0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, item):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class SeenSet(object):
+    """
+    Exact set of urls kept in sqlite (on disk when `path` is given) with a
+    bloom filter in front, so that the common "never seen" case is answered
+    from memory and only possible duplicates hit the database.
+    """
+
+    def __init__(self, path=":memory:", capacity=1000000, error_rate=0.001):
+        self.bloom = BloomFilter(capacity, error_rate)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("CREATE TABLE IF NOT EXISTS seen (url TEXT PRIMARY KEY)")
+        for (url,) in self.db.execute("SELECT url FROM seen"):
+            self.bloom.add(url)
+
+    def __contains__(self, url):
+        if url not in self.bloom:
+            return False
+        return self.db.execute("SELECT 1 FROM seen WHERE url = ?", (url,)).fetchone() is not None
+
+    def add(self, url):
+        """Add `url`, returning False if it had already been seen."""
+        if url in self:
+            return False
+        self.bloom.add(url)
+        with self.db:
+            self.db.execute("INSERT OR IGNORE INTO seen (url) VALUES (?)", (url,))
+        return True
+
+    def close(self):
+        self.db.close()
+
+
+class Frontier(object):
+    """Breadth first queue of canonical person, company and job urls."""
+
+    def __init__(self, seeds=(), seen=None, max_depth=1):
+        self.seen = seen if seen is not None else SeenSet()
+        self.max_depth = max_depth
+        self._queue = collections.deque()
+        for url in seeds:
+            self.push(url, depth=0)
+
+    def push(self, url, depth=0):
+        """Queue `url` unless it is too deep, not a known entity or already seen."""
+        if not url or depth > self.max_depth:
+            return False
+        kind = url_kind(url)
+        if kind is None:
+            return False
+        url = canonicalize_url(url)
+        if not self.seen.add(url):
+            return False
+        self._queue.append((url, kind, depth))
+        return True
+
+    def pop(self):
+        return self._queue.popleft()
+
+    def __len__(self):
+        return len(self._queue)
+
+
+def crawl(frontier, driver, get_employees=True):
+    """
+    Scrape everything in `frontier` with `driver`, yielding a `BatchResult`
+    per url. Companies expand to their employees and people expand to the
+    companies in their experiences, until `frontier.max_depth`. A url that
+    fails is yielded with its error; after an auth wall or a checkpoint the
+    crawl stops, since every other url would fail the same way.
+    """
+    while frontier:
+        url, kind, depth = frontier.pop()
+        start = time.time()
+        try:
+            if kind == "person":
+                result = Person(url, driver=driver, close_on_complete=False, connections=False)
+                for experience in result.experiences:
+                    frontier.push(experience.linkedin_url, depth + 1)
+            elif kind == "company":
+                expand = get_employees and depth < frontier.max_depth
+                result = Company(url, driver=driver, get_employees=expand, close_on_complete=False)
+                for employee in result.employees if expand else []:
+                    if employee:
+                        frontier.push(employee.get("linkedin_url"), depth + 1)
+            else:
+                result = Job(url, driver=driver, close_on_complete=False)
+                frontier.push(result.company_linkedin_url, depth + 1)
+        except (AuthWallError, CheckpointError) as e:
+            yield BatchResult(kind, url, None, f"{type(e).__name__}: {e}", time.time() - start)
+            return
+        except Exception as e:
+            yield BatchResult(kind, url, None, f"{type(e).__name__}: {e}", time.time() - start)
+            continue
+        yield BatchResult(kind, url, result, None, time.time() - start)
@@ -0,0 +1,66 @@
+import sqlite3
+import threading
+import time
+
+
+class JobIndex(object):
+    """
+    Job ids seen by earlier searches, with when each was first and last
+    seen, in a sqlite file. `JobSearch.watch` uses it to stop paging at the
+    first page without new postings and to hydrate only the new ones.
+    """
+
+    def __init__(self, path="linkedin_scraper_jobs.db"):
+        self._lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute(
+            """CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                linkedin_url TEXT,
+                search_term TEXT,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL
+            )"""
+        )
+
+    def __contains__(self, job_id):
+        with self._lock:
+            return self.db.execute("SELECT 1 FROM jobs WHERE job_id = ?", (job_id,)).fetchone() is not None
+
+    def __len__(self):
+        with self._lock:
+            return self.db.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def known(self, job_ids):
+        """The subset of `job_ids` already in the index."""
+        job_ids = list(set(job_ids))
+        if not job_ids:
+            return set()
+        placeholders = ",".join("?" * len(job_ids))
+        with self._lock:
+            rows = self.db.execute(f"SELECT job_id FROM jobs WHERE job_id IN ({placeholders})", job_ids)
+            return {job_id for (job_id,) in rows}
+
+    def record(self, jobs, search_term=None, seen_at=None):
+        """Mark `(job_id, linkedin_url)` pairs as seen now, adding the new ones."""
+        seen_at = seen_at or time.time()
+        with self._lock, self.db:
+            self.db.executemany(
+                """INSERT INTO jobs (job_id, linkedin_url, search_term, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (job_id) DO UPDATE SET last_seen = excluded.last_seen""",
+                [(job_id, linkedin_url, search_term, seen_at, seen_at) for job_id, linkedin_url in jobs],
+            )
+
+    def get(self, job_id):
+        """`{"job_id", "linkedin_url", "search_term", "first_seen", "last_seen"}` of a job id, or None."""
+        with self._lock:
+            row = self.db.execute(
+                "SELECT job_id, linkedin_url, search_term, first_seen, last_seen FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(("job_id", "linkedin_url", "search_term", "first_seen", "last_seen"), row))
+
+    def close(self):
+        self.db.close()
@@ -4,17 +4,30 @@ from time import sleep
 import urllib.parse
 
 from .objects import Scraper
+from .page_state import PageStateError
 from . import constants as c
 from .jobs import Job
+from .scheduler import page_boundary
+from .urls import canonicalize_url, job_id_from_url
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
+
+_CLICK = """
+arguments[0].scrollIntoView({block: "center"});
+arguments[0].click();
+"""
 
 
 class JobSearch(Scraper):
     AREAS = ["recommended_jobs", None, "still_hiring", "more_jobs"]
+    PAGE_SIZE = 25
+    DETAIL_PANE = "jobs-search__job-details"
+    # seconds the detail pane gets to show a clicked job, until a timeout is learned
+    PANE_TIMEOUT = 10
 
     def __init__(self, driver, base_url="https://www.linkedin.com/jobs/", close_on_complete=False, scrape=True, scrape_recommended_jobs=True):
         super().__init__()
@@ -36,15 +49,15 @@ class JobSearch(Scraper):
         job_div = self.wait_for_element_to_load(name="job-card-list__title", base=base_element)
         job_title = job_div.text.strip()
         linkedin_url = job_div.get_attribute("href")
-        company = base_element.find_element_by_class_name("artdeco-entity-lockup__subtitle").text
-        location = base_element.find_element_by_class_name("job-card-container__metadata-wrapper").text
+        company = base_element.find_element(By.CLASS_NAME, "artdeco-entity-lockup__subtitle").text
+        location = base_element.find_element(By.CLASS_NAME, "job-card-container__metadata-wrapper").text
         job = Job(linkedin_url=linkedin_url, job_title=job_title, company=company, location=location, scrape=False, driver=self.driver)
         return job
 
 
     def scrape_logged_in(self, close_on_complete=True, scrape_recommended_jobs=True):
         driver = self.driver
-        driver.get(self.base_url)
+        self._get(self.base_url)
         if scrape_recommended_jobs:
             self.focus()
             sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
@@ -55,16 +68,86 @@ class JobSearch(Scraper):
                 if not area_name:
                     continue
                 area_results = []
-                for job_posting in area.find_elements_by_class_name("jobs-job-board-list__item"):
+                for job_posting in area.find_elements(By.CLASS_NAME, "jobs-job-board-list__item"):
                     job = self.scrape_job_card(job_posting)
                     area_results.append(job)
                 setattr(self, area_name, area_results)
         return
 
 
-    def search(self, search_term: str) -> List[Job]:
+    def search(self, search_term: str, pages=1, hydrate=False) -> List[Job]:
+        """Jobs on the first `pages` result pages for `search_term`, with their details if `hydrate`."""
+        job_results = []
+        for page in range(pages):
+            if page:
+                page_boundary(self.driver)
+                try:
+                    jobs = self.search_page(search_term, start=page * self.PAGE_SIZE, hydrate=hydrate)
+                except TimeoutException:
+                    break
+            else:
+                jobs = self.search_page(search_term, hydrate=hydrate)
+            if not jobs:
+                break
+            job_results.extend(jobs)
+        return job_results
+
+    def search_page(self, search_term: str, start=0, hydrate=False) -> List[Job]:
+        job_results, job_cards = self._load_search_page(search_term, start)
+        if hydrate:
+            self.hydrate(job_results, job_cards)
+        return job_results
+
+    def watch(self, search_term: str, index, max_pages=10, hydrate=True) -> List[Job]:
+        """
+        Postings for `search_term` that are not in `index` (a `JobIndex`),
+        hydrated if `hydrate`. Paging stops at the first page with nothing
+        new, so a poll costs about as much as there are new postings. Every
+        listed job id is marked as seen, except new postings that could not
+        be hydrated, which are tried again on the next poll.
+        """
+        new_jobs = []
+        listed = set()
+        for page in range(max_pages):
+            if page:
+                page_boundary(self.driver)
+                try:
+                    jobs, job_cards = self._load_search_page(search_term, start=page * self.PAGE_SIZE)
+                except TimeoutException:
+                    break
+            else:
+                jobs, job_cards = self._load_search_page(search_term)
+            if not jobs:
+                break
+
+            ids = [job_id_from_url(job.linkedin_url) for job in jobs]
+            known = index.known(job_id for job_id in ids if job_id)
+            fresh = []
+            for job, job_card, job_id in zip(jobs, job_cards, ids):
+                # cards without an id cannot be told apart between polls
+                if job_id is None or job_id in known or job_id in listed:
+                    continue
+                listed.add(job_id)
+                fresh.append((job, job_card, job_id))
+            if hydrate and fresh:
+                self.hydrate([job for job, _, _ in fresh], [job_card for _, job_card, _ in fresh])
+
+            unhydrated = {job_id for job, _, job_id in fresh if hydrate and job.section_status.get("details") != "complete"}
+            index.record(
+                [(job_id, canonicalize_url(job.linkedin_url)) for job, job_id in zip(jobs, ids) if job_id and job_id not in unhydrated],
+                search_term,
+            )
+            new_jobs.extend(job for job, _, _ in fresh)
+            if not fresh:
+                break
+        return new_jobs
+
+    def _load_search_page(self, search_term, start=0):
+        """The `Job` stubs of one result page and the cards they were read from."""
         url = os.path.join(self.base_url, "search") + f"?keywords={urllib.parse.quote(search_term)}&refresh=true"
-        self.driver.get(url)
+        if start:
+            url += f"&start={start}"
+        self._get(url)
         self.scroll_to_bottom()
         self.focus()
         sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
@@ -85,7 +168,68 @@ class JobSearch(Scraper):
         sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
 
         job_results = []
-        for job_card in self.wait_for_all_elements_to_load(name="job-card-list", base=job_listing):
+        job_cards = self.wait_for_all_elements_to_load(name="job-card-list", base=job_listing)
+        for job_card in job_cards:
             job = self.scrape_job_card(job_card)
             job_results.append(job)
-        return job_results
+        return job_results, job_cards
+
+    def _pane_shows(self, job, job_id):
+        """Wait condition: the detail pane shows `job_id`, returning its snapshot."""
+
+        def condition(locator):
+            def shows(driver):
+                try:
+                    data = job.snapshot(driver.find_element(*locator))
+                except StaleElementReferenceException:
+                    return False
+                shown = job_id_from_url(data["job_url"]) or job_id_from_url(driver.current_url)
+                return data if shown == job_id and data["job_title"] and data["job_description"] is not None else False
+
+            return shows
+
+        return condition
+
+    def hydrate(self, jobs, job_cards):
+        """
+        Fill in the details of `jobs` from the detail pane of the search page
+        they were listed on, clicking their `job_cards` one by one instead of
+        loading every posting. Jobs the pane does not show are scraped from
+        their own page afterwards; those are returned. Each job's
+        `section_status["details"]` tells whether it got its details, with
+        the error in `section_errors`. An auth wall, checkpoint or rate
+        limit stops the hydration.
+        """
+        fallback = []
+        for job, job_card in zip(jobs, job_cards):
+            job_id = job_id_from_url(job.linkedin_url)
+            if job_id is None:
+                fallback.append(job)
+                continue
+            try:
+                link = job_card.find_element(By.CLASS_NAME, "job-card-list__title")
+                self.driver.execute_script(_CLICK, link)
+                data = self._wait_until(
+                    self._pane_shows(job, job_id), By.CLASS_NAME, self.DETAIL_PANE, timeout=self.PANE_TIMEOUT
+                )
+            except WebDriverException:
+                fallback.append(job)
+                continue
+            job.apply_snapshot(data)
+            job.section_status["details"] = "complete"
+
+        # these leave the search page, so they come last
+        for job in fallback:
+            if not job.linkedin_url:
+                job.section_status["details"] = "failed"
+                job.section_errors["details"] = "no job url on the card"
+                continue
+            try:
+                job._run_section("details", job.scrape, False)
+            except PageStateError as e:
+                # e.g. a removed posting; the other jobs can still be scraped
+                if e.retry:
+                    raise
+                job.section_status["details"] = "failed"
+                job.section_errors["details"] = f"{type(e).__name__}: {e}"
+        return fallback
@@ -1,10 +1,34 @@
 from selenium.common.exceptions import TimeoutException
 
 from .objects import Scraper
-from . import constants as c
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+
+# every field of a job detail page (or of the detail pane of a job search,
+# passed as arguments[0]) in one round trip; textContent includes the part of
+# the description hidden behind "see more", so nothing has to be clicked
+JOB_SNAPSHOT = """
+var root = arguments[0] || document;
+function first(name) { return root.querySelector("." + name); }
+function text(elem) { return elem ? elem.textContent.replace(/\\s+/g, " ").trim() : null; }
+var title = first("job-details-jobs-unified-top-card__job-title");
+var titleLink = title ? title.querySelector("a") || title.closest("a") : null;
+var company = first("job-details-jobs-unified-top-card__company-name");
+var link = company ? company.querySelector("a") : null;
+var primary = first("job-details-jobs-unified-top-card__primary-description-container");
+var spans = primary ? Array.prototype.map.call(primary.querySelectorAll("span"), function (span) {
+    return span.innerText.trim();
+}).filter(Boolean) : [];
+var description = first("jobs-description__content") || first("jobs-description");
+return {
+    job_title: text(title),
+    job_url: titleLink ? titleLink.href : null,
+    company: text(company),
+    company_linkedin_url: link ? link.href : null,
+    primary_descriptions: spans,
+    applicant_count: text(first("jobs-unified-top-card__applicant-count")),
+    job_description: description ? description.textContent.replace(/[ \\t]+/g, " ").replace(/\\s*\\n\\s*/g, "\\n").trim() : null,
+    benefits: text(first("jobs-unified-description__salary-main-rail-card"))
+};
+"""
 
 
 class Job(Scraper):
@@ -23,6 +47,7 @@ class Job(Scraper):
         driver=None,
         close_on_complete=True,
         scrape=True,
+        cache=None,
     ):
         super().__init__()
         self.linkedin_url = linkedin_url
@@ -35,8 +60,12 @@ class Job(Scraper):
         self.applicant_count = applicant_count
         self.job_description = job_description
         self.benefits = benefits
+        self.section_status = {}
+        self.section_errors = {}
 
-        if scrape:
+        if scrape and cache is not None:
+            self._read_through(cache, "job", lambda: self.scrape(close_on_complete), close=driver.close if close_on_complete else None)
+        elif scrape:
             self.scrape(close_on_complete)
 
     def __repr__(self):
@@ -58,36 +87,42 @@ class Job(Scraper):
             "posted_date": self.posted_date,
             "applicant_count": self.applicant_count,
             "job_description": self.job_description,
-            "benefits": self.benefits
+            "benefits": self.benefits,
+            "section_status": dict(getattr(self, "section_status", {})),
+            "section_errors": dict(getattr(self, "section_errors", {})),
         }
 
 
+    def snapshot(self, root=None):
+        """All detail fields of the page, or of the `root` element, from one `execute_script` call."""
+        return self.driver.execute_script(JOB_SNAPSHOT, root)
+
+    def apply_snapshot(self, data):
+        self.job_title = data["job_title"]
+        self.company = data["company"]
+        self.company_linkedin_url = data["company_linkedin_url"]
+        texts = data["primary_descriptions"]
+        self.location = texts[0] if texts else None
+        self.posted_date = texts[3] if len(texts) > 3 else None
+        self.applicant_count = data["applicant_count"] or 0
+        self.job_description = data["job_description"]
+        self.benefits = data["benefits"]
+
     def scrape_logged_in(self, close_on_complete=True):
         driver = self.driver
-        
-        driver.get(self.linkedin_url)
+
+        self._get(self.linkedin_url)
         self.focus()
-        self.job_title = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__job-title").text.strip()
-        self.company = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__company-name").text.strip()
-        self.company_linkedin_url = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__company-name").find_element(By.TAG_NAME,"a").get_attribute("href")
-        primary_descriptions = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__primary-description-container").find_elements(By.TAG_NAME, "span")
-        texts = [span.text for span in primary_descriptions if span.text.strip() != ""]
-        self.location = texts[0]
-        self.posted_date = texts[3]
-        
-        try:
-            self.applicant_count = self.wait_for_element_to_load(name="jobs-unified-top-card__applicant-count").text.strip()
-        except TimeoutException:
-            self.applicant_count = 0
-        job_description_elem = self.wait_for_element_to_load(name="jobs-description")
-        self.mouse_click(job_description_elem.find_element(By.TAG_NAME, "button"))
-        job_description_elem = self.wait_for_element_to_load(name="jobs-description")
-        job_description_elem.find_element(By.TAG_NAME, "button").click()
-        self.job_description = job_description_elem.text.strip()
-        try:
-            self.benefits = self.wait_for_element_to_load(name="jobs-unified-description__salary-main-rail-card").text.strip()
-        except TimeoutException:
-            self.benefits = None
+        # the top card is rendered first, everything else is read in one go
+        self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__job-title")
+        data = self.snapshot()
+        if data["job_description"] is None:
+            try:
+                self.wait_for_element_to_load(name="jobs-description")
+                data = self.snapshot()
+            except TimeoutException:
+                pass
+        self.apply_snapshot(data)
 
         if close_on_complete:
             driver.close()
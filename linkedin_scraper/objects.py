@@ -1,24 +1,51 @@
-from dataclasses import dataclass
-from time import sleep
+import random
+import sys
+from dataclasses import asdict, dataclass, fields
+from datetime import date
+from time import monotonic, sleep
 
 from selenium.webdriver import Chrome
 
 from . import constants as c
+from .pacing import default_pacer, navigate
+from .page_state import PageStateError
+from .timeouts import default_timeouts
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
 
+# records are held by the million, so drop the per-instance __dict__ where supported
+record = dataclass(slots=True) if sys.version_info >= (3, 10) else dataclass
 
-@dataclass
+# errors of a page that was still rendering, worth running the section again for
+TRANSIENT_ERRORS = (StaleElementReferenceException, TimeoutException, ElementClickInterceptedException)
+
+# repetitive values (company names, locations, "Present", degrees, ...)
+INTERNED_FIELDS = (
+    "institution_name", "linkedin_url", "industry", "type", "headquarters", "company_size",
+    "from_date", "to_date", "duration", "location", "position_title", "degree", "occupation",
+    "designation",
+)
+
+
+@record
 class Contact:
     name: str = None
     occupation: str = None
     url: str = None
 
+    def to_dict(self):
+        return asdict(self)
 
-@dataclass
+
+@record
 class Institution:
     institution_name: str = None
     linkedin_url: str = None
@@ -29,8 +56,11 @@ class Institution:
     company_size: int = None
     founded: int = None
 
+    def to_dict(self):
+        return asdict(self)
 
-@dataclass
+
+@record
 class Experience(Institution):
     from_date: str = None
     to_date: str = None
@@ -38,25 +68,110 @@ class Experience(Institution):
     position_title: str = None
     duration: str = None
     location: str = None
+    start_date: date = None
+    end_date: date = None
+    is_current: bool = None
+    duration_months: int = None
 
 
-@dataclass
+@record
 class Education(Institution):
     from_date: str = None
     to_date: str = None
     description: str = None
     degree: str = None
+    start_date: date = None
+    end_date: date = None
+    is_current: bool = None
+    duration_months: int = None
 
 
-@dataclass
+@record
 class Interest(Institution):
-    title = None
+    title: str = None
 
 
-@dataclass
+@record
 class Accomplishment(Institution):
-    category = None
-    title = None
+    category: str = None
+    title: str = None
+
+
+def intern_records(records, fields=INTERNED_FIELDS):
+    """Intern the repetitive string fields of `records` in place so equal values share memory."""
+    for item in records:
+        for name in fields:
+            value = getattr(item, name, None)
+            if type(value) is str:
+                setattr(item, name, sys.intern(value))
+    return records
+
+
+class ColumnarRecords(object):
+    """
+    Column oriented container for many records of one type, e.g. a batch's
+    experiences or the employee dicts of many companies: one list per field
+    instead of one object per record, with `intern` fields stored as
+    interned strings. Indexing and iteration rebuild records (or dicts) on
+    demand; a slice is a `ColumnarRecords` of its own.
+    """
+
+    def __init__(self, record_class=None, columns=None, intern=INTERNED_FIELDS):
+        if columns is None:
+            columns = [f.name for f in fields(record_class)]
+        self.record_class = record_class
+        self.columns = {name: [] for name in columns}
+        self._interned = [name for name in columns if name in intern]
+
+    @classmethod
+    def from_records(cls, records, record_class=None, **kwargs):
+        records = [item for item in records if item is not None]
+        if record_class is None:
+            if not records:
+                raise ValueError("record_class is required for an empty table")
+            record_class = type(records[0])
+        table = cls(record_class, **kwargs)
+        table.extend(records)
+        return table
+
+    @classmethod
+    def from_dicts(cls, dicts, columns, **kwargs):
+        table = cls(columns=columns, **kwargs)
+        table.extend(dicts)
+        return table
+
+    def append(self, item):
+        get = item.get if isinstance(item, dict) else lambda name: getattr(item, name, None)
+        for name, column in self.columns.items():
+            column.append(get(name))
+        for name in self._interned:
+            value = self.columns[name][-1]
+            if type(value) is str:
+                self.columns[name][-1] = sys.intern(value)
+
+    def extend(self, items):
+        for item in items:
+            if item is not None:
+                self.append(item)
+
+    def column(self, name):
+        return self.columns[name]
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()), ()))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            table = ColumnarRecords(self.record_class, columns=list(self.columns), intern=())
+            table.columns = {name: column[index] for name, column in self.columns.items()}
+            table._interned = list(self._interned)
+            return table
+        values = {name: column[index] for name, column in self.columns.items()}
+        return self.record_class(**values) if self.record_class else values
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
 
 
 @dataclass
@@ -64,11 +179,138 @@ class Scraper:
     driver: Chrome = None
     WAIT_FOR_ELEMENT_TIMEOUT = 1
     TOP_CARD = "pv-top-card"
+    from_cache = False
+    deadline = None
+    # sections to scrape (None for all), the others are copied from `previous`
+    sections = None
+    # section name -> attributes it fills
+    SECTION_FIELDS = {}
+    section_retries = 2
+    section_backoff = 0.5
+    # learned per-selector wait timeouts; None for the process wide `default_timeouts()`
+    timeouts = None
+    # navigation pacing; None for the process wide `default_pacer()`
+    pacer = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("driver", None)
+        return state
+
+    def detach(self):
+        """Drop the driver so the result can be pickled or outlive the browser."""
+        self.driver = None
+        return self
+
+    def _read_through(self, cache, kind, scrape, close=None):
+        """
+        Fill this object from `cache`, calling `scrape()` only on a miss.
+        On a hit the driver is left alone, or shut with `close` if given.
+        """
+        result = cache.fetch(kind, self.linkedin_url, lambda: (scrape(), self)[1])
+        self.from_cache = result is not self
+        if self.from_cache:
+            self.__dict__.update(result.__getstate__())
+            if close is not None:
+                close()
+
+    def _get(self, url, driver=None, check=True):
+        """
+        Navigate to `url` at the pace of `pacer` and classify the page right
+        away, raising `AuthWallError`, `CheckpointError`, `NotFoundError` or
+        `RateLimitedError` instead of timing out on a page that will never
+        have the expected elements.
+        """
+        pacer = self.pacer if self.pacer is not None else default_pacer()
+        return navigate(driver or self.driver, url, pacer, check=check, deadline=self.deadline)
 
     @staticmethod
     def wait(duration):
         sleep(int(duration))
 
+    def _timeout(self, default):
+        """`default` seconds, capped by what is left of `deadline`."""
+        return default if self.deadline is None else self.deadline.timeout(default)
+
+    def _check_deadline(self):
+        if self.deadline is not None:
+            self.deadline.check()
+
+    def _section_snapshot(self, name):
+        return {
+            field: list(value) if isinstance(value, list) else value
+            for field, value in ((field, getattr(self, field)) for field in self.SECTION_FIELDS.get(name, ()) if hasattr(self, field))
+        }
+
+    def _restore(self, snapshot):
+        for field, value in snapshot.items():
+            setattr(self, field, list(value) if isinstance(value, list) else value)
+
+    @staticmethod
+    def _completed(previous, name):
+        """Whether `previous` finished its `name` section, so that it can be reused as is."""
+        return getattr(previous, "section_status", {}).get(name) == "complete"
+
+    def _reuse_sections(self, previous):
+        """Copy the sections left out of `sections` from a previous scrape of the same entity."""
+        if self.sections is None or previous is None:
+            return
+        for name in self.SECTION_FIELDS:
+            if name in self.sections:
+                continue
+            self._restore(previous._section_snapshot(name))
+            if name in getattr(previous, "section_status", {}):
+                self.section_status[name] = previous.section_status[name]
+
+    def _run_section(self, name, fn, *args):
+        """
+        Run one section of a scrape and record its outcome in `section_status`:
+        "complete", "failed" (the error is kept in `section_errors`), "timeout"
+        or "skipped" (the deadline had passed). Transient errors are retried
+        `section_retries` times with jittered exponential backoff, starting
+        from the section's state before the first attempt. `PageStateError`
+        aborts the whole scrape.
+        """
+        status = self.__dict__.setdefault("section_status", {})
+        errors = self.__dict__.setdefault("section_errors", {})
+        if self.sections is not None and name not in self.sections:
+            return None
+        snapshot = self._section_snapshot(name)
+        attempt = 0
+        while True:
+            if self.deadline is not None and self.deadline.expired():
+                status[name] = "timeout" if attempt else "skipped"
+                return None
+            try:
+                result = fn(*args)
+            except PageStateError:
+                raise
+            except Exception as e:
+                errors[name] = f"{type(e).__name__}: {getattr(e, 'msg', None) or e}"
+                if self.deadline is not None and self.deadline.expired():
+                    status[name] = "timeout"
+                    return None
+                if isinstance(e, TRANSIENT_ERRORS) and attempt < self.section_retries:
+                    attempt += 1
+                    sleep(self._timeout(random.uniform(0, self.section_backoff * 2 ** attempt)))
+                    self._restore(snapshot)
+                    continue
+                status[name] = "failed"
+                return None
+            status[name] = "complete"
+            errors.pop(name, None)
+            return result
+
+    @property
+    def complete(self):
+        """Whether every section of the last scrape finished within the deadline."""
+        return all(status == "complete" for status in getattr(self, "section_status", {}).values())
+
+    @property
+    def failed_sections(self):
+        """Sections of the last scrape that did not complete, to scrape again with `sections=`."""
+        return [name for name, status in getattr(self, "section_status", {}).items() if status != "complete"]
+
     def focus(self):
         try:
             self.driver.execute_script('alert("Focus window")')
@@ -80,39 +322,39 @@ class Scraper:
         action = webdriver.ActionChains(self.driver)
         action.move_to_element(elem).perform()
 
-    def wait_for_element_to_load(self, by=By.CLASS_NAME, name="pv-top-card", base=None):
+    def _wait_until(self, condition, by, name, base=None, timeout=None):
+        """
+        Wait for `condition((by, name))` with the timeout learned for this
+        selector (`timeout`, or WAIT_FOR_ELEMENT_TIMEOUT, until there are
+        enough observations), capped by the deadline. Timed out waits are
+        counted apart from the latencies.
+        """
         base = base or self.driver
-        return WebDriverWait(base, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
-            EC.presence_of_element_located(
-                (
-                    by,
-                    name
-                )
-            )
-        )
+        timeouts = self.timeouts if self.timeouts is not None else default_timeouts()
+        key = f"{type(self).__name__}:{by}={name}"
+        timeout = timeouts.timeout(key, self.WAIT_FOR_ELEMENT_TIMEOUT if timeout is None else timeout)
+        capped = self._timeout(timeout)
+        start = monotonic()
+        try:
+            result = WebDriverWait(base, capped).until(condition((by, name)))
+        except TimeoutException:
+            # a wait cut short by the deadline says nothing about the selector
+            if capped >= timeout:
+                timeouts.observe_timeout(key)
+            raise
+        timeouts.observe(key, monotonic() - start, timeout)
+        return result
 
-    def wait_for_all_elements_to_load(self, by=By.CLASS_NAME, name="pv-top-card", base=None):
-        base = base or self.driver
-        return WebDriverWait(base, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
-            EC.presence_of_all_elements_located(
-                (
-                    by,
-                    name
-                )
-            )
-        )
+    def wait_for_element_to_load(self, by=By.CLASS_NAME, name="pv-top-card", base=None, timeout=None):
+        return self._wait_until(EC.presence_of_element_located, by, name, base=base, timeout=timeout)
+
+    def wait_for_all_elements_to_load(self, by=By.CLASS_NAME, name="pv-top-card", base=None, timeout=None):
+        return self._wait_until(EC.presence_of_all_elements_located, by, name, base=base, timeout=timeout)
 
 
     def is_signed_in(self):
         try:
-            WebDriverWait(self.driver, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
-                EC.presence_of_element_located(
-                    (
-                        By.CLASS_NAME,
-                        c.VERIFY_LOGIN_ID,
-                    )
-                )
-            )
+            self.wait_for_element_to_load(name=c.VERIFY_LOGIN_ID)
 
             self.driver.find_element(By.CLASS_NAME, c.VERIFY_LOGIN_ID)
             return True
@@ -0,0 +1,195 @@
+import os
+import sqlite3
+import threading
+import time
+import urllib.parse
+
+from selenium.common.exceptions import TimeoutException
+
+from .deadline import DeadlineExceeded
+from .page_state import RateLimitedError, check_page
+from .urls import url_kind
+
+# navigations per second for each page type, fleet-wide per host
+DEFAULT_RATES = {
+    "person": 0.5,
+    "company": 0.5,
+    "job": 1.0,
+    "other": 1.0,
+}
+
+
+def pacing_key(url):
+    """`host:page type` of a url, e.g. "www.linkedin.com:person"."""
+    host = urllib.parse.urlsplit(url or "").netloc.lower()
+    return f"{host}:{url_kind(url) or 'other'}"
+
+
+class Pacer(object):
+    """
+    Token bucket per host and page type that every navigation takes a token
+    from, so concurrent drivers add up to a steady rate instead of bursts.
+    Callers reserve their token and sleep until it is due, so waiting
+    drivers are served in order.
+
+    After a rate-limited page the bucket's rate is multiplied by `backoff`
+    and no token is handed out for `cooldown` seconds; the rate then
+    recovers by `recovery` (a fraction of the full rate) per second.
+
+    With a `path` the buckets live in a sqlite file that every process
+    pacing against it shares; otherwise they are shared by the threads of
+    this process. Scrapers use `default_pacer()` unless `Scraper.pacer`
+    is set.
+    """
+
+    def __init__(self, path=None, rates=None, burst=3, backoff=0.5, min_factor=0.05, cooldown=60, recovery=0.002):
+        self.path = path
+        self.rates = dict(DEFAULT_RATES, **(rates or {}))
+        self.burst = burst
+        self.backoff = backoff
+        self.min_factor = min_factor
+        self.cooldown = cooldown
+        self.recovery = recovery
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self.db = None
+        if path:
+            self.db = sqlite3.connect(path, timeout=60, isolation_level=None, check_same_thread=False)
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute(
+                """CREATE TABLE IF NOT EXISTS buckets (
+                    key TEXT PRIMARY KEY,
+                    tokens REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    factor REAL NOT NULL,
+                    blocked_until REAL NOT NULL
+                )"""
+            )
+
+    def _update(self, key, update):
+        """Apply `update(tokens, updated_at, factor, blocked_until, now)` to a bucket atomically."""
+        with self._lock:
+            now = time.time()
+            if self.db is None:
+                state = self._buckets.get(key, (self.burst, now, 1.0, 0.0))
+                state, result = update(*state, now)
+                self._buckets[key] = state
+                return result
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.db.execute(
+                    "SELECT tokens, updated_at, factor, blocked_until FROM buckets WHERE key = ?", (key,)
+                ).fetchone()
+                state, result = update(*(row or (self.burst, now, 1.0, 0.0)), now)
+                self.db.execute("INSERT OR REPLACE INTO buckets VALUES (?, ?, ?, ?, ?)", (key,) + state)
+                self.db.execute("COMMIT")
+            except BaseException:
+                self.db.execute("ROLLBACK")
+                raise
+            return result
+
+    def _rate(self, key):
+        return self.rates.get(key.rsplit(":", 1)[-1], self.rates["other"])
+
+    def reserve(self, url, max_wait=None):
+        """
+        Take a token for navigating to `url` and return the seconds to wait
+        before using it. If that is more than `max_wait` no token is taken.
+        """
+        key = pacing_key(url)
+        rate = self._rate(key)
+
+        def update(tokens, updated_at, factor, blocked_until, now):
+            # no tokens accrue while the bucket is blocked
+            elapsed = max(0.0, now - max(updated_at, blocked_until))
+            new_factor = min(1.0, factor + elapsed * self.recovery)
+            new_tokens = min(self.burst, tokens + elapsed * rate * new_factor) - 1
+            start = max(now, blocked_until)
+            wait = start - now + (max(0.0, -new_tokens) / (rate * new_factor))
+            if max_wait is not None and wait > max_wait:
+                return (tokens, updated_at, factor, blocked_until), wait
+            return (new_tokens, now, new_factor, blocked_until), wait
+
+        return self._update(key, update)
+
+    def acquire(self, url, deadline=None):
+        """
+        Wait for a token for `url`; returns the seconds waited. Raises
+        `DeadlineExceeded` without waiting if the token is not due before
+        `deadline`.
+        """
+        max_wait = deadline.remaining() if deadline is not None else None
+        wait = self.reserve(url, max_wait)
+        if max_wait is not None and wait > max_wait:
+            raise DeadlineExceeded(f"next navigation to {pacing_key(url)} is {wait:.1f}s away, past the deadline")
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def throttled(self, url):
+        """Slow the bucket of `url` down after the site reported rate limiting."""
+
+        def update(tokens, updated_at, factor, blocked_until, now):
+            factor = max(self.min_factor, factor * self.backoff)
+            return (min(tokens, 0.0), now, factor, max(blocked_until, now + self.cooldown)), factor
+
+        return self._update(pacing_key(url), update)
+
+    def close(self):
+        if self.db is not None:
+            self.db.close()
+
+
+_default = None
+_default_pid = None
+_default_lock = threading.Lock()
+
+
+def default_pacer():
+    """
+    The `Pacer` shared by the scrapers of this process, built on first use
+    (and again in a forked child) from LINKEDIN_SCRAPER_PACING, so a worker
+    process picks up a file set after this module was imported.
+    """
+    global _default, _default_pid
+    with _default_lock:
+        if _default is None or _default_pid != os.getpid():
+            _default = Pacer(os.getenv("LINKEDIN_SCRAPER_PACING"))
+            _default_pid = os.getpid()
+        return _default
+
+
+def _get_within(driver, url, deadline):
+    """`driver.get(url)` with the page load timeout cut to what is left of `deadline`."""
+    deadline.check()
+    page_load = driver.timeouts.page_load
+    driver.set_page_load_timeout(deadline.remaining())
+    try:
+        driver.get(url)
+    except TimeoutException as e:
+        raise DeadlineExceeded(f"deadline of {deadline.seconds}s exceeded loading {url}") from e
+    finally:
+        driver.set_page_load_timeout(page_load)
+
+
+def navigate(driver, url, pacer=None, check=True, deadline=None):
+    """
+    `driver.get(url)` paced by `pacer`, then `check_page` unless `check` is
+    False. A rate-limited page slows the pacer down before the error is
+    raised. `DeadlineExceeded` is raised instead of waiting past `deadline`,
+    for the pacer as well as for a slow page load.
+    """
+    if pacer is not None:
+        pacer.acquire(url, deadline)
+    if deadline is None:
+        driver.get(url)
+    else:
+        _get_within(driver, url, deadline)
+    if not check:
+        return None
+    try:
+        return check_page(driver, url)
+    except RateLimitedError:
+        if pacer is not None:
+            pacer.throttled(url)
+        raise
@@ -0,0 +1,139 @@
+import urllib.parse
+
+OK = "ok"
+AUTH_WALL = "auth_wall"
+CHECKPOINT = "checkpoint"
+NOT_FOUND = "not_found"
+RATE_LIMITED = "rate_limited"
+
+# path prefix -> state, checked against the url the browser ended up on
+URL_STATES = (
+    ("/checkpoint/", CHECKPOINT),
+    ("/challenge", CHECKPOINT),
+    ("/authwall", AUTH_WALL),
+    ("/login", AUTH_WALL),
+    ("/uas/login", AUTH_WALL),
+    ("/signup", AUTH_WALL),
+    ("/404", NOT_FOUND),
+    ("/in/unavailable", NOT_FOUND),
+    ("/company/unavailable", NOT_FOUND),
+    ("/429", RATE_LIMITED),
+)
+
+# css selector -> state, for the containers of pages served without a redirect
+DOM_STATES = (
+    ("#captcha-internal", CHECKPOINT),
+    ("iframe[src*='captcha']", CHECKPOINT),
+    ("form[action*='/checkpoint/']", CHECKPOINT),
+    (".authwall-join-form", AUTH_WALL),
+    ("form.join-form", AUTH_WALL),
+    (".not-found__container", NOT_FOUND),
+)
+
+# lower cased marker -> state; a title must be the marker (or start with it
+# followed by " |"), while the text of the page is only read when it has no
+# <main> element, so a job or profile that mentions a marker is not mistaken
+# for the error page itself
+TEXT_STATES = (
+    ("too many requests", RATE_LIMITED),
+    ("http error 429", RATE_LIMITED),
+    ("security verification", CHECKPOINT),
+    ("let's do a quick security check", CHECKPOINT),
+    ("page not found", NOT_FOUND),
+    ("this page doesn't exist", NOT_FOUND),
+    ("this page doesn’t exist", NOT_FOUND),
+    ("this profile is not available", NOT_FOUND),
+    ("join linkedin", AUTH_WALL),
+    ("sign up", AUTH_WALL),
+)
+
+# [title, state of the first DOM_STATES selector found, whether there is a
+# <main>, rendered text]; innerText leaves out scripts, styles and hidden elements
+_SNAPSHOT = """
+var found = null;
+for (var i = 0; i < arguments[0].length && found === null; i++) {
+    if (document.querySelector(arguments[0][i][0])) found = arguments[0][i][1];
+}
+var body = document.body ? document.body.innerText || "" : "";
+return [document.title || "", found, !!document.querySelector("main"), body.slice(0, 2000)];
+"""
+
+
+class PageStateError(Exception):
+    """A page that cannot be scraped; `state` says why."""
+
+    state = None
+    # whether trying the url again later can help
+    retry = True
+
+    def __init__(self, url, state=None):
+        self.url = url
+        self.state = state or self.state
+        super().__init__(f"{self.state}: {url}")
+
+
+class AuthWallError(PageStateError):
+    state = AUTH_WALL
+
+
+class CheckpointError(PageStateError):
+    state = CHECKPOINT
+
+
+class NotFoundError(PageStateError):
+    state = NOT_FOUND
+    retry = False
+
+
+class RateLimitedError(PageStateError):
+    state = RATE_LIMITED
+
+
+ERRORS = {
+    AUTH_WALL: AuthWallError,
+    CHECKPOINT: CheckpointError,
+    NOT_FOUND: NotFoundError,
+    RATE_LIMITED: RateLimitedError,
+}
+
+
+def classify_url(url):
+    path = urllib.parse.urlsplit(url or "").path.lower()
+    for prefix, state in URL_STATES:
+        if path.startswith(prefix):
+            return state
+    return None
+
+
+def _title_is(title, marker):
+    return title == marker or title.startswith(marker + " |")
+
+
+def classify_page(driver):
+    """
+    State of the page `driver` shows, from its url and, if that is
+    inconclusive, its DOM markers, its title and (on a page without a
+    <main>) its text.
+    """
+    state = classify_url(driver.current_url)
+    if state is not None:
+        return state
+    try:
+        title, found, has_main, text = driver.execute_script(_SNAPSHOT, [list(marker) for marker in DOM_STATES])
+    except Exception:
+        return OK
+    if found in ERRORS:
+        return found
+    title, text = (title or "").strip().lower(), (text or "").lower()
+    for marker, state in TEXT_STATES:
+        if _title_is(title, marker) or (not has_main and state != AUTH_WALL and marker in text):
+            return state
+    return OK
+
+
+def check_page(driver, url=None):
+    """Raise the `PageStateError` of a page that is not ok, otherwise return OK."""
+    state = classify_page(driver)
+    if state != OK:
+        raise ERRORS[state](url or driver.current_url)
+    return state
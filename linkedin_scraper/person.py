@@ -1,18 +1,45 @@
 import requests
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException
-from .objects import Experience, Education, Scraper, Interest, Accomplishment, Contact
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from .objects import Experience, Education, Scraper, Interest, Accomplishment
+from .connections import get_connections
 import os
+import hashlib
 from linkedin_scraper import selectors
+from .urls import detail_url
+from .dates import parse_date_range
+from .deadline import Deadline
+
+
+def _fingerprint(text):
+    return hashlib.sha1((text or "").strip().encode("utf-8")).hexdigest()
+
+
+# top level items of a profile card, without the positions nested in a grouped company
+_CARD_ITEMS = (
+    ".//li[(contains(@class, 'artdeco-list__item') or contains(@class, 'pvs-list__paged-list-item'))"
+    " and not(ancestor::li)]"
+)
 
 
 class Person(Scraper):
 
     __TOP_CARD = "main"
-    __WAIT_FOR_ELEMENT_TIMEOUT = 5
+    # default wait for the top card and the section lists, in seconds
+    ELEMENT_WAIT_TIMEOUT = 5
+    # pause for the top card to finish rendering, in seconds
+    TOP_CARD_SETTLE_TIME = 5
+    # the main profile page shows at most this many experiences/educations
+    HOMEPAGE_ITEM_LIMIT = 5
+    SECTION_FIELDS = {
+        "top_card": ("name", "location", "headline", "open_to_work", "about"),
+        "experience": ("experiences",),
+        "education": ("educations",),
+        "interests": ("interests",),
+        "accomplishments": ("accomplishments",),
+        "connections": ("contacts",),
+    }
 
     def __init__(
         self,
@@ -32,7 +59,12 @@ class Person(Scraper):
         scrape=True,
         close_on_complete=True,
         time_to_wait_after_login=0,
-        connections=True,
+        connections=False,
+        previous=None,
+        cache=None,
+        detail_pages="auto",
+        deadline=None,
+        sections=None,
     ):
         self.linkedin_url = linkedin_url
         self.name = name
@@ -44,6 +76,14 @@ class Person(Scraper):
         self.accomplishments = accomplishments or []
         self.also_viewed_urls = []
         self.contacts = contacts or []
+        self.fingerprints = {}
+        self.changed_sections = []
+        self.detail_pages = detail_pages
+        self.section_sources = {}
+        self.section_status = {}
+        self.section_errors = {}
+        self.deadline = Deadline.of(deadline)
+        self.sections = sections
 
         if driver is None:
             try:
@@ -58,13 +98,18 @@ class Person(Scraper):
             except:
                 driver = webdriver.Chrome()
 
-        if get:
-            driver.get(linkedin_url)
-
         self.driver = driver
 
-        if scrape:
-            self.scrape(close_on_complete, connections=connections)
+        def get_and_scrape():
+            if get:
+                self._get(linkedin_url)
+            if scrape:
+                self.scrape(close_on_complete, connections=connections, previous=previous)
+
+        if scrape and cache is not None:
+            self._read_through(cache, "person", get_and_scrape, close=driver.quit if close_on_complete else None)
+        else:
+            get_and_scrape()
 
     def add_about(self, about):
         self.about.append(about)
@@ -87,17 +132,17 @@ class Person(Scraper):
     def add_contact(self, contact):
         self.contacts.append(contact)
 
-    def scrape(self, close_on_complete=True, connections=True):
+    def scrape(self, close_on_complete=True, connections=False, previous=None, deadline=None):
+        if deadline is not None:
+            self.deadline = Deadline.of(deadline)
         if self.is_signed_in():
-            self.scrape_logged_in(close_on_complete=close_on_complete, connections=connections)
+            self.scrape_logged_in(close_on_complete=close_on_complete, connections=connections, previous=previous)
         else:
             print("you are not logged in!")
 
     def _click_see_more_by_class_name(self, class_name):
         try:
-            _ = WebDriverWait(self.driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
-                EC.presence_of_element_located((By.CLASS_NAME, class_name))
-            )
+            _ = self.wait_for_element_to_load(name=class_name, timeout=self.ELEMENT_WAIT_TIMEOUT)
             div = self.driver.find_element(By.CLASS_NAME, class_name)
             div.find_element(By.TAG_NAME, "button").click()
         except Exception as e:
@@ -109,15 +154,29 @@ class Person(Scraper):
         except:
             return False
 
-    def get_experiences(self):
-        url = os.path.join(self.linkedin_url, "details/experience")
-        self.driver.get(url)
+    @staticmethod
+    def _text_after(elem, header):
+        text = elem.text.strip()
+        header_text = header.text.strip()
+        if header_text and text.startswith(header_text):
+            return text[len(header_text):].strip()
+        return text
+
+    def _get_detail_items(self, section):
+        self._get(detail_url(self.linkedin_url, "details/" + section))
         self.focus()
         main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
         self.scroll_to_half()
         self.scroll_to_bottom()
         main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
-        for position in main_list.find_elements(By.CLASS_NAME, "pvs-list__paged-list-item"):
+        return main_list.find_elements(By.CLASS_NAME, "pvs-list__paged-list-item")
+
+    def get_experiences(self):
+        self.parse_experiences(self._get_detail_items("experience"))
+
+    def parse_experiences(self, items):
+        """Add an `Experience` for each item of an experience list (detail page or profile card)."""
+        for position in items:
             position = position.find_element(By.CSS_SELECTOR, "div[data-view-name='profile-component-entity']")
             
             # Fix: Handle case where more than 2 elements are returned
@@ -168,17 +227,7 @@ class Person(Scraper):
                 work_times = outer_positions[1].find_element(By.TAG_NAME,"span").text if len(outer_positions) > 1 else ""
                 location = ""
 
-            # Safely extract times and duration
-            if work_times:
-                parts = work_times.split("·")
-                times = parts[0].strip() if parts else ""
-                duration = parts[1].strip() if len(parts) > 1 else None
-            else:
-                times = ""
-                duration = None
-
-            from_date = " ".join(times.split(" ")[:2]) if times else ""
-            to_date = " ".join(times.split(" ")[3:]) if times and len(times.split(" ")) > 3 else ""
+            dates = parse_date_range(work_times)
             
             if position_summary_text and any(element.get_attribute("class") == "pvs-list__container" for element in position_summary_text.find_elements(By.XPATH, "*")):
                 try:
@@ -194,7 +243,8 @@ class Person(Scraper):
                 descriptions = inner_positions
                 for description in descriptions:
                     try:
-                        res = description.find_element(By.TAG_NAME,"a").find_elements(By.XPATH,"*")
+                        anchor = description.find_element(By.TAG_NAME,"a")
+                        res = anchor.find_elements(By.XPATH,"*")
                         position_title_elem = res[0] if len(res) > 0 else None
                         work_times_elem = res[1] if len(res) > 1 else None
                         location_elem = res[2] if len(res) > 2 else None
@@ -203,25 +253,14 @@ class Person(Scraper):
                         position_title = position_title_elem.find_element(By.XPATH,"*").find_element(By.TAG_NAME,"*").text if position_title_elem else ""
                         work_times = work_times_elem.find_element(By.XPATH,"*").text if work_times_elem else ""
                         
-                        # Safely extract times and duration
-                        if work_times:
-                            parts = work_times.split("·")
-                            times = parts[0].strip() if parts else ""
-                            duration = parts[1].strip() if len(parts) > 1 else None
-                        else:
-                            times = ""
-                            duration = None
-                            
-                        from_date = " ".join(times.split(" ")[:2]) if times else ""
-                        to_date = " ".join(times.split(" ")[3:]) if times and len(times.split(" ")) > 3 else ""
+                        inner_dates = parse_date_range(work_times)
 
                         experience = Experience(
                             position_title=position_title,
-                            from_date=from_date,
-                            to_date=to_date,
-                            duration=duration,
+                            duration=inner_dates.duration,
+                            **inner_dates.fields(),
                             location=location,
-                            description=description,
+                            description=self._text_after(description, anchor),
                             institution_name=company,
                             linkedin_url=company_linkedin_url
                         )
@@ -234,9 +273,8 @@ class Person(Scraper):
 
                 experience = Experience(
                     position_title=position_title,
-                    from_date=from_date,
-                    to_date=to_date,
-                    duration=duration,
+                    duration=dates.duration,
+                    **dates.fields(),
                     location=location,
                     description=description,
                     institution_name=company,
@@ -245,14 +283,11 @@ class Person(Scraper):
                 self.add_experience(experience)
 
     def get_educations(self):
-        url = os.path.join(self.linkedin_url, "details/education")
-        self.driver.get(url)
-        self.focus()
-        main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
-        self.scroll_to_half()
-        self.scroll_to_bottom()
-        main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
-        for position in main_list.find_elements(By.CLASS_NAME,"pvs-list__paged-list-item"):
+        self.parse_educations(self._get_detail_items("education"))
+
+    def parse_educations(self, items):
+        """Add an `Education` for each item of an education list (detail page or profile card)."""
+        for position in items:
             try:
                 position = position.find_element(By.CSS_SELECTOR, "div[data-view-name='profile-component-entity']")
                 
@@ -283,30 +318,17 @@ class Person(Scraper):
                 institution_name = outer_positions[0].find_element(By.TAG_NAME,"span").text if outer_positions else ""
                 degree = outer_positions[1].find_element(By.TAG_NAME,"span").text if len(outer_positions) > 1 else None
 
-                from_date = None
-                to_date = None
-                
+                dates = parse_date_range(None)
                 if len(outer_positions) > 2:
                     try:
-                        times = outer_positions[2].find_element(By.TAG_NAME,"span").text
-
-                        if times and "-" in times:
-                            split_times = times.split(" ")
-                            dash_index = split_times.index("-") if "-" in split_times else -1
-                            
-                            if dash_index > 0:
-                                from_date = split_times[dash_index-1]
-                            if dash_index < len(split_times) - 1:
-                                to_date = split_times[-1]
-                    except (NoSuchElementException, ValueError):
-                        from_date = None
-                        to_date = None
+                        dates = parse_date_range(outer_positions[2].find_element(By.TAG_NAME,"span").text)
+                    except NoSuchElementException:
+                        pass
 
                 description = position_summary_text.text if position_summary_text else ""
 
                 education = Education(
-                    from_date=from_date,
-                    to_date=to_date,
+                    **dates.fields(),
                     description=description,
                     degree=degree,
                     institution_name=institution_name,
@@ -317,6 +339,85 @@ class Person(Scraper):
                 # Skip this education entry if elements are missing
                 continue
 
+    def get_fingerprints(self):
+        """
+        Fingerprint the top card and the experience/education summaries shown
+        on the main profile page, so a later refresh can tell which detail
+        pages actually need to be reloaded.
+        """
+        fingerprints = {}
+        try:
+            top_panel = self.driver.find_element(By.XPATH, "//*[@class='mt2 relative']")
+            fingerprints["top_card"] = _fingerprint(top_panel.text)
+        except NoSuchElementException:
+            pass
+        for section in ("experience", "education"):
+            try:
+                summary = self.driver.find_element(By.ID, section).find_element(By.XPATH, "..")
+            except NoSuchElementException:
+                continue
+            fingerprints[section] = _fingerprint(summary.text)
+        return fingerprints
+
+    def get_homepage_section(self, section):
+        """
+        The "experience" or "education" card of the main profile page and its
+        items, and whether the card is truncated: it links to the detail page
+        ("Show all 12 experiences") or shows as many items as the page ever
+        does. The card is None when the profile has no such section.
+        """
+        try:
+            card = self.driver.find_element(By.ID, section).find_element(By.XPATH, "..")
+        except NoSuchElementException:
+            return None, [], False
+        items = card.find_elements(By.XPATH, _CARD_ITEMS)
+        show_all = card.find_elements(
+            By.XPATH, f".//a[contains(@href, '/details/{section}') or contains(@id, 'see-all-{section}')]"
+        )
+        return card, items, bool(show_all) or len(items) >= self.HOMEPAGE_ITEM_LIMIT
+
+    def _read_homepage_section(self, section, previous):
+        """
+        Fill experiences or educations from the main profile page. Returns
+        True when the section still needs its detail page: the card truncates
+        it, or `detail_pages="always"`. Under a deadline the items of a
+        truncated card are kept in the meantime as a partial result.
+        `section_sources` records "previous", "homepage", "details" or "absent".
+        """
+        parse = {"experience": self.parse_experiences, "education": self.parse_educations}[section]
+        if self._is_unchanged(section, previous):
+            setattr(self, section + "s", list(getattr(previous, section + "s")))
+            self.section_sources[section] = "previous"
+            return False
+        if self.detail_pages == "always":
+            return True
+        card, items, truncated = self.get_homepage_section(section)
+        if card is None:
+            self.section_sources[section] = "absent"
+            return False
+        if truncated and self.deadline is None:
+            return True
+        try:
+            parse(items)
+        except NoSuchElementException:
+            setattr(self, section + "s", [])
+        if truncated or (items and not getattr(self, section + "s")):
+            return True
+        self.section_sources[section] = "homepage"
+        return False
+
+    def _load_detail_section(self, section):
+        items = self._get_detail_items(section)
+        setattr(self, section + "s", [])
+        {"experience": self.parse_experiences, "education": self.parse_educations}[section](items)
+        self.section_sources[section] = "details"
+
+    def _is_unchanged(self, section, previous):
+        # a failed or timed out section is scraped again even if unchanged
+        if previous is None or section not in self.fingerprints or not self._completed(previous, section):
+            return False
+        return getattr(previous, "fingerprints", {}).get(section) == self.fingerprints[section]
+
     def get_name_and_location(self):
         top_panel = self.driver.find_element(By.XPATH, "//*[@class='mt2 relative']")
         self.name = top_panel.find_element(By.TAG_NAME, "h1").text
@@ -364,20 +465,11 @@ class Person(Scraper):
             about=None
         self.about = about
 
-    def scrape_logged_in(self, close_on_complete=True, connections=True):
+    def _scrape_top_card(self):
         driver = self.driver
-        duration = None
-
-        root = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
-            EC.presence_of_element_located(
-                (
-                    By.TAG_NAME,
-                    self.__TOP_CARD,
-                )
-            )
-        )
+        root = self.wait_for_element_to_load(by=By.TAG_NAME, name=self.__TOP_CARD, timeout=self.ELEMENT_WAIT_TIMEOUT)
         self.focus()
-        self.wait(5)
+        self.wait(self._timeout(self.TOP_CARD_SETTLE_TIME))
 
         # get name and location
         self.get_name_and_location()
@@ -396,15 +488,13 @@ class Person(Scraper):
             "window.scrollTo(0, Math.ceil(document.body.scrollHeight/1.5));"
         )
 
-        # get interest (from main page before navigating away)
+    def get_interests(self):
+        driver = self.driver
         try:
-            _ = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
-                EC.presence_of_element_located(
-                    (
-                        By.XPATH,
-                        "//*[@class='pv-profile-section pv-interests-section artdeco-container-card artdeco-card ember-view']",
-                    )
-                )
+            _ = self.wait_for_element_to_load(
+                by=By.XPATH,
+                name="//*[@class='pv-profile-section pv-interests-section artdeco-container-card artdeco-card ember-view']",
+                timeout=self.ELEMENT_WAIT_TIMEOUT,
             )
             interestContainer = driver.find_element(By.XPATH,
                 "//*[@class='pv-profile-section pv-interests-section artdeco-container-card artdeco-card ember-view']"
@@ -413,21 +503,19 @@ class Person(Scraper):
                 "//*[@class='pv-interest-entity pv-profile-section__card-item ember-view']"
             ):
                 interest = Interest(
-                    interestElement.find_element(By.TAG_NAME, "h3").text.strip()
+                    title=interestElement.find_element(By.TAG_NAME, "h3").text.strip()
                 )
                 self.add_interest(interest)
-        except:
+        except (TimeoutException, NoSuchElementException):
             pass
 
-        # get accomplishment (from main page before navigating away)
+    def get_accomplishments(self):
+        driver = self.driver
         try:
-            _ = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
-                EC.presence_of_element_located(
-                    (
-                        By.XPATH,
-                        "//*[@class='pv-profile-section pv-accomplishments-section artdeco-container-card artdeco-card ember-view']",
-                    )
-                )
+            _ = self.wait_for_element_to_load(
+                by=By.XPATH,
+                name="//*[@class='pv-profile-section pv-accomplishments-section artdeco-container-card artdeco-card ember-view']",
+                timeout=self.ELEMENT_WAIT_TIMEOUT,
             )
             acc = driver.find_element(By.XPATH,
                 "//*[@class='pv-profile-section pv-accomplishments-section artdeco-container-card artdeco-card ember-view']"
@@ -439,36 +527,50 @@ class Person(Scraper):
                 for title in block.find_element(By.TAG_NAME,
                     "ul"
                 ).find_elements(By.TAG_NAME, "li"):
-                    accomplishment = Accomplishment(category.text, title.text)
+                    accomplishment = Accomplishment(category=category.text, title=title.text)
                     self.add_accomplishment(accomplishment)
-        except:
+        except (TimeoutException, NoSuchElementException):
             pass
 
-        # get experience (navigate to experience page)
-        self.get_experiences()
+    def get_contacts(self):
+        # connections of the logged in account (memoized per driver session)
+        for contact in get_connections(self.driver):
+            self.add_contact(contact)
+
+    def scrape_logged_in(self, close_on_complete=True, connections=False, previous=None):
+        """
+        Scrape in order of priority: top card, experience, education, then
+        the extras. Everything on the main page is read before a detail page
+        replaces it. With a `deadline` the waits are capped by the time left,
+        and `section_status` tells which sections are complete. With
+        `sections`, only those are scraped and the rest come from `previous`.
+        """
+        driver = self.driver
+        self.section_status = {}
+        self.section_errors = {}
+        self._reuse_sections(previous)
+
+        self._run_section("top_card", self._scrape_top_card)
 
-        # get education (navigate to education page)
-        self.get_educations()
+        self.fingerprints = self.get_fingerprints()
+        self.changed_sections = [
+            section for section in self.fingerprints
+            if not self._is_unchanged(section, previous)
+        ]
+
+        details = [
+            section for section in ("experience", "education")
+            if self._run_section(section, self._read_homepage_section, section, previous)
+        ]
+        self._run_section("interests", self.get_interests)
+        self._run_section("accomplishments", self.get_accomplishments)
+
+        # detail pages of the truncated sections
+        for section in details:
+            self._run_section(section, self._load_detail_section, section)
 
-        # get connections (only if connections=True)
         if connections:
-            try:
-                driver.get("https://www.linkedin.com/mynetwork/invite-connect/connections/")
-                _ = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, "mn-connections"))
-                )
-                connections_element = driver.find_element(By.CLASS_NAME, "mn-connections")
-                if connections_element is not None:
-                    for conn in connections_element.find_elements(By.CLASS_NAME, "mn-connection-card"):
-                        anchor = conn.find_element(By.CLASS_NAME, "mn-connection-card__link")
-                        url = anchor.get_attribute("href")
-                        name = conn.find_element(By.CLASS_NAME, "mn-connection-card__details").find_element(By.CLASS_NAME, "mn-connection-card__name").text.strip()
-                        occupation = conn.find_element(By.CLASS_NAME, "mn-connection-card__details").find_element(By.CLASS_NAME, "mn-connection-card__occupation").text.strip()
-
-                        contact = Contact(name=name, occupation=occupation, url=url)
-                        self.add_contact(contact)
-            except:
-                pass
+            self._run_section("connections", self.get_contacts)
 
         if close_on_complete:
             driver.quit()
@@ -495,6 +597,26 @@ class Person(Scraper):
         else:
             return None
 
+    def to_dict(self):
+        return {
+            "linkedin_url": self.linkedin_url,
+            "name": self.name,
+            "headline": self.headline,
+            "location": getattr(self, "location", None),
+            "about": self.about,
+            "open_to_work": getattr(self, "open_to_work", None),
+            "company": self.company,
+            "job_title": self.job_title,
+            "experiences": [experience.to_dict() for experience in self.experiences],
+            "educations": [education.to_dict() for education in self.educations],
+            "interests": [interest.to_dict() for interest in self.interests],
+            "accomplishments": [accomplishment.to_dict() for accomplishment in self.accomplishments],
+            "contacts": [contact.to_dict() for contact in self.contacts],
+            "section_sources": dict(getattr(self, "section_sources", {})),
+            "section_status": dict(getattr(self, "section_status", {})),
+            "section_errors": dict(getattr(self, "section_errors", {})),
+        }
+
     def __repr__(self):
         return "<Person {name}\n\nHeadline\n{headline}\n\nAbout\n{about}\n\nExperience\n{exp}\n\nEducation\n{edu}\n\nInterest\n{int}\n\nAccomplishments\n{acc}\n\nContacts\n{conn}>".format(
             name=self.name,
@@ -0,0 +1,49 @@
+import queue
+from contextlib import contextmanager
+
+from selenium import webdriver
+
+from . import actions
+
+
+def create_driver(driver_factory=webdriver.Chrome, email=None, password=None, cookie=None):
+    """Start a driver and log it in when credentials or a cookie are given."""
+    driver = driver_factory()
+    if cookie is not None or (email and password):
+        actions.login(driver, email, password, cookie=cookie)
+    return driver
+
+
+class DriverPool(object):
+    """
+    A fixed set of (usually logged in) drivers shared between threads.
+    Each driver is handed to a single user at a time through `acquire()`.
+    """
+
+    def __init__(self, drivers):
+        self.drivers = list(drivers)
+        self._idle = queue.Queue()
+        for driver in self.drivers:
+            self._idle.put(driver)
+
+    @classmethod
+    def create(cls, size, driver_factory=webdriver.Chrome, email=None, password=None, cookie=None):
+        return cls(create_driver(driver_factory, email, password, cookie) for _ in range(size))
+
+    def __len__(self):
+        return len(self.drivers)
+
+    @contextmanager
+    def acquire(self, timeout=None):
+        driver = self._idle.get(timeout=timeout)
+        try:
+            yield driver
+        finally:
+            self._idle.put(driver)
+
+    def quit(self):
+        for driver in self.drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
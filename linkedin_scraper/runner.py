@@ -0,0 +1,280 @@
+import multiprocessing
+import multiprocessing.util
+import signal
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from selenium import webdriver
+
+from .company import Company
+from .jobs import Job
+from .job_search import JobSearch
+from .optimized_person import OptimizedPerson
+from .person import Person
+from .objects import Scraper
+from .pacing import Pacer
+from .page_state import AuthWallError, CheckpointError
+from .pool import create_driver
+from . import serialization
+from .urls import url_kind
+from .work_queue import SQLiteWorkQueue, default_worker_id
+
+SCRAPERS = {
+    "person": Person,
+    "optimized_person": OptimizedPerson,
+    "company": Company,
+    "job": Job,
+}
+# kinds that can scrape only some `sections` on top of a `previous` result
+SECTION_KINDS = ("person", "optimized_person", "company")
+
+_driver = None
+# why the driver of this worker could not be started
+_driver_error = None
+
+
+@dataclass
+class BatchResult:
+    kind: str = None
+    url: str = None
+    result: Any = None
+    error: str = None
+    elapsed: float = None
+    # the queue task of a result that is left for the caller to ack
+    task: Any = None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    @property
+    def failed_sections(self):
+        """Sections of a partial result, to scrape again with `sections=` and `previous=`."""
+        return getattr(self.result, "failed_sections", [])
+
+
+def scrape(kind, url, driver, **options):
+    """Scrape a single `url` as `kind` on an existing driver and detach the result."""
+    scraper = SCRAPERS[kind]
+    return scraper(url, driver=driver, close_on_complete=False, **options).detach()
+
+
+def _init_worker(driver_factory, email, password, cookie):
+    global _driver, _driver_error
+    try:
+        _driver = create_driver(driver_factory, email=email, password=password, cookie=cookie)
+    except Exception as e:
+        # an initializer that raises makes the pool start another worker, forever;
+        # fail this worker's tasks instead
+        _driver_error = f"{type(e).__name__}: {e}"
+        return
+    # pool workers leave through os._exit, which skips atexit handlers
+    multiprocessing.util.Finalize(None, _driver.quit, exitpriority=10)
+    # and a terminated pool should still shut its browsers down
+    signal.signal(signal.SIGTERM, _exit_worker)
+
+
+def _exit_worker(signum, frame):
+    sys.exit(0)
+
+
+def _run_task(task):
+    kind, url, options = task
+    start = time.time()
+    if _driver is None:
+        return BatchResult(kind, url, None, f"driver failed to start: {_driver_error}", 0.0)
+    try:
+        return BatchResult(kind, url, scrape(kind, url, _driver, **options), None, time.time() - start)
+    except Exception as e:
+        return BatchResult(kind, url, None, f"{type(e).__name__}: {e}", time.time() - start)
+
+
+def _tasks(urls, kind, options):
+    for item in urls:
+        if isinstance(item, tuple):
+            item_kind, url = item
+        else:
+            item_kind, url = kind, item
+        if item_kind == "auto":
+            item_kind = url_kind(url)
+        yield item_kind, url, options.get(item_kind, {})
+
+
+def _print_progress(done, total, failed, elapsed):
+    print(f"[{done}/{total}] {failed} failed, {done / max(elapsed, 1e-9):.2f}/s")
+
+
+def run_batch(urls, kind="auto", workers=4, driver_factory=webdriver.Chrome, email=None, password=None, cookie=None, options=None, progress=None):
+    """
+    Scrape `urls` with `workers` processes, each owning one logged in driver,
+    yielding a `BatchResult` per url in completion order. Items of `urls` are
+    urls of `kind` ("person", "optimized_person", "company", "job" or "auto")
+    or `(kind, url)` tuples. `options` maps a kind to extra scraper keyword
+    arguments, e.g. {"company": {"get_employees": False}}. `progress` is
+    called as progress(done, total, failed, elapsed), or pass True to print.
+    """
+    tasks = list(_tasks(urls, kind, options or {}))
+    if progress is True:
+        progress = _print_progress
+
+    done = failed = 0
+    start = time.time()
+    pool = multiprocessing.Pool(workers, initializer=_init_worker, initargs=(driver_factory, email, password, cookie))
+    try:
+        for result in pool.imap_unordered(_run_task, tasks):
+            done += 1
+            failed += not result.ok
+            if progress:
+                progress(done, len(tasks), failed, time.time() - start)
+            yield result
+    except BaseException:
+        # stopped early: drop the queued tasks
+        pool.terminate()
+        raise
+    else:
+        pool.close()
+    finally:
+        pool.join()
+
+
+def scrape_task(task, driver):
+    """
+    Run a work queue `Task`; "job_search" tasks search for `task.target`.
+    The partial result saved by an earlier attempt is passed as `previous`.
+    """
+    if task.kind == "job_search":
+        jobs = JobSearch(driver, scrape=False, **task.options).search(task.target)
+        return [job.detach() for job in jobs]
+    options = dict(task.options)
+    if task.previous is not None:
+        options["previous"] = serialization.loads(task.previous)
+    return scrape(task.kind, task.target, driver, **options)
+
+
+class _Heartbeat(threading.Thread):
+    def __init__(self, work_queue, task, lease_time):
+        super().__init__(daemon=True)
+        self.work_queue = work_queue
+        self.task = task
+        self.lease_time = lease_time
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.lease_time / 3):
+            if not self.work_queue.heartbeat(self.task, self.lease_time):
+                # another worker has taken the task over
+                return
+
+    def stop(self):
+        self.stopped.set()
+
+
+def run_queue(work_queue, driver, worker_id=None, lease_time=300, poll_interval=5, ack=True):
+    """
+    Consume `work_queue` on `driver` until no unfinished task is left,
+    yielding a `BatchResult` per task. Leases are kept alive while a task
+    runs, so a killed worker's task is picked up again once its lease expires.
+    A person or company result with `failed_sections` is saved in the queue
+    and retried with only those `sections`, on top of the saved result as
+    `previous`; its last attempt is kept as the best partial result. Other
+    partial results are retried in full. An auth wall or a
+    checkpoint stops the worker and gives its task back untouched, since
+    every other task would fail the same way until the session is fixed.
+    With `ack=False` a successful task is left leased and its result carries
+    the `task`, to be acked by the caller once the result is stored; if the
+    caller dies before that, the task runs again when its lease expires.
+    """
+    worker_id = worker_id or default_worker_id()
+    while True:
+        task = work_queue.lease(worker_id, lease_time)
+        if task is None:
+            if not work_queue.has_unfinished():
+                return
+            time.sleep(poll_interval)
+            continue
+
+        heartbeat = _Heartbeat(work_queue, task, lease_time)
+        heartbeat.start()
+        start = time.time()
+        retry = True
+        blocked = False
+        try:
+            result = BatchResult(task.kind, task.target, scrape_task(task, driver), None, time.time() - start)
+        except (AuthWallError, CheckpointError) as e:
+            blocked = True
+            result = BatchResult(task.kind, task.target, None, f"{type(e).__name__}: {e}", time.time() - start)
+        except Exception as e:
+            # e.g. a NotFoundError will not go away by trying again
+            retry = getattr(e, "retry", True)
+            result = BatchResult(task.kind, task.target, None, f"{type(e).__name__}: {e}", time.time() - start)
+        finally:
+            heartbeat.stop()
+
+        if blocked:
+            work_queue.release(task)
+            yield result
+            return
+        if result.ok and result.failed_sections and task.attempts < work_queue.max_attempts:
+            # a partial result: scrape it again later rather than keep the gaps
+            result.error = f"incomplete sections: {', '.join(result.failed_sections)}"
+            if task.kind in SECTION_KINDS:
+                options = dict(task.options, sections=result.failed_sections)
+                work_queue.fail(task, result.error, options=options, previous=serialization.dumps(result.result))
+            else:
+                work_queue.fail(task, result.error)
+        elif result.ok and ack:
+            work_queue.ack(task)
+        elif result.ok:
+            result.task = task
+        else:
+            work_queue.fail(task, result.error, retry=retry)
+        yield result
+
+
+def _queue_worker(path, results, driver_factory, email, password, cookie, lease_time, max_attempts, retry_delay, pacing, ack):
+    if pacing:
+        Scraper.pacer = Pacer(pacing)
+    driver = None
+    try:
+        # a driver that fails to start must still end this worker's results
+        driver = create_driver(driver_factory, email=email, password=password, cookie=cookie)
+        work_queue = SQLiteWorkQueue(path, max_attempts=max_attempts, retry_delay=retry_delay)
+        for result in run_queue(work_queue, driver, lease_time=lease_time, ack=ack):
+            results.put(result)
+    finally:
+        results.put(None)
+        if driver is not None:
+            driver.quit()
+
+
+def run_queue_workers(path, workers=4, driver_factory=webdriver.Chrome, email=None, password=None, cookie=None, lease_time=300, max_attempts=3, retry_delay=30, pacing=None, ack=True):
+    """
+    Start `workers` processes consuming the `SQLiteWorkQueue` at `path`,
+    yielding their `BatchResult`s. Several hosts or invocations can consume
+    the same queue file; a killed run resumes where it stopped. With a
+    `pacing` file the workers share one `Pacer` through it. With `ack=False`
+    the caller acks `result.task` after storing each result (see `run_queue`).
+    """
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(
+            target=_queue_worker,
+            args=(path, results, driver_factory, email, password, cookie, lease_time, max_attempts, retry_delay, pacing, ack),
+        )
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    running = len(processes)
+    while running:
+        result = results.get()
+        if result is None:
+            running -= 1
+        else:
+            yield result
+    for process in processes:
+        process.join()
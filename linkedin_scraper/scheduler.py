@@ -0,0 +1,207 @@
+import collections
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+
+from .deadline import Deadline, DeadlineExceeded
+from .stats import percentile
+
+INTERACTIVE = 0
+NORMAL = 1
+BULK = 2
+PRIORITIES = {"interactive": INTERACTIVE, "normal": NORMAL, "bulk": BULK}
+PRIORITY_NAMES = {value: name for name, value in PRIORITIES.items()}
+
+_local = threading.local()
+
+
+class _Task(object):
+    __slots__ = ("fn", "args", "kwargs", "priority", "tenant", "deadline", "future", "submitted_at")
+
+    def __init__(self, fn, args, kwargs, priority, tenant, deadline):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.tenant = tenant
+        self.deadline = deadline
+        self.future = Future()
+        self.submitted_at = time.monotonic()
+
+
+def page_boundary(driver):
+    """
+    Called by long enumerations (`Company.iter_employees`, paginated
+    `JobSearch.search`) between two pages. On a `Scheduler` worker with no
+    idle driver, waiting tasks of a more urgent class run on `driver` right
+    here. Returns True if they did, i.e. the caller has to reload its page.
+    """
+    stack = getattr(_local, "tasks", None)
+    if not stack:
+        return False
+    scheduler, task, worker_driver = stack[-1]
+    if driver is not worker_driver:
+        return False
+    return scheduler._preempt(task, driver)
+
+
+class Scheduler(object):
+    """
+    Runs tasks on the drivers of a `DriverPool`, one worker thread per
+    driver. The most urgent priority class goes first (INTERACTIVE, NORMAL,
+    BULK); within a class tenants take turns, and each tenant's tasks run
+    earliest deadline first. A task still queued when its deadline passes
+    fails with `DeadlineExceeded`. Long enumerations let urgent tasks use
+    their driver at page boundaries (see `page_boundary`).
+
+        scheduler = Scheduler(DriverPool.create(4, email=email, password=password))
+        bulk = scheduler.scrape("company", url, priority="bulk", tenant="crawler", get_employees=True)
+        person = scheduler.scrape("person", url, priority="interactive", tenant="api", deadline=8).result()
+        scheduler.stats()
+    """
+
+    def __init__(self, pool, window=10000):
+        self.pool = pool
+        self.preemptions = 0
+        self.expired = 0
+        self._cond = threading.Condition()
+        # priority -> tenant -> heap of (deadline, seq, task); tenants in turn order
+        self._queues = {}
+        self._seq = itertools.count()
+        self._waits = collections.defaultdict(lambda: collections.deque(maxlen=window))
+        self._idle = 0
+        self._running = 0
+        self._closed = False
+        self._threads = [threading.Thread(target=self._work, daemon=True) for _ in range(len(pool))]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, fn, *args, priority=NORMAL, tenant=None, deadline=None, **kwargs):
+        """Queue `fn(driver, *args, **kwargs)` and return a `concurrent.futures.Future` of its result."""
+        priority = PRIORITIES.get(priority, priority)
+        task = _Task(fn, args, kwargs, priority, tenant, Deadline.of(deadline))
+        expires_at = task.deadline.expires_at if task.deadline is not None else float("inf")
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("scheduler is closed")
+            tenants = self._queues.setdefault(priority, collections.OrderedDict())
+            heapq.heappush(tenants.setdefault(tenant, []), (expires_at, next(self._seq), task))
+            self._cond.notify()
+        return task.future
+
+    def scrape(self, kind, url, priority=NORMAL, tenant=None, deadline=None, **options):
+        """Submit `runner.scrape(kind, url, driver, **options)`; person and company scrapes share the task's deadline."""
+        from .runner import scrape
+
+        deadline = Deadline.of(deadline)
+        if deadline is not None and kind in ("person", "company"):
+            options["deadline"] = deadline
+        return self.submit(scrape, kind, url, priority=priority, tenant=tenant, deadline=deadline, **options)
+
+    def _pop(self, more_urgent_than=None):
+        for priority in sorted(self._queues):
+            if more_urgent_than is not None and priority >= more_urgent_than:
+                return None
+            tenants = self._queues[priority]
+            while tenants:
+                tenant, heap = next(iter(tenants.items()))
+                task = heapq.heappop(heap)[-1]
+                if heap:
+                    tenants.move_to_end(tenant)
+                else:
+                    del tenants[tenant]
+                if not task.future.set_running_or_notify_cancel():
+                    continue
+                if task.deadline is not None and task.deadline.expired():
+                    self.expired += 1
+                    task.future.set_exception(DeadlineExceeded(f"deadline of {task.deadline.seconds}s passed in the queue"))
+                    continue
+                return task
+        return None
+
+    def _work(self):
+        with self.pool.acquire() as driver:
+            while True:
+                with self._cond:
+                    self._idle += 1
+                    task = self._pop()
+                    while task is None and not self._closed:
+                        self._cond.wait()
+                        task = self._pop()
+                    self._idle -= 1
+                if task is None:
+                    return
+                self._run(task, driver)
+
+    def _run(self, task, driver):
+        stack = _local.__dict__.setdefault("tasks", [])
+        with self._cond:
+            self._waits[task.priority].append(time.monotonic() - task.submitted_at)
+            self._running += 1
+        stack.append((self, task, driver))
+        try:
+            result = task.fn(driver, *task.args, **task.kwargs)
+        except BaseException as e:
+            task.future.set_exception(e)
+        else:
+            task.future.set_result(result)
+        finally:
+            stack.pop()
+            with self._cond:
+                self._running -= 1
+
+    def _preempt(self, current, driver):
+        ran = False
+        while True:
+            with self._cond:
+                # an idle worker will take it without interrupting anyone
+                if self._idle:
+                    break
+                task = self._pop(more_urgent_than=current.priority)
+                if task is None:
+                    break
+                self.preemptions += 1
+            self._run(task, driver)
+            ran = True
+        return ran
+
+    def stats(self):
+        """Queue depth by priority class and tenant, running tasks and queue wait times (seconds)."""
+        with self._cond:
+            depth = {}
+            tenants = collections.Counter()
+            for priority, queues in self._queues.items():
+                depth[PRIORITY_NAMES.get(priority, priority)] = sum(len(heap) for heap in queues.values())
+                for tenant, heap in queues.items():
+                    tenants[tenant] += len(heap)
+            waits = {PRIORITY_NAMES.get(priority, priority): list(values) for priority, values in self._waits.items()}
+            return {
+                "queued": sum(depth.values()),
+                "depth": depth,
+                "tenants": dict(tenants),
+                "running": self._running,
+                "idle": self._idle,
+                "preemptions": self.preemptions,
+                "expired": self.expired,
+                "wait": {
+                    name: {"p50": percentile(values, 50), "p95": percentile(values, 95), "max": max(values, default=None)}
+                    for name, values in waits.items()
+                },
+            }
+
+    def close(self, wait=True):
+        """Stop accepting tasks; workers finish the queued ones and exit."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
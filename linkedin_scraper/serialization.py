@@ -0,0 +1,21 @@
+import pickle
+import zlib
+
+_MAGIC = b"LS1"
+
+
+def dumps(result, compress=True):
+    """
+    Serialize a scraped result (`Person`, `Company`, `Job`, records, or lists
+    of them) to bytes. The driver is never included.
+    """
+    data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+    if compress:
+        return _MAGIC + zlib.compress(data, 1)
+    return data
+
+
+def loads(data):
+    if data[:len(_MAGIC)] == _MAGIC:
+        data = zlib.decompress(data[len(_MAGIC):])
+    return pickle.loads(data)
@@ -0,0 +1,53 @@
+import collections
+import math
+import threading
+import time
+
+
+def percentile(values, q):
+    """The `q` (0-100) percentile of `values` by nearest rank, or None if empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = math.ceil(q / 100 * len(ordered))
+    return ordered[max(0, min(len(ordered), rank) - 1)]
+
+
+class Throughput(object):
+    """Counts completed and failed pages and keeps a window of their latencies."""
+
+    def __init__(self, window=10000):
+        self.started = time.time()
+        self.done = 0
+        self.failed = 0
+        self.latencies = collections.deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, elapsed, ok=True):
+        with self._lock:
+            self.done += 1
+            self.failed += not ok
+            if elapsed is not None:
+                self.latencies.append(elapsed)
+
+    def summary(self):
+        with self._lock:
+            latencies = list(self.latencies)
+            done, failed = self.done, self.failed
+        elapsed = max(time.time() - self.started, 1e-9)
+        return {
+            "done": done,
+            "failed": failed,
+            "pages_per_second": done / elapsed,
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+        }
+
+    def __str__(self):
+        summary = self.summary()
+        p50 = summary["p50"] or 0.0
+        p95 = summary["p95"] or 0.0
+        return (
+            f"{summary['done']} done, {summary['failed']} failed, "
+            f"{summary['pages_per_second']:.2f} pages/s, p50 {p50:.1f}s, p95 {p95:.1f}s"
+        )
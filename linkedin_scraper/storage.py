@@ -0,0 +1,177 @@
+import dataclasses
+import sqlite3
+import time
+
+from .company import Company
+from .jobs import Job
+from .objects import Contact, Education, Experience
+from .urls import canonicalize_url
+
+PERSON_COLUMNS = ("name", "headline", "location", "about", "open_to_work")
+COMPANY_COLUMNS = (
+    "name", "about_us", "website", "phone", "headquarters", "founded", "industry",
+    "company_type", "company_size", "specialties", "headcount",
+)
+JOB_COLUMNS = (
+    "job_title", "company", "company_linkedin_url", "location", "posted_date",
+    "applicant_count", "job_description", "benefits",
+)
+EMPLOYEE_COLUMNS = ("name", "designation", "linkedin_url")
+COMPANY_PAGE_COLUMNS = ("relation", "name", "linkedin_url", "followers")
+
+
+def _record_columns(record_class):
+    return tuple(f.name for f in dataclasses.fields(record_class))
+
+
+# child table -> (parent key column, columns)
+CHILD_TABLES = {
+    "experiences": ("person_url", _record_columns(Experience)),
+    "educations": ("person_url", _record_columns(Education)),
+    "contacts": ("person_url", _record_columns(Contact)),
+    "employees": ("company_url", EMPLOYEE_COLUMNS),
+    "company_pages": ("company_url", COMPANY_PAGE_COLUMNS),
+}
+
+INDEXES = {
+    "experiences": ("person_url", "linkedin_url"),
+    "educations": ("person_url", "linkedin_url"),
+    "contacts": ("person_url", "url"),
+    "employees": ("company_url", "linkedin_url"),
+    "company_pages": ("company_url",),
+    "jobs": ("company_linkedin_url",),
+}
+
+
+def _value(value):
+    if isinstance(value, (list, tuple)):
+        return "\n".join(str(item) for item in value)
+    if value is None or isinstance(value, (str, int, float, bytes)):
+        return value
+    return str(value)
+
+
+class SQLiteSink(object):
+    """
+    Writes scraped `Person`, `Company` and `Job` objects into sqlite in
+    batched transactions. Rows are upserted by canonical `linkedin_url`, and
+    the child rows of an entity (experiences, employees, ...) are replaced
+    together with it.
+
+        with SQLiteSink("results.db") as sink:
+            for person in people:
+                sink.write(person)
+    """
+
+    def __init__(self, path="linkedin_scraper.db", batch_size=500):
+        self.batch_size = batch_size
+        self.db = sqlite3.connect(path)
+        self._pending = []
+        self._create_tables()
+
+    def _ensure_table(self, table, columns, key_columns=()):
+        definitions = ", ".join(
+            f"{column} TEXT PRIMARY KEY" if (column,) == tuple(key_columns) else column
+            for column in columns
+        )
+        self.db.execute(f"CREATE TABLE IF NOT EXISTS {table} ({definitions})")
+        existing = {row[1] for row in self.db.execute(f"PRAGMA table_info({table})")}
+        for column in columns:
+            if column not in existing:
+                self.db.execute(f"ALTER TABLE {table} ADD COLUMN {column}")
+
+    def _create_tables(self):
+        with self.db:
+            self._ensure_table("persons", ("linkedin_url",) + PERSON_COLUMNS + ("scraped_at",), ("linkedin_url",))
+            self._ensure_table("companies", ("linkedin_url",) + COMPANY_COLUMNS + ("scraped_at",), ("linkedin_url",))
+            self._ensure_table("jobs", ("linkedin_url",) + JOB_COLUMNS + ("scraped_at",), ("linkedin_url",))
+            for table, (parent, columns) in CHILD_TABLES.items():
+                self._ensure_table(table, (parent, "position") + columns)
+            for table, columns in INDEXES.items():
+                for column in columns:
+                    self.db.execute(f"CREATE INDEX IF NOT EXISTS {table}_{column} ON {table} ({column})")
+
+    def write(self, result):
+        self._pending.append(result)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def write_many(self, results):
+        for result in results:
+            self.write(result)
+        self.flush()
+
+    def _rows(self, results):
+        now = time.time()
+        rows = {"persons": [], "companies": [], "jobs": []}
+        children = {table: [] for table in CHILD_TABLES}
+        replaced = {table: [] for table in CHILD_TABLES}
+
+        def add_children(table, parent_url, items):
+            replaced[table].append((parent_url,))
+            for position, item in enumerate(items):
+                children[table].append((parent_url, position) + tuple(_value(v) for v in item))
+
+        # keep only the last write of an entity within a batch
+        latest = {}
+        for result in results:
+            latest[(type(result), canonicalize_url(result.linkedin_url))] = result
+
+        for (_, url), result in latest.items():
+            if isinstance(result, Company):
+                rows["companies"].append((url,) + tuple(_value(getattr(result, c, None)) for c in COMPANY_COLUMNS) + (now,))
+                add_children("employees", url, (
+                    tuple(employee.get(c) for c in EMPLOYEE_COLUMNS) for employee in result.employees or [] if employee
+                ))
+                add_children("company_pages", url, [
+                    (relation, page.name, page.linkedin_url, page.followers)
+                    for relation, pages in (("showcase", result.showcase_pages), ("affiliated", result.affiliated_companies))
+                    for page in pages or []
+                ])
+            elif isinstance(result, Job):
+                rows["jobs"].append((url,) + tuple(_value(getattr(result, c, None)) for c in JOB_COLUMNS) + (now,))
+            else:
+                rows["persons"].append((url,) + tuple(_value(getattr(result, c, None)) for c in PERSON_COLUMNS) + (now,))
+                for table, records in (("experiences", result.experiences), ("educations", result.educations), ("contacts", result.contacts)):
+                    columns = CHILD_TABLES[table][1]
+                    add_children(table, url, (tuple(getattr(r, c) for c in columns) for r in records))
+        return rows, children, replaced
+
+    def flush(self):
+        if not self._pending:
+            return
+        rows, children, replaced = self._rows(self._pending)
+        columns = {
+            "persons": PERSON_COLUMNS,
+            "companies": COMPANY_COLUMNS,
+            "jobs": JOB_COLUMNS,
+        }
+        with self.db:
+            for table, table_rows in rows.items():
+                if not table_rows:
+                    continue
+                names = ("linkedin_url",) + columns[table] + ("scraped_at",)
+                updates = ", ".join(f"{name} = excluded.{name}" for name in names[1:])
+                self.db.executemany(
+                    f"INSERT INTO {table} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))}) "
+                    f"ON CONFLICT (linkedin_url) DO UPDATE SET {updates}",
+                    table_rows,
+                )
+            for table, (parent, child_columns) in CHILD_TABLES.items():
+                self.db.executemany(f"DELETE FROM {table} WHERE {parent} = ?", replaced[table])
+                names = (parent, "position") + child_columns
+                self.db.executemany(
+                    f"INSERT INTO {table} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})",
+                    children[table],
+                )
+        self._pending = []
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
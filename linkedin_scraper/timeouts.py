@@ -0,0 +1,184 @@
+import atexit
+import collections
+import contextlib
+import json
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from .stats import percentile
+
+
+class AdaptiveTimeouts(object):
+    """
+    Wait timeouts per selector, learned from how long the element took to
+    appear: the `quantile` of the last `window` observations times `factor`
+    plus `margin`, within [`minimum`, `maximum`]. Until a selector has
+    `min_samples` observations the caller's default is used.
+
+    A wait that times out is not a latency: it is only counted, apart from
+    the window, so a selector that is usually absent keeps its default
+    instead of creeping up to `maximum`. The timeout grows above the
+    caller's default only for a selector that was seen appearing near the
+    cap (after `near_cap` of its timeout).
+
+    With a `path` the observations are loaded from and saved to a JSON file,
+    every `save_every` observations and at exit. Saving merges this
+    process's new observations into the file under a file lock (where
+    `fcntl` exists; elsewhere concurrent savers may overwrite each other).
+    Scrapers use `default_timeouts()` unless `Scraper.timeouts` is set.
+    """
+
+    def __init__(self, path=None, window=200, quantile=99, factor=1.5, margin=0.5,
+                 minimum=0.5, maximum=30, min_samples=20, save_every=100, near_cap=0.8):
+        self.path = path
+        self.window = window
+        self.quantile = quantile
+        self.factor = factor
+        self.margin = margin
+        self.minimum = minimum
+        self.maximum = maximum
+        self.min_samples = min_samples
+        self.save_every = save_every
+        self.near_cap = near_cap
+        self._latencies = collections.defaultdict(lambda: collections.deque(maxlen=window))
+        # censored observations: waits that timed out, and elements that appeared near the cap
+        self._timeouts = collections.Counter()
+        self._near_cap = collections.Counter()
+        # observations not saved yet, merged into the file by `save`
+        self._pending = collections.defaultdict(list)
+        self._pending_counts = {"timeouts": collections.Counter(), "near_cap": collections.Counter()}
+        self._unsaved = 0
+        self._lock = threading.Lock()
+        if path:
+            self.load()
+            atexit.register(self.save)
+
+    def timeout(self, key, default):
+        with self._lock:
+            latencies = list(self._latencies.get(key, ()))
+            near_cap = self._near_cap[key]
+        if len(latencies) < self.min_samples:
+            return default
+        learned = min(self.maximum, max(self.minimum, percentile(latencies, self.quantile) * self.factor + self.margin))
+        if default is not None and learned > default and not near_cap:
+            return default
+        return learned
+
+    def observe(self, key, elapsed, timeout=None):
+        """Record that the element of `key` appeared after `elapsed` seconds of a `timeout` wait."""
+        with self._lock:
+            self._latencies[key].append(elapsed)
+            self._pending[key].append(elapsed)
+            if timeout is not None and elapsed >= self.near_cap * timeout:
+                self._near_cap[key] += 1
+                self._pending_counts["near_cap"][key] += 1
+            self._unsaved += 1
+            save = self.path and self._unsaved >= self.save_every
+        if save:
+            self.save()
+
+    def observe_timeout(self, key):
+        """Record that a wait for `key` timed out."""
+        with self._lock:
+            self._timeouts[key] += 1
+            self._pending_counts["timeouts"][key] += 1
+            self._unsaved += 1
+            save = self.path and self._unsaved >= self.save_every
+        if save:
+            self.save()
+
+    def _read(self):
+        """`{key: {"latencies": [...], "timeouts": n, "near_cap": n}}` of the file."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        # files written before the censored counts held a list of latencies per key
+        return {
+            key: entry if isinstance(entry, dict) else {"latencies": entry, "timeouts": 0, "near_cap": 0}
+            for key, entry in data.items()
+        }
+
+    def _apply(self, data):
+        for key, entry in data.items():
+            # keep what was observed while saving
+            latencies = entry.get("latencies", []) + self._pending.get(key, [])
+            self._latencies[key] = collections.deque(latencies, maxlen=self.window)
+            for name, counts in (("timeouts", self._timeouts), ("near_cap", self._near_cap)):
+                counts[key] = entry.get(name, 0) + self._pending_counts[name][key]
+
+    @contextlib.contextmanager
+    def _file_lock(self):
+        if fcntl is None:
+            yield
+            return
+        with open(self.path + ".lock", "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def load(self):
+        data = self._read()
+        with self._lock:
+            self._apply(data)
+
+    def save(self):
+        """Merge the new observations into the file and pick up those other processes saved."""
+        if not self.path:
+            return
+        with self._file_lock():
+            with self._lock:
+                pending = dict(self._pending)
+                pending_counts = self._pending_counts
+                self._pending.clear()
+                self._pending_counts = {"timeouts": collections.Counter(), "near_cap": collections.Counter()}
+                self._unsaved = 0
+            data = self._read()
+            for key in set(pending) | set(pending_counts["timeouts"]) | set(pending_counts["near_cap"]):
+                entry = data.setdefault(key, {"latencies": [], "timeouts": 0, "near_cap": 0})
+                entry["latencies"] = (entry["latencies"] + pending.get(key, []))[-self.window:]
+                for name, counts in pending_counts.items():
+                    entry[name] = entry.get(name, 0) + counts[key]
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+        with self._lock:
+            self._apply(data)
+
+    def stats(self):
+        """The current timeout, observation and timed out wait counts of every selector."""
+        with self._lock:
+            keys = set(self._latencies) | set(self._timeouts)
+            counts = {key: (len(self._latencies.get(key, ())), self._timeouts[key]) for key in keys}
+        return {
+            key: {"samples": samples, "timeouts": timeouts, "timeout": self.timeout(key, None)}
+            for key, (samples, timeouts) in counts.items()
+        }
+
+
+_default = None
+_default_pid = None
+_default_lock = threading.Lock()
+
+
+def default_timeouts():
+    """
+    The `AdaptiveTimeouts` shared by the scrapers of this process, built on
+    first use (and again in a forked child) from LINKEDIN_SCRAPER_TIMEOUTS,
+    so a worker process picks up a file set after this module was imported.
+    """
+    global _default, _default_pid
+    with _default_lock:
+        if _default is None or _default_pid != os.getpid():
+            _default = AdaptiveTimeouts(os.getenv("LINKEDIN_SCRAPER_TIMEOUTS"))
+            _default_pid = os.getpid()
+        return _default
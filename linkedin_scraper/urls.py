@@ -0,0 +1,81 @@
+import re
+import urllib.parse
+
+_ENTITY_PATH = re.compile(r"^/(in|company|school|showcase)/([^/?#]+)")
+_JOB_PATH = re.compile(r"^/jobs/view/(?:[^/?#]*?-)?(\d+)")
+_JOB_ID_PARAM = re.compile(r"(?:currentJobId|jobId)=(\d+)")
+
+TRACKING_PARAMS = ("trk", "trkInfo", "trackingId", "refId", "lipi", "originalSubdomain", "midToken", "midSig")
+
+KINDS = {
+    "in": "person",
+    "company": "company",
+    "school": "company",
+    "showcase": "company",
+}
+
+
+def job_id_from_url(url):
+    """The numeric job id of a job posting or job search url, or None."""
+    if not url:
+        return None
+    parsed = urllib.parse.urlsplit(url)
+    match = _JOB_PATH.match(parsed.path) or _JOB_ID_PARAM.search(parsed.query)
+    return match.group(1) if match else None
+
+
+def canonicalize_url(url):
+    """
+    Normalize a person, company or job url so that every form of it maps to
+    the same string: www host, https, no tracking query or fragment, lower
+    case slug and a single trailing slash.
+
+    >>> canonicalize_url("https://in.linkedin.com/in/Anirudra-Choudhury-109635b1?trk=pub-pbmap")
+    'https://www.linkedin.com/in/anirudra-choudhury-109635b1/'
+    """
+    if not url:
+        return url
+    url = url.strip()
+    if "://" not in url:
+        url = "https://" + url.lstrip("/")
+    parsed = urllib.parse.urlsplit(url)
+    host = parsed.netloc.lower()
+    if host == "linkedin.com" or host.endswith(".linkedin.com"):
+        host = "www.linkedin.com"
+    path = urllib.parse.unquote(parsed.path)
+
+    job_id = job_id_from_url(url)
+    if job_id and path.startswith("/jobs/"):
+        return "https://%s/jobs/view/%s/" % (host, job_id)
+
+    match = _ENTITY_PATH.match(path)
+    if match:
+        return "https://%s/%s/%s/" % (host, match.group(1), match.group(2).lower())
+
+    query = urllib.parse.urlencode(
+        [(key, value) for key, value in urllib.parse.parse_qsl(parsed.query) if key not in TRACKING_PARAMS]
+    )
+    return "https://%s%s/%s" % (host, path.rstrip("/"), "?" + query if query else "")
+
+
+def detail_url(url, *parts):
+    """Build a sub page url such as `details/experience` below a profile url."""
+    base = canonicalize_url(url).split("?")[0]
+    return base + "/".join(part.strip("/") for part in parts)
+
+
+def is_linkedin_url(url):
+    """Whether `url` is on linkedin.com or one of its subdomains."""
+    host = (urllib.parse.urlsplit(canonicalize_url(url) or "").hostname or "").lower()
+    return host == "linkedin.com" or host.endswith(".linkedin.com")
+
+
+def url_kind(url):
+    """One of "person", "company", "job", or None for anything else, including other sites."""
+    if not is_linkedin_url(url):
+        return None
+    if job_id_from_url(url):
+        return "job"
+    parsed = urllib.parse.urlsplit(canonicalize_url(url))
+    match = _ENTITY_PATH.match(parsed.path)
+    return KINDS.get(match.group(1)) if match else None
@@ -0,0 +1,213 @@
+import abc
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+DEAD = "dead"
+
+
+@dataclass
+class Task:
+    id: int = None
+    kind: str = None
+    target: str = None
+    options: dict = field(default_factory=dict)
+    attempts: int = 0
+    lease_owner: str = None
+    # serialized partial result of the previous attempt, see `fail`
+    previous: bytes = None
+
+
+def default_worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+class WorkQueue(abc.ABC):
+    """
+    Interface of a durable queue of scrape tasks. A task is leased by one
+    worker at a time; the worker must `heartbeat` before the lease expires
+    and finally `ack` or `fail` it. Expired leases are handed out again, and
+    tasks failing `max_attempts` times are dead-lettered. `heartbeat`, `ack`
+    and `fail` return False, changing nothing, once the lease has been lost.
+    """
+
+    @abc.abstractmethod
+    def put(self, kind, target, options=None):
+        pass
+
+    @abc.abstractmethod
+    def lease(self, worker_id=None, lease_time=300):
+        pass
+
+    @abc.abstractmethod
+    def heartbeat(self, task, lease_time=300):
+        pass
+
+    @abc.abstractmethod
+    def ack(self, task):
+        pass
+
+    @abc.abstractmethod
+    def fail(self, task, error=None, retry=True, options=None, previous=None):
+        pass
+
+    @abc.abstractmethod
+    def release(self, task):
+        pass
+
+    @abc.abstractmethod
+    def counts(self):
+        pass
+
+    def has_unfinished(self):
+        counts = self.counts()
+        return counts.get(PENDING, 0) + counts.get(LEASED, 0) > 0
+
+
+class SQLiteWorkQueue(WorkQueue):
+    """
+    `WorkQueue` stored in a sqlite file, safe to share between processes.
+    Adding the same (kind, target) twice is a no-op, so a crawl can be
+    re-seeded after a restart without duplicating work.
+    """
+
+    def __init__(self, path="linkedin_scraper_queue.db", max_attempts=3, retry_delay=30):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self._lock = threading.Lock()
+        self.db = sqlite3.connect(path, timeout=60, isolation_level=None, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            """CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                target TEXT NOT NULL,
+                options TEXT,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                available_at REAL NOT NULL DEFAULT 0,
+                lease_owner TEXT,
+                lease_expires REAL,
+                error TEXT,
+                updated_at REAL,
+                previous BLOB,
+                UNIQUE (kind, target)
+            )"""
+        )
+        columns = {row[1] for row in self.db.execute("PRAGMA table_info(tasks)")}
+        if "previous" not in columns:
+            self.db.execute("ALTER TABLE tasks ADD COLUMN previous BLOB")
+        self.db.execute("CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, available_at)")
+
+    def _transaction(self, statements):
+        with self._lock:
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                result = statements(self.db)
+                self.db.execute("COMMIT")
+                return result
+            except BaseException:
+                self.db.execute("ROLLBACK")
+                raise
+
+    def put(self, kind, target, options=None):
+        return self.put_many([(kind, target, options)])
+
+    def put_many(self, tasks):
+        rows = [(kind, target, json.dumps(options or {}), time.time()) for kind, target, options in tasks]
+        return self._transaction(lambda db: db.executemany(
+            "INSERT OR IGNORE INTO tasks (kind, target, options, updated_at) VALUES (?, ?, ?, ?)", rows
+        ).rowcount)
+
+    def lease(self, worker_id=None, lease_time=300):
+        worker_id = worker_id or default_worker_id()
+
+        def statements(db):
+            now = time.time()
+            # dead-letter expired leases that have used up their attempts
+            db.execute(
+                "UPDATE tasks SET status = ?, error = 'lease expired', updated_at = ? "
+                "WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+                (DEAD, now, LEASED, now, self.max_attempts),
+            )
+            row = db.execute(
+                "SELECT id, kind, target, options, attempts, previous FROM tasks "
+                "WHERE (status = ? AND available_at <= ?) OR (status = ? AND lease_expires < ?) "
+                "ORDER BY id LIMIT 1",
+                (PENDING, now, LEASED, now),
+            ).fetchone()
+            if row is None:
+                return None
+            db.execute(
+                "UPDATE tasks SET status = ?, attempts = attempts + 1, lease_owner = ?, lease_expires = ?, updated_at = ? WHERE id = ?",
+                (LEASED, worker_id, now + lease_time, now, row[0]),
+            )
+            return Task(row[0], row[1], row[2], json.loads(row[3] or "{}"), row[4] + 1, worker_id, row[5])
+
+        return self._transaction(statements)
+
+    def _update_leased(self, task, assignments, values):
+        """Apply `assignments` to `task` if it is still leased by `task.lease_owner`; returns whether it was."""
+        return self._transaction(lambda db: db.execute(
+            f"UPDATE tasks SET {assignments} WHERE id = ? AND status = ? AND lease_owner = ?",
+            values + (task.id, LEASED, task.lease_owner),
+        ).rowcount) == 1
+
+    def heartbeat(self, task, lease_time=300):
+        now = time.time()
+        return self._update_leased(task, "lease_expires = ?, updated_at = ?", (now + lease_time, now))
+
+    def ack(self, task):
+        return self._update_leased(
+            task, "status = ?, lease_owner = NULL, error = NULL, previous = NULL, updated_at = ?", (DONE, time.time())
+        )
+
+    def fail(self, task, error=None, retry=True, options=None, previous=None):
+        """
+        Schedule a retry with exponential backoff, or dead-letter the task
+        after its last attempt or if `retry` is False. The retry runs with
+        `options` instead of the task's own, if given, and gets `previous`
+        (bytes, e.g. a serialized partial result) as `task.previous`; the
+        task's own `previous` is kept otherwise.
+        """
+        now = time.time()
+        status = DEAD if not retry or task.attempts >= self.max_attempts else PENDING
+        delay = self.retry_delay * 2 ** (task.attempts - 1)
+        options = json.dumps(options if options is not None else task.options or {})
+        previous = previous if previous is not None else task.previous
+        return self._update_leased(
+            task,
+            "status = ?, available_at = ?, lease_owner = NULL, error = ?, options = ?, previous = ?, updated_at = ?",
+            (status, now + delay, error, options, previous, now),
+        )
+
+    def release(self, task):
+        """Give a leased task back without counting the attempt, e.g. when the worker cannot go on."""
+        return self._update_leased(
+            task,
+            "status = ?, attempts = attempts - 1, available_at = 0, lease_owner = NULL, updated_at = ?",
+            (PENDING, time.time()),
+        )
+
+    def requeue_dead(self):
+        """Give dead-lettered tasks a fresh set of attempts."""
+        return self._transaction(lambda db: db.execute(
+            "UPDATE tasks SET status = ?, attempts = 0, available_at = 0, updated_at = ? WHERE status = ?",
+            (PENDING, time.time(), DEAD),
+        ).rowcount)
+
+    def counts(self):
+        with self._lock:
+            rows = self.db.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall()
+        return dict(rows)
+
+    def close(self):
+        self.db.close()
@@ -1,5 +1,6 @@
 import os
 from linkedin_scraper import Person, actions
+from linkedin_scraper.connections import iter_connections
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 
@@ -10,10 +11,10 @@ driver = webdriver.Chrome("./chromedriver", options=chrome_options)
 email = os.getenv("LINKEDIN_USER")
 password = os.getenv("LINKEDIN_PASSWORD")
 actions.login(driver, email, password) # if email and password isnt given, it'll prompt in terminal
-person = Person("https://www.linkedin.com/in/adrian0350", contacts=[], driver=driver)
+person = Person("https://www.linkedin.com/in/adrian0350", contacts=[], driver=driver, close_on_complete=False)
 
 print("Person: " + person.name)
-print("Person contacts: ")
+print("Logged in account contacts: ")
 
-for contact in person.contacts:
+for contact in iter_connections(driver):
 	print("Contact: " + contact.name + " - " + contact.occupation + " -> " + contact.url)
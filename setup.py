@@ -29,6 +29,9 @@ setup(
     download_url = 'https://github.com/joeyism/linkedin_scraper/dist/' + version + '.tar.gz', 
     keywords = ['linkedin', 'scraping', 'scraper'],
     classifiers = [], 
+    entry_points = {
+        'console_scripts': ['linkedin-scraper=linkedin_scraper.cli:main'],
+    },
     install_requires=[package.split("\n")[0] for package in open("requirements.txt", "r").readlines()]
 )
 
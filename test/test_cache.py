@@ -0,0 +1,97 @@
+import threading
+import time
+
+import pytest
+
+from linkedin_scraper.cache import MemoryCache, ResultCache, SingleFlight, SQLiteCache, TieredCache
+
+
+def test_memory_cache_expires_and_evicts():
+    cache = MemoryCache(maxsize=2, ttl=60)
+    cache.set("old", 1, stored_at=time.time() - 61)
+    assert cache.get("old") is None
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+    assert cache.get("a", max_age=3600) == 1
+
+
+def test_sqlite_cache_persists(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = SQLiteCache(path, ttl=60)
+    cache.set("key", {"value": 1})
+    cache.close()
+    cache = SQLiteCache(path, ttl=60)
+    assert cache.get("key") == {"value": 1}
+    cache.set("stale", 1, stored_at=time.time() - 61)
+    assert cache.get("stale") is None
+    cache.delete("key")
+    assert cache.get("key") is None
+
+
+def test_tiered_cache_copies_hits_with_their_age(tmp_path):
+    memory, disk = MemoryCache(), SQLiteCache(str(tmp_path / "cache.db"))
+    cache = TieredCache(memory, disk)
+    stored_at = time.time() - 90
+    disk.set("key", "value", stored_at=stored_at)
+
+    assert cache.get("key", max_age=120) == "value"
+    value, copied_at = memory.get_entry("key")
+    assert copied_at == pytest.approx(stored_at)
+    assert cache.get("key", max_age=60) is None
+
+
+def test_single_flight_runs_one_call_per_key():
+    flight = SingleFlight()
+    calls = []
+    started = threading.Event()
+
+    def slow():
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return "result"
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("key", slow)))
+    leader.start()
+    started.wait()
+    results.append(flight.do("key", slow))
+    leader.join()
+    assert calls == [1]
+    assert sorted(results, key=lambda result: result[1]) == [("result", False), ("result", True)]
+
+
+def test_result_cache_fetch_scrapes_once():
+    cache = ResultCache(max_age={"job": 60})
+    calls = []
+
+    def scrape():
+        calls.append(1)
+        return {"job_title": "Engineer"}
+
+    url = "https://www.linkedin.com/jobs/view/123/"
+    assert cache.fetch("job", url, scrape) == {"job_title": "Engineer"}
+    assert cache.fetch("job", url + "?trk=x", scrape) == {"job_title": "Engineer"}
+    assert calls == [1]
+
+
+class Result(object):
+    def __init__(self, section_status):
+        self.section_status = section_status
+
+    @property
+    def complete(self):
+        return all(status == "complete" for status in self.section_status.values())
+
+
+@pytest.mark.parametrize("status", ["failed", "timeout", "skipped", "partial"])
+def test_result_cache_does_not_store_partial_results(status):
+    cache = ResultCache()
+    url = "https://www.linkedin.com/in/someone/"
+    results = [Result({"top_card": "complete", "experience": "complete"}), Result({"top_card": "complete", "experience": status})]
+    assert cache.fetch("person", url, results.pop).section_status["experience"] == status
+    assert cache.fetch("person", url, results.pop).section_status["experience"] == "complete"
+    assert cache.fetch("person", url, lambda: pytest.fail("scraped again")).section_status["experience"] == "complete"
@@ -0,0 +1,89 @@
+import csv
+import gzip
+import json
+
+import pytest
+
+from linkedin_scraper import cli, runner
+from linkedin_scraper.company import Company
+from linkedin_scraper.jobs import Job
+from linkedin_scraper.page_state import AuthWallError
+from linkedin_scraper.person import Person
+from linkedin_scraper.work_queue import DONE, LEASED, PENDING, SQLiteWorkQueue
+
+PROFILE = "https://www.linkedin.com/in/someone/"
+
+
+def test_read_tasks(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text(f"{PROFILE}\n\n# comment\nhttps://www.linkedin.com/company/google/\nMachine Learning Engineer\n")
+    assert list(cli.read_tasks(str(path), options={"company": {"get_employees": False}})) == [
+        ("person", PROFILE, {}),
+        ("company", "https://www.linkedin.com/company/google/", {"get_employees": False}),
+        ("job_search", "Machine Learning Engineer", {}),
+    ]
+
+
+@pytest.fixture
+def fake_workers(monkeypatch):
+    """Run the queue in process instead of in browser workers."""
+    monkeypatch.setattr(runner, "scrape_task", lambda task, driver: {"linkedin_url": task.target})
+
+    def run_queue_workers(path, ack=True, max_attempts=3, **kwargs):
+        work_queue = SQLiteWorkQueue(path, max_attempts=max_attempts)
+        yield from runner.run_queue(work_queue, driver=None, poll_interval=0, lease_time=60, ack=ack)
+
+    monkeypatch.setattr(cli, "run_queue_workers", run_queue_workers)
+
+
+def run(tmp_path, *urls):
+    (tmp_path / "input.txt").write_text("\n".join(urls))
+    output = tmp_path / "results.ndjson"
+    return cli.main([str(tmp_path / "input.txt"), "-o", str(output), "-q"]), output
+
+
+def test_results_are_written_and_acked(tmp_path, fake_workers):
+    status, output = run(tmp_path, PROFILE)
+    assert status == 0
+    assert [json.loads(line) for line in output.read_text().splitlines()] == [{"linkedin_url": PROFILE}]
+    assert SQLiteWorkQueue(str(output) + ".queue.db").counts() == {DONE: 1}
+
+
+def test_task_is_not_acked_before_its_result_is_written(tmp_path, fake_workers, monkeypatch):
+    def crash(self, result):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(cli.NDJSONWriter, "write", crash)
+    with pytest.raises(OSError):
+        run(tmp_path, PROFILE)
+    # still leased, so it runs again once the lease expires
+    assert SQLiteWorkQueue(str(tmp_path / "results.ndjson.queue.db")).counts() == {LEASED: 1}
+
+
+def test_csv_output_gets_a_file_per_kind(tmp_path):
+    output = cli.open_output(str(tmp_path / "results.csv.gz"))
+    person = Person(PROFILE, "Someone", driver=object(), get=False, scrape=False)
+    company = Company.__new__(Company)
+    company.linkedin_url, company.name = "https://www.linkedin.com/company/acme/", "Acme"
+    job = Job("https://www.linkedin.com/jobs/view/1/", "Engineer", driver=object(), scrape=False)
+    for result in (person, company, job, person):
+        output.write(result)
+    output.close()
+
+    def rows(kind):
+        with gzip.open(tmp_path / f"results.{kind}.csv.gz", "rt", encoding="utf-8", newline="") as f:
+            return list(csv.DictReader(f))
+
+    assert [row["name"] for row in rows("person")] == ["Someone", "Someone"]
+    assert [row["name"] for row in rows("company")] == ["Acme"]
+    assert [row["job_title"] for row in rows("job")] == ["Engineer"]
+
+
+def test_unfinished_tasks_exit_non_zero(tmp_path, fake_workers, monkeypatch):
+    def scrape_task(task, driver):
+        raise AuthWallError(task.target)
+
+    monkeypatch.setattr(runner, "scrape_task", scrape_task)
+    status, output = run(tmp_path, PROFILE)
+    assert status == 1
+    assert SQLiteWorkQueue(str(output) + ".queue.db").counts() == {PENDING: 1}
@@ -0,0 +1,130 @@
+import contextlib
+import queue
+
+import pytest
+
+from linkedin_scraper.company import Company
+from linkedin_scraper.pool import DriverPool
+
+
+class Pool(object):
+    def __len__(self):
+        return 2
+
+    @contextlib.contextmanager
+    def acquire(self, timeout=None):
+        yield None
+
+
+class FakeCompany(Company):
+    """A people list of `people`, each a dict of facet values, cut off at the cap."""
+
+    PEOPLE_RESULT_CAP = 3
+
+    def __init__(self, people):
+        self.linkedin_url = "https://www.linkedin.com/company/acme/"
+        self.section_status = {}
+        self.section_errors = {}
+        self.people = people
+        self.queries = []
+
+    def _matching(self, facets):
+        return [person for person in self.people if all(person.get(key) == value for key, value in (facets or {}).items())]
+
+    def iter_employees(self, wait_time=10, facets=None, driver=None):
+        self.queries.append(facets)
+        for person in self._matching(facets)[:self.PEOPLE_RESULT_CAP]:
+            yield {"linkedin_url": person["url"] + "?miniProfileUrn=x", "name": person["url"]}
+
+    def get_people_facets(self, facet="facetGeoRegion", driver=None, facets=None):
+        return list(dict.fromkeys(person[facet] for person in self._matching(facets) if facet in person))
+
+
+def person(i, region, function=None):
+    return {"url": f"https://www.linkedin.com/in/{i}", "facetGeoRegion": region, "facetCurrentFunction": function}
+
+
+def urls(employees):
+    return sorted(employee["linkedin_url"] for employee in employees)
+
+
+def test_shards_are_merged_and_deduplicated():
+    company = FakeCompany([person(1, "us"), person(2, "us"), person(3, "de")])
+    employees = company.get_employees_sharded(Pool(), shards=["us", "de", "us"])
+    assert len(employees) == 3
+    assert company.section_status["employees"] == "complete"
+
+
+def test_a_single_facet_value_enumerates_the_whole_list():
+    company = FakeCompany([person(1, "us"), person(2, None)])
+    employees = company.get_employees_sharded(Pool(), shards=["us"])
+    assert len(employees) == 2
+    assert company.queries == [{}]
+
+
+def test_truncated_shards_are_split_by_another_facet():
+    people = [person(i, "us", "eng" if i % 2 else "sales") for i in range(4)] + [person(9, "de")]
+    company = FakeCompany(people)
+    employees = company.get_employees_sharded(Pool())
+    assert urls(employees) == sorted(f"https://www.linkedin.com/in/{i}?miniProfileUrn=x" for i in (0, 1, 2, 3, 9))
+    assert {"facetGeoRegion": "us", "facetCurrentFunction": "eng"} in company.queries
+    assert company.section_status["employees"] == "complete"
+    assert "employees" not in company.section_errors
+
+
+def test_a_shard_that_cannot_be_split_is_partial():
+    company = FakeCompany([person(i, "us", "eng") for i in range(5)] + [person(9, "de", "eng")])
+    employees = company.get_employees_sharded(Pool())
+    assert len(employees) == 4
+    assert company.section_status["employees"] == "partial"
+    assert "facetGeoRegion=us" in company.section_errors["employees"]
+    assert "employees" in company.failed_sections
+
+
+def test_employees_outside_every_shard_are_picked_up_by_an_unfiltered_pass():
+    company = FakeCompany([person(1, "us"), person(2, "de"), person(3, None)])
+    company.headcount = 3
+    employees = company.get_employees_sharded(Pool(), shards=["us", "de"])
+    assert len(employees) == 3
+    assert company.queries[-1] == {}
+    assert company.section_status["employees"] == "complete"
+
+
+def test_falling_short_of_the_headcount_is_partial():
+    company = FakeCompany([person(1, "us"), person(2, "de")])
+    company.headcount = 10
+    employees = company.get_employees_sharded(Pool(), shards=["us", "de"])
+    assert len(employees) == 2
+    assert company.section_status["employees"] == "partial"
+    assert company.section_errors["employees"] == "2 of 10 employees enumerated"
+
+
+def test_driver_pool_hands_each_driver_to_one_user():
+    pool = DriverPool(["a", "b"])
+    with pool.acquire() as first, pool.acquire() as second:
+        assert {first, second} == {"a", "b"}
+        with pytest.raises(queue.Empty):
+            with pool.acquire(timeout=0.01):
+                pass
+    with pool.acquire(timeout=0.01) as driver:
+        assert driver in ("a", "b")
+
+
+def refreshed(previous_employees, employees, headcount):
+    previous = FakeCompany([])
+    previous.employees = previous_employees
+    previous.headcount = len(previous_employees)
+    previous.section_status = {"employees": "complete"}
+    current = FakeCompany([])
+    current.headcount = headcount
+    current.iter_employees = lambda wait_time=10: (employee for employee in employees)
+    return current.refresh_employees(previous, sample_size=2), current.employees_reused
+
+
+def test_refresh_employees_reuses_an_unchanged_list():
+    employees = [{"linkedin_url": f"https://www.linkedin.com/in/{i}/"} for i in range(5)]
+    assert refreshed(employees[:4], employees, headcount=4) == (employees[:4], True)
+    # a new hire at the top of the list
+    assert refreshed(employees[1:], employees, headcount=4) == (employees, False)
+    # the same first page, but the headcount moved
+    assert refreshed(employees[:4], employees, headcount=5) == (employees, False)
@@ -0,0 +1,103 @@
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+
+from linkedin_scraper import connections
+from linkedin_scraper.objects import Contact, Scraper
+
+
+class Element(object):
+    def __init__(self, text="", href=None, children=None):
+        self.text = text
+        self.href = href
+        self.children = children or {}
+
+    def find_element(self, by, name):
+        if name not in self.children:
+            raise NoSuchElementException(name)
+        return self.children[name]
+
+    def get_attribute(self, name):
+        return self.href
+
+
+def card(i, broken=False):
+    details = Element(children={
+        "mn-connection-card__name": Element(f" Person {i} "),
+        "mn-connection-card__occupation": Element("Engineer"),
+    })
+    children = {"mn-connection-card__details": details}
+    if not broken:
+        children["mn-connection-card__link"] = Element(href=f"https://www.linkedin.com/in/{i}/")
+    return Element(children=children)
+
+
+class Driver(object):
+    """A connections page that loads `batches` of cards, one batch per scroll."""
+
+    def __init__(self, *batches, session_id="session"):
+        self.session_id = session_id
+        self.batches = list(batches)
+        self.cards = []
+        self.current_url = None
+        self.loads = 0
+
+    def get(self, url):
+        self.loads += 1
+        self.current_url = url
+        self.cards = list(self.batches[0]) if self.batches else []
+
+    def find_element(self, by, name):
+        if name == "mn-connections":
+            return self
+        raise NoSuchElementException(name)
+
+    def find_elements(self, by, name):
+        return list(self.cards)
+
+    def execute_script(self, script, *args):
+        if "scrollTo" in script:
+            loaded = len(self.batches[0]) if self.batches else 0
+            for batch in self.batches[1:]:
+                if len(self.cards) == loaded:
+                    self.cards.extend(batch)
+                    break
+                loaded += len(batch)
+            return None
+        return ["", ""]
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(Scraper, "pacer", mock.Mock(acquire=lambda url, deadline=None: 0))
+    monkeypatch.setattr(connections, "time", SimpleNamespace(sleep=lambda seconds: None, time=lambda: clock.now))
+    connections.clear_connections_cache()
+    yield clock
+    connections.clear_connections_cache()
+
+
+def test_iter_connections_scrolls_until_no_more_cards_load():
+    driver = Driver([card(1), card(2, broken=True)], [card(3)])
+    contacts = list(connections.iter_connections(driver, patience=1))
+    assert contacts == [
+        Contact(name="Person 1", occupation="Engineer", url="https://www.linkedin.com/in/1/"),
+        Contact(name="Person 3", occupation="Engineer", url="https://www.linkedin.com/in/3/"),
+    ]
+
+
+def test_get_connections_is_memoized_per_session(clock):
+    driver = Driver([card(1)])
+    assert len(connections.get_connections(driver, ttl=60)) == 1
+    driver.batches = [[card(1), card(2)]]
+    assert len(connections.get_connections(driver, ttl=60)) == 1
+    assert len(connections.get_connections(Driver([card(1), card(2)], session_id="other"))) == 2
+    assert driver.loads == 1
+
+    clock.now += 61
+    assert len(connections.get_connections(driver, ttl=60)) == 2
+    connections.clear_connections_cache(driver)
+    connections.get_connections(driver, ttl=60)
+    assert driver.loads == 3
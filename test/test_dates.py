@@ -0,0 +1,54 @@
+import datetime
+
+import pytest
+
+from linkedin_scraper.dates import is_date_line, normalize_records, parse_date_range
+from linkedin_scraper.objects import Experience
+
+TODAY = datetime.date(2026, 10, 19)
+
+
+def test_closed_month_range():
+    dates = parse_date_range("Jan 2020 - Mar 2021 · 1 yr 3 mos")
+    assert (dates.from_date, dates.to_date, dates.duration) == ("Jan 2020", "Mar 2021", "1 yr 3 mos")
+    assert (dates.start, dates.end, dates.is_current) == (datetime.date(2020, 1, 1), datetime.date(2021, 3, 1), False)
+    assert dates.duration_months == 15
+
+
+def test_duration_is_computed_for_month_ranges():
+    assert parse_date_range("Sept 2019 - March 2020").duration_months == 7
+    assert parse_date_range("2015 - 2019").duration_months is None
+
+
+def test_open_range_is_counted_up_to_today():
+    assert parse_date_range("Jan 2020 - Present · 3 yrs 2 mos", today=TODAY).duration_months == 38
+    dates = parse_date_range("Jan 2026 - Present", today=TODAY)
+    assert dates.is_current and dates.end is None
+    assert dates.duration_months == 10
+    assert parse_date_range("2015 - Present", today=TODAY).duration_months is None
+
+
+@pytest.mark.parametrize("text", ["Joined 2012", "Engineer 2020", "Mai 2020", "Berlin, Germany"])
+def test_other_text_is_not_a_date(text):
+    dates = parse_date_range(text)
+    assert dates.start is None and dates.end is None
+    assert not is_date_line(text)
+
+
+@pytest.mark.parametrize("text", ["Jan 2020 - Present · 3 yrs 2 mos", "2015 - 2019", "2 yrs 3 mos", "May 2021"])
+def test_date_lines(text):
+    assert is_date_line(text)
+
+
+def test_duration_only():
+    dates = parse_date_range("2 yrs 3 mos")
+    assert (dates.duration, dates.duration_months, dates.start) == ("2 yrs 3 mos", 27, None)
+    assert parse_date_range(None) == parse_date_range("")
+
+
+def test_normalize_records():
+    experience = Experience(from_date="Feb 2018", to_date="Jan 2019", duration="1 yr")
+    normalize_records([experience])
+    assert (experience.start_date, experience.end_date, experience.duration_months) == (
+        datetime.date(2018, 2, 1), datetime.date(2019, 1, 1), 12,
+    )
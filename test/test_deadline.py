@@ -0,0 +1,49 @@
+import time
+
+import pytest
+
+from linkedin_scraper.deadline import Deadline, DeadlineExceeded
+from linkedin_scraper.objects import Scraper
+
+
+class Sections(Scraper):
+    SECTION_FIELDS = {"fast": (), "slow": (), "late": ()}
+
+
+def test_of():
+    deadline = Deadline(5)
+    assert Deadline.of(deadline) is deadline
+    assert Deadline.of(None) is None
+    assert Deadline.of(5).seconds == 5
+
+
+def test_timeout_is_capped_by_the_remaining_time():
+    deadline = Deadline(5)
+    assert deadline.timeout(1) == 1
+    assert 4 < deadline.timeout(10) <= 5
+    deadline.check()
+
+
+def test_expired():
+    deadline = Deadline(0)
+    assert deadline.expired()
+    assert deadline.remaining() == 0
+    assert deadline.timeout(10) == 0
+    with pytest.raises(DeadlineExceeded):
+        deadline.check()
+
+
+def test_sections_after_the_deadline_are_skipped():
+    scraper = Sections()
+    scraper.deadline = Deadline(0.05)
+
+    def slow():
+        time.sleep(0.1)
+        raise TimeoutError("still loading")
+
+    scraper._run_section("fast", lambda: None)
+    scraper._run_section("slow", slow)
+    scraper._run_section("late", lambda: None)
+    assert scraper.section_status == {"fast": "complete", "slow": "timeout", "late": "skipped"}
+    assert not scraper.complete
+    assert scraper.failed_sections == ["slow", "late"]
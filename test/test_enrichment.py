@@ -0,0 +1,89 @@
+from types import SimpleNamespace
+
+import pytest
+
+from linkedin_scraper import enrichment
+from linkedin_scraper.enrichment import CompanyEnricher
+from linkedin_scraper.objects import Experience
+from linkedin_scraper.page_state import AuthWallError, NotFoundError
+
+GOOGLE = "https://www.linkedin.com/company/google/"
+GONE = "https://www.linkedin.com/company/gone/"
+
+
+class Company(object):
+    calls = []
+    failures = {}
+    # url -> section errors of an about page that failed part way
+    partial = {}
+
+    def __init__(self, linkedin_url, sections=None, **kwargs):
+        assert sections == ["about"]
+        Company.calls.append(linkedin_url)
+        if linkedin_url in Company.failures:
+            raise Company.failures.pop(linkedin_url)
+        self.website = "https://google.com"
+        self.industry = "Software"
+        self.company_type = self.headquarters = self.company_size = self.founded = None
+        self.section_errors = Company.partial.pop(linkedin_url, {})
+        self.section_status = {"about": "failed" if self.section_errors else "complete"}
+
+
+@pytest.fixture(autouse=True)
+def fake_company(monkeypatch):
+    Company.calls = []
+    Company.failures = {}
+    Company.partial = {}
+    monkeypatch.setattr(enrichment, "Company", Company)
+
+
+def people(*urls):
+    return [SimpleNamespace(experiences=[Experience(linkedin_url=url) for url in urls], educations=[])]
+
+
+def test_each_company_is_scraped_once(tmp_path):
+    enricher = CompanyEnricher(None, path=str(tmp_path / "companies.db"))
+    enriched = enricher.enrich(people(GOOGLE, GOOGLE + "?trk=x") + people(GOOGLE))
+    assert Company.calls == [GOOGLE]
+    assert {experience.industry for person in enriched for experience in person.experiences} == {"Software"}
+
+    # a new enricher on the same file hits the disk cache
+    CompanyEnricher(None, path=str(tmp_path / "companies.db")).enrich(people(GOOGLE))
+    assert Company.calls == [GOOGLE]
+
+
+def test_failures_are_recorded_and_not_cached():
+    enricher = CompanyEnricher(None)
+    Company.failures[GOOGLE] = TimeoutError("slow page")
+    Company.failures[GONE] = NotFoundError(GONE)
+    person = enricher.enrich(people(GOOGLE, GONE))[0]
+
+    assert person.experiences[0].industry is None
+    assert enricher.errors == {GOOGLE: "TimeoutError: slow page", GONE: f"NotFoundError: not_found: {GONE}"}
+
+    person = enricher.enrich(people(GOOGLE))[0]
+    assert person.experiences[0].industry == "Software"
+    assert Company.calls == [GOOGLE, GONE, GOOGLE]
+    assert GOOGLE not in enricher.errors
+
+
+def test_partly_read_about_pages_are_recorded_and_not_cached():
+    enricher = CompanyEnricher(None)
+    Company.partial[GOOGLE] = {"about": "StaleElementReferenceException: stale element"}
+    person = enricher.enrich(people(GOOGLE))[0]
+
+    # what was read is used, but not kept
+    assert person.experiences[0].industry == "Software"
+    assert enricher.errors == {GOOGLE: "about: StaleElementReferenceException: stale element"}
+    assert enricher.cache.get(GOOGLE) is None
+
+    enricher.enrich(people(GOOGLE))
+    assert Company.calls == [GOOGLE, GOOGLE]
+    assert enricher.errors == {}
+    assert enricher.cache.get(GOOGLE)["industry"] == "Software"
+
+
+def test_session_errors_are_raised():
+    Company.failures[GOOGLE] = AuthWallError(GOOGLE)
+    with pytest.raises(AuthWallError):
+        CompanyEnricher(None).enrich(people(GOOGLE))
@@ -0,0 +1,53 @@
+import csv
+import gzip
+import json
+
+import pytest
+
+from linkedin_scraper.export import CSVWriter, NDJSONWriter, export, to_dict
+from linkedin_scraper.objects import Experience
+from linkedin_scraper.person import Person
+
+EMPLOYEES = [
+    {"name": "Alice", "designation": "Engineer", "linkedin_url": "https://www.linkedin.com/in/alice/"},
+    None,
+    {"name": "Bob", "designation": "Sales", "linkedin_url": "https://www.linkedin.com/in/bob/"},
+]
+
+
+def test_to_dict():
+    person = Person("https://www.linkedin.com/in/alice/", "Alice", driver=object(), get=False, scrape=False)
+    person.experiences = [Experience(position_title="Engineer")]
+    row = to_dict(person)
+    assert row["name"] == "Alice"
+    assert row["experiences"][0]["position_title"] == "Engineer"
+    assert to_dict(Experience(position_title="Engineer"))["position_title"] == "Engineer"
+    with pytest.raises(TypeError):
+        to_dict(object())
+
+
+def test_ndjson_is_appended_and_gzipped(tmp_path):
+    path = str(tmp_path / "employees.ndjson.gz")
+    assert export(EMPLOYEES[:1], path) == 1
+    with NDJSONWriter(path) as writer:
+        assert writer.write_many(EMPLOYEES[1:]) == 1
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        assert [json.loads(line)["name"] for line in f] == ["Alice", "Bob"]
+
+
+def test_csv_header_is_written_once(tmp_path):
+    path = str(tmp_path / "employees.csv")
+    export(EMPLOYEES[:1], path)
+    with CSVWriter(path) as writer:
+        writer.write({"name": "Bob", "designation": ["Sales", "Support"], "linkedin_url": None})
+    with open(path, encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["name"] for row in rows] == ["Alice", "Bob"]
+    assert json.loads(rows[1]["designation"]) == ["Sales", "Support"]
+
+
+def test_csv_columns(tmp_path):
+    path = str(tmp_path / "employees.csv")
+    export(EMPLOYEES, path, columns=["name"])
+    with open(path, encoding="utf-8") as f:
+        assert f.read().split() == ["name", "Alice", "Bob"]
@@ -0,0 +1,106 @@
+from types import SimpleNamespace
+
+import pytest
+
+from linkedin_scraper import frontier as frontier_module
+from linkedin_scraper.frontier import BloomFilter, Frontier, SeenSet, crawl
+from linkedin_scraper.page_state import AuthWallError, NotFoundError
+from linkedin_scraper.urls import canonicalize_url, job_id_from_url, url_kind
+
+GOOGLE = "https://www.linkedin.com/company/google/"
+ALICE = "https://www.linkedin.com/in/alice/"
+BOB = "https://www.linkedin.com/in/bob/"
+
+
+def test_canonicalize_url_maps_every_form_to_one_url():
+    assert canonicalize_url("linkedin.com/in/Alice?trk=x") == ALICE
+    assert canonicalize_url("https://de.linkedin.com/in/alice#about") == ALICE
+    assert canonicalize_url("https://www.linkedin.com/jobs/view/engineer-at-acme-123/?refId=1") == (
+        "https://www.linkedin.com/jobs/view/123/"
+    )
+
+
+def test_job_id_from_url():
+    assert job_id_from_url("https://www.linkedin.com/jobs/search/?currentJobId=42&keywords=x") == "42"
+    assert job_id_from_url("https://www.linkedin.com/jobs/view/42/") == "42"
+    assert job_id_from_url(ALICE) is None
+
+
+def test_url_kind_requires_a_linkedin_host():
+    assert url_kind(ALICE) == "person"
+    assert url_kind("https://in.linkedin.com/school/mit") == "company"
+    assert url_kind("https://www.linkedin.com/jobs/view/42/") == "job"
+    assert url_kind("https://linkedin.com/company/google") == "company"
+    assert url_kind("https://example.com/in/alice") is None
+    assert url_kind("https://example.com/company/google") is None
+    assert url_kind("https://example.com/jobs/view/42/") is None
+    assert url_kind("https://notlinkedin.com/in/alice") is None
+    assert url_kind("https://www.linkedin.com/feed/") is None
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    urls = [f"https://www.linkedin.com/in/{i}/" for i in range(1000)]
+    for url in urls:
+        bloom.add(url)
+    assert all(url in bloom for url in urls)
+    false_positives = sum(f"https://www.linkedin.com/in/other-{i}/" in bloom for i in range(1000))
+    assert false_positives < 50
+
+
+def test_seen_set_persists(tmp_path):
+    path = str(tmp_path / "seen.db")
+    seen = SeenSet(path, capacity=100)
+    assert seen.add(ALICE)
+    assert not seen.add(ALICE)
+    seen.close()
+    seen = SeenSet(path, capacity=100)
+    assert ALICE in seen and BOB not in seen
+
+
+def test_frontier_skips_duplicates_off_site_and_too_deep_urls():
+    frontier = Frontier([ALICE, "https://www.linkedin.com/in/Alice?trk=x", "https://example.com/in/alice"], max_depth=1)
+    assert len(frontier) == 1
+    assert not frontier.push(BOB, depth=2)
+    assert frontier.push(GOOGLE, depth=1)
+    assert frontier.pop() == (ALICE, "person", 0)
+    assert frontier.pop() == (GOOGLE, "company", 1)
+
+
+class Person(object):
+    failures = {}
+
+    def __init__(self, linkedin_url, **kwargs):
+        if linkedin_url in Person.failures:
+            raise Person.failures[linkedin_url]
+        self.linkedin_url = linkedin_url
+        self.experiences = [SimpleNamespace(linkedin_url=GOOGLE)]
+
+
+class Company(object):
+    def __init__(self, linkedin_url, get_employees=False, **kwargs):
+        self.linkedin_url = linkedin_url
+        self.employees = [{"linkedin_url": BOB}] if get_employees else []
+
+
+@pytest.fixture(autouse=True)
+def fake_scrapers(monkeypatch):
+    Person.failures = {}
+    monkeypatch.setattr(frontier_module, "Person", Person)
+    monkeypatch.setattr(frontier_module, "Company", Company)
+
+
+def test_crawl_expands_breadth_first_and_records_errors():
+    Person.failures = {BOB: NotFoundError("gone")}
+    items = list(crawl(Frontier([ALICE], max_depth=2), driver=None))
+    assert [(item.kind, item.url) for item in items] == [("person", ALICE), ("company", GOOGLE), ("person", BOB)]
+    assert items[0].ok and items[0].result.linkedin_url == ALICE
+    assert not items[2].ok and items[2].error.startswith("NotFoundError")
+
+
+def test_crawl_stops_at_an_auth_wall():
+    Person.failures = {ALICE: AuthWallError("login")}
+    frontier = Frontier([ALICE, BOB])
+    items = list(crawl(frontier, driver=None))
+    assert len(items) == 1 and items[0].error.startswith("AuthWallError")
+    assert len(frontier) == 1
@@ -0,0 +1,178 @@
+from unittest import mock
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from linkedin_scraper.job_index import JobIndex
+from linkedin_scraper.job_search import JobSearch, _CLICK
+from linkedin_scraper.jobs import JOB_SNAPSHOT, Job
+from linkedin_scraper.objects import Scraper
+from linkedin_scraper.page_state import NotFoundError, RateLimitedError
+
+SEARCH = "https://www.linkedin.com/jobs/search/?keywords=engineer"
+
+
+def job_url(job_id):
+    return f"https://www.linkedin.com/jobs/view/{job_id}/"
+
+
+def snapshot(url):
+    return {
+        "job_title": f"Engineer {url}",
+        "job_url": url,
+        "company": "Acme",
+        "company_linkedin_url": "https://www.linkedin.com/company/acme/",
+        "primary_descriptions": ["Berlin", "·", "Reposted", "2 days ago"],
+        "applicant_count": None,
+        "job_description": "About the job\nBuild things",
+        "benefits": None,
+    }
+
+
+class Card(object):
+    def __init__(self, url):
+        self.url = url
+
+    def find_element(self, by, name):
+        return self
+
+
+class Driver(object):
+    """Search page whose detail pane shows the last clicked card; `get` opens a job page."""
+
+    def __init__(self, unclickable=(), missing=(), rate_limited=()):
+        self.current_url = SEARCH
+        self.unclickable = unclickable
+        self.missing = missing
+        self.rate_limited = rate_limited
+        self.shown = None
+        self.loaded = []
+
+    def find_element(self, by, name):
+        return "pane"
+
+    def get(self, url):
+        self.loaded.append(url)
+        self.current_url = url
+        if url in self.missing:
+            self.current_url = "https://www.linkedin.com/404/"
+        if url in self.rate_limited:
+            self.current_url = "https://www.linkedin.com/429/"
+
+    def execute_script(self, script, *args):
+        if script is _CLICK:
+            if args[0].url in self.unclickable:
+                raise WebDriverException("element click intercepted")
+            self.shown = args[0].url
+        elif script is JOB_SNAPSHOT:
+            return snapshot(self.shown if args[0] == "pane" else self.current_url)
+        else:
+            return ["", ""]
+
+
+@pytest.fixture(autouse=True)
+def no_pacing(monkeypatch):
+    monkeypatch.setattr(Scraper, "pacer", mock.Mock(acquire=lambda url, deadline=None: 0))
+    with mock.patch.object(Job, "is_signed_in", return_value=True), mock.patch.object(Job, "focus"), \
+            mock.patch.object(Job, "wait_for_element_to_load"):
+        yield
+
+
+def test_job_reads_every_field_from_one_snapshot():
+    driver = Driver()
+    job = Job(job_url(1), driver=driver, close_on_complete=False)
+    assert job.job_title == f"Engineer {job_url(1)}"
+    assert (job.location, job.posted_date, job.applicant_count) == ("Berlin", "2 days ago", 0)
+    assert job.job_description == "About the job\nBuild things"
+    assert driver.loaded == [job_url(1)]
+
+
+def search_results(driver, *ids):
+    jobs = [Job(job_url(job_id), driver=driver, scrape=False) for job_id in ids]
+    return jobs, [Card(job.linkedin_url) for job in jobs]
+
+
+def test_hydrate_reads_the_pane_and_falls_back_per_job():
+    driver = Driver(unclickable=(job_url(2), job_url(3)), missing=(job_url(3),))
+    jobs, cards = search_results(driver, 1, 2, 3)
+    fallback = JobSearch(driver, scrape=False).hydrate(jobs, cards)
+
+    assert fallback == jobs[1:]
+    assert driver.loaded == [job_url(2), job_url(3)]
+    assert [job.section_status["details"] for job in jobs] == ["complete", "complete", "failed"]
+    assert jobs[0].job_title == f"Engineer {job_url(1)}"
+    assert jobs[2].section_errors["details"].startswith("NotFoundError")
+
+
+def test_hydrate_stops_at_rate_limiting():
+    driver = Driver(unclickable=(job_url(1),), rate_limited=(job_url(1),))
+    jobs, cards = search_results(driver, 1, 2)
+    with pytest.raises(RateLimitedError):
+        JobSearch(driver, scrape=False).hydrate(jobs, cards)
+
+
+def test_hydrate_gives_the_pane_time_to_render():
+    driver = Driver()
+    search = JobSearch(driver, scrape=False)
+    jobs, cards = search_results(driver, 1)
+    with mock.patch.object(JobSearch, "_wait_until", return_value=snapshot(job_url(1))) as wait:
+        search.hydrate(jobs, cards)
+    assert wait.call_args.kwargs["timeout"] == JobSearch.PANE_TIMEOUT
+
+
+def test_job_index(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    index = JobIndex(path)
+    index.record([("1", job_url(1)), ("2", job_url(2))], "engineer", seen_at=100)
+    index.record([("2", job_url(2))], "engineer", seen_at=200)
+    assert index.known(["1", "3", "1"]) == {"1"}
+    assert index.known([]) == set()
+    assert index.get("2")["first_seen"] == 100 and index.get("2")["last_seen"] == 200
+    assert index.get("3") is None
+    index.close()
+    assert len(JobIndex(path)) == 2 and "1" in JobIndex(path)
+
+
+def watcher(pages, unhydrated=()):
+    driver = Driver()
+    search = JobSearch(driver, scrape=False)
+    loads = []
+
+    def load(search_term, start=0):
+        loads.append(start)
+        return search_results(driver, *pages[start // JobSearch.PAGE_SIZE]) if start // JobSearch.PAGE_SIZE < len(pages) else ([], [])
+
+    def hydrate(jobs, cards):
+        for job in jobs:
+            job.section_status["details"] = "failed" if job_id(job) in unhydrated else "complete"
+
+    search._load_search_page = load
+    search.hydrate = hydrate
+    return search, loads
+
+
+def job_id(job):
+    return job.linkedin_url.rstrip("/").rsplit("/", 1)[1]
+
+
+def test_watch_returns_new_postings_and_stops_at_a_page_without_any(tmp_path):
+    index = JobIndex(str(tmp_path / "jobs.db"))
+    search, loads = watcher([["1", "2"], ["3", "4"], ["5"]])
+    assert [job_id(job) for job in search.watch("engineer", index)] == ["1", "2", "3", "4", "5"]
+    assert len(index) == 5
+
+    search, loads = watcher([["6", "1"], ["2", "3"], ["4", "5"]])
+    assert [job_id(job) for job in search.watch("engineer", index)] == ["6"]
+    assert loads == [0, JobSearch.PAGE_SIZE]
+    assert "6" in index
+
+
+def test_watch_tries_unhydrated_postings_again(tmp_path):
+    index = JobIndex(str(tmp_path / "jobs.db"))
+    search, _ = watcher([["1", "2"]], unhydrated=("2",))
+    assert [job_id(job) for job in search.watch("engineer", index)] == ["1", "2"]
+    assert index.known(["1", "2"]) == {"1"}
+
+    search, _ = watcher([["1", "2"]])
+    assert [job_id(job) for job in search.watch("engineer", index)] == ["2"]
+    assert "2" in index
@@ -0,0 +1,112 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from linkedin_scraper import pacing
+from linkedin_scraper.deadline import Deadline, DeadlineExceeded
+from linkedin_scraper.pacing import Pacer, default_pacer, navigate, pacing_key
+
+PERSON = "https://www.linkedin.com/in/someone/"
+
+
+def test_pacing_key():
+    assert pacing_key(PERSON) == "www.linkedin.com:person"
+    assert pacing_key("https://www.linkedin.com/feed/") == "www.linkedin.com:other"
+
+
+def test_burst_then_steady_rate():
+    pacer = Pacer(rates={"person": 2.0}, burst=2)
+    assert pacer.reserve(PERSON) == 0
+    assert pacer.reserve(PERSON) == 0
+    assert pacer.reserve(PERSON) == pytest.approx(0.5, abs=0.05)
+    assert pacer.reserve(PERSON) == pytest.approx(1.0, abs=0.05)
+
+
+def test_throttled_blocks_and_slows_down():
+    pacer = Pacer(rates={"person": 1.0}, burst=1, cooldown=60)
+    assert pacer.throttled(PERSON) == 0.5
+    assert pacer.reserve(PERSON) == pytest.approx(62, abs=0.1)
+
+
+def test_max_wait_takes_no_token():
+    pacer = Pacer(rates={"person": 1.0}, burst=1, cooldown=60)
+    pacer.throttled(PERSON)
+    assert pacer.reserve(PERSON, max_wait=5) > 5
+    assert pacer.reserve(PERSON, max_wait=5) == pytest.approx(62, abs=0.1)
+
+
+def test_acquire_raises_past_deadline_without_sleeping():
+    pacer = Pacer(burst=1, cooldown=60)
+    pacer.throttled(PERSON)
+    with pytest.raises(DeadlineExceeded):
+        pacer.acquire(PERSON, Deadline(2))
+
+
+class Driver(object):
+    def __init__(self, load_time=0):
+        self.urls = []
+        self.load_time = load_time
+        self.timeouts = SimpleNamespace(page_load=300)
+        self.page_load_timeouts = []
+
+    def set_page_load_timeout(self, seconds):
+        self.page_load_timeouts.append(seconds)
+        self.timeouts.page_load = seconds
+
+    def get(self, url):
+        if self.load_time > self.timeouts.page_load:
+            raise TimeoutException("timeout: Timed out receiving message from renderer")
+        self.urls.append(url)
+
+
+def test_navigate_does_not_load_past_deadline():
+    pacer = Pacer(burst=1, cooldown=60)
+    pacer.throttled(PERSON)
+    driver = Driver()
+    with pytest.raises(DeadlineExceeded):
+        navigate(driver, PERSON, pacer, check=False, deadline=Deadline(2))
+    assert driver.urls == []
+
+
+def test_navigate_cuts_the_page_load_timeout_to_the_deadline():
+    driver = Driver()
+    navigate(driver, PERSON, check=False, deadline=Deadline(10))
+    assert driver.urls == [PERSON]
+    assert 9 < driver.page_load_timeouts[0] <= 10
+    assert driver.timeouts.page_load == 300
+
+    driver = Driver(load_time=60)
+    with pytest.raises(DeadlineExceeded):
+        navigate(driver, PERSON, check=False, deadline=Deadline(10))
+    assert driver.timeouts.page_load == 300
+
+
+def test_navigate_without_a_deadline_keeps_the_page_load_timeout():
+    driver = Driver()
+    navigate(driver, PERSON, check=False)
+    assert driver.page_load_timeouts == []
+
+
+def test_buckets_shared_through_file(tmp_path):
+    path = str(tmp_path / "pacing.db")
+    first, second = Pacer(path, burst=1), Pacer(path, burst=1)
+    assert first.reserve(PERSON) == 0
+    assert second.reserve(PERSON) > 0
+    first.close()
+    second.close()
+
+
+def test_default_pacer_is_built_lazily_per_process(tmp_path, monkeypatch):
+    path = str(tmp_path / "pacing.db")
+    monkeypatch.setattr(pacing, "_default", None)
+    monkeypatch.setenv("LINKEDIN_SCRAPER_PACING", path)
+    assert default_pacer().path == path
+    assert default_pacer() is default_pacer()
+
+    # a forked worker gets its own pacer on the same file
+    parent = default_pacer()
+    monkeypatch.setattr(os, "getpid", lambda: -1)
+    assert default_pacer() is not parent
+    assert default_pacer().path == path
@@ -0,0 +1,85 @@
+import pytest
+
+from linkedin_scraper import runner
+from linkedin_scraper.page_state import (
+    AUTH_WALL, CHECKPOINT, NOT_FOUND, OK, RATE_LIMITED,
+    AuthWallError, NotFoundError, _SNAPSHOT, check_page, classify_page, classify_url,
+)
+from linkedin_scraper.work_queue import PENDING, SQLiteWorkQueue
+
+PROFILE = "https://www.linkedin.com/in/someone/"
+
+
+class Driver(object):
+    def __init__(self, url=PROFILE, title="", text="", found=None, main=True):
+        self.current_url = url
+        self.title = title
+        self.text = text
+        self.found = found
+        self.main = main
+
+    def execute_script(self, script, *args):
+        assert script is _SNAPSHOT
+        assert ["#captcha-internal", CHECKPOINT] in args[0]
+        return [self.title, self.found, self.main, self.text]
+
+
+@pytest.mark.parametrize("url, state", [
+    (PROFILE, None),
+    ("https://www.linkedin.com/checkpoint/challenge/123", CHECKPOINT),
+    ("https://www.linkedin.com/authwall?trk=x", AUTH_WALL),
+    ("https://www.linkedin.com/in/unavailable/", NOT_FOUND),
+    ("https://www.linkedin.com/429", RATE_LIMITED),
+])
+def test_classify_url(url, state):
+    assert classify_url(url) == state
+
+
+@pytest.mark.parametrize("title, text, main, state", [
+    ("Someone | LinkedIn", "Experience", True, OK),
+    ("Too Many Requests", "", False, RATE_LIMITED),
+    ("", "HTTP ERROR 429", False, RATE_LIMITED),
+    ("LinkedIn", "This page doesn't exist", False, NOT_FOUND),
+    ("Sign Up | LinkedIn", "", False, AUTH_WALL),
+    # a profile may mention joining LinkedIn without being an auth wall
+    ("Someone | LinkedIn", "Join LinkedIn to see more", True, OK),
+    # ordinary pages that mention a marker
+    ("Security Verification Engineer | Acme | LinkedIn", "Security Verification Engineer", True, OK),
+    ("Someone | LinkedIn", "I fix too many requests per second", True, OK),
+    ("Page Not Found Handling - Jobs | LinkedIn", "", True, OK),
+])
+def test_classify_page(title, text, main, state):
+    assert classify_page(Driver(title=title, text=text, main=main)) == state
+
+
+@pytest.mark.parametrize("found, state", [(CHECKPOINT, CHECKPOINT), (AUTH_WALL, AUTH_WALL), (None, OK)])
+def test_classify_page_by_dom_markers(found, state):
+    assert classify_page(Driver(title="LinkedIn", found=found)) == state
+
+
+def test_snapshot_reads_rendered_text_only():
+    assert "innerText" in _SNAPSHOT
+    assert "textContent" not in _SNAPSHOT
+
+
+def test_check_page_raises_typed_errors():
+    assert check_page(Driver()) == OK
+    with pytest.raises(NotFoundError) as error:
+        check_page(Driver(url="https://www.linkedin.com/404/"), PROFILE)
+    assert error.value.url == PROFILE
+    assert error.value.retry is False
+
+
+def test_run_queue_stops_at_an_auth_wall(tmp_path, monkeypatch):
+    work_queue = SQLiteWorkQueue(str(tmp_path / "queue.db"))
+    work_queue.put_many([("person", PROFILE, None), ("person", PROFILE + "other/", None)])
+
+    def scrape_task(task, driver):
+        raise AuthWallError(task.target)
+
+    monkeypatch.setattr(runner, "scrape_task", scrape_task)
+    results = list(runner.run_queue(work_queue, driver=None, poll_interval=0))
+
+    assert [result.error for result in results] == [f"AuthWallError: auth_wall: {PROFILE}"]
+    assert work_queue.counts() == {PENDING: 2}
+    assert work_queue.lease("a").attempts == 1
@@ -0,0 +1,100 @@
+from types import SimpleNamespace
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+
+from linkedin_scraper.objects import Experience
+from linkedin_scraper.optimized_person import OptimizedPerson
+from linkedin_scraper.person import Person
+
+
+def person(cls=Person, card=True, items=2, truncated=False, **kwargs):
+    result = cls(driver=object(), get=False, scrape=False, **kwargs)
+    result.get_homepage_section = lambda section: ("card" if card else None, ["item"] * items, truncated)
+    result.parse_experiences = lambda items: result.experiences.extend(Experience() for _ in items)
+    return result
+
+
+@pytest.mark.parametrize("cls", [Person, OptimizedPerson])
+def test_short_sections_come_from_the_main_page(cls):
+    scraper = person(cls)
+    assert scraper._read_homepage_section("experience", None) is False
+    assert len(scraper.experiences) == 2
+    assert scraper.section_sources == {"experience": "homepage"}
+
+
+@pytest.mark.parametrize("cls", [Person, OptimizedPerson])
+def test_truncated_sections_need_their_detail_page(cls):
+    scraper = person(cls, items=5, truncated=True)
+    assert scraper._read_homepage_section("experience", None) is True
+    assert scraper.experiences == []
+
+
+def test_truncated_sections_keep_the_main_page_items_under_a_deadline():
+    scraper = person(items=5, truncated=True, deadline=60)
+    assert scraper._read_homepage_section("experience", None) is True
+    assert len(scraper.experiences) == 5
+
+
+def test_missing_and_forced_sections():
+    assert person(card=False)._read_homepage_section("experience", None) is False
+    assert person(detail_pages="always")._read_homepage_section("experience", None) is True
+
+
+def test_optimized_person_is_a_person():
+    scraper = OptimizedPerson("https://www.linkedin.com/in/someone/", "Someone", driver=object(), get=False, scrape=False)
+    assert isinstance(scraper, Person)
+    assert scraper.name == "Someone"
+    assert repr(scraper).startswith("<OptimizedPerson Someone")
+
+
+def test_optimized_person_waits_less():
+    assert (Person.ELEMENT_WAIT_TIMEOUT, Person.TOP_CARD_SETTLE_TIME) == (5, 5)
+    assert (OptimizedPerson.ELEMENT_WAIT_TIMEOUT, OptimizedPerson.TOP_CARD_SETTLE_TIME) == (1, 1)
+
+
+def test_optimized_person_keeps_its_homepage_readers():
+    scraper = person(OptimizedPerson)
+    scraper.parse_educations = lambda items: scraper.educations.extend(Experience() for _ in items)
+    assert scraper.get_experiences_from_homepage() is False
+    assert scraper.get_educations_from_homepage() is False
+    assert (len(scraper.experiences), len(scraper.educations)) == (2, 2)
+    assert person(OptimizedPerson, items=5, truncated=True).get_experiences_from_homepage() is True
+    assert "section_sources" in scraper.to_dict()
+
+
+class Page(object):
+    """Main profile page with a top card and the given section texts."""
+
+    def __init__(self, top_card="Someone\nEngineer", **sections):
+        self.top_card = top_card
+        self.sections = sections
+
+    def find_element(self, by, name):
+        if name == "//*[@class='mt2 relative']":
+            return SimpleNamespace(text=self.top_card)
+        if name not in self.sections:
+            raise NoSuchElementException(name)
+        return SimpleNamespace(find_element=lambda by, parent: SimpleNamespace(text=self.sections[name]))
+
+
+def fingerprinted(page, status="complete"):
+    result = Person(driver=page, get=False, scrape=False)
+    result.fingerprints = result.get_fingerprints()
+    result.section_status = {section: status for section in result.fingerprints}
+    return result
+
+
+def test_fingerprints_tell_which_sections_changed():
+    previous = fingerprinted(Page(experience="Engineer at Acme", education="MIT"))
+    assert set(previous.fingerprints) == {"top_card", "experience", "education"}
+
+    current = fingerprinted(Page(experience="Manager at Acme\n", education=" MIT "))
+    assert not current._is_unchanged("experience", previous)
+    assert current._is_unchanged("education", previous)
+    assert current._is_unchanged("top_card", previous)
+    assert not current._is_unchanged("education", None)
+
+
+def test_sections_missing_from_the_page_are_not_fingerprinted():
+    assert set(fingerprinted(Page(education="MIT")).fingerprints) == {"top_card", "education"}
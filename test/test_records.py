@@ -0,0 +1,62 @@
+import pickle
+import sys
+
+import pytest
+
+from linkedin_scraper.objects import (
+    Accomplishment, ColumnarRecords, Education, Experience, Interest, intern_records,
+)
+
+
+def test_records_have_no_instance_dict():
+    if sys.version_info < (3, 10):
+        pytest.skip("slots dataclasses need Python 3.10")
+    for record_class in (Experience, Education, Interest, Accomplishment):
+        assert not hasattr(record_class(), "__dict__")
+
+
+def test_interest_and_accomplishment_fields_are_settable():
+    interest = Interest(title="Open source")
+    interest.title = "Chess"
+    accomplishment = Accomplishment(category="Languages", title="French")
+    accomplishment.title = "German"
+    assert (interest.title, accomplishment.category, accomplishment.title) == ("Chess", "Languages", "German")
+    assert accomplishment.to_dict()["title"] == "German"
+    assert pickle.loads(pickle.dumps(interest)) == interest
+
+
+def test_intern_records():
+    experiences = intern_records([Experience(location="".join(["Ber", "lin"])) for _ in range(2)])
+    assert experiences[0].location is experiences[1].location
+
+
+def experiences(count):
+    return [Experience(institution_name=f"Company {i}", location="Berlin") for i in range(count)]
+
+
+def test_columnar_records_round_trip():
+    records = experiences(3)
+    table = ColumnarRecords.from_records(records)
+    assert len(table) == 3
+    assert table[1] == records[1]
+    assert list(table) == records
+    assert table.column("institution_name") == ["Company 0", "Company 1", "Company 2"]
+
+
+def test_columnar_records_slices():
+    records = experiences(5)
+    table = ColumnarRecords.from_records(records)
+    head = table[:2]
+    assert isinstance(head, ColumnarRecords)
+    assert list(head) == records[:2]
+    assert list(table[::-2]) == records[::-2]
+    head.append(records[4])
+    assert len(head) == 3 and len(table) == 5
+
+
+def test_columnar_dicts():
+    table = ColumnarRecords.from_dicts([{"name": "A", "extra": 1}, None, {"name": "B"}], columns=("name", "linkedin_url"))
+    assert list(table) == [{"name": "A", "linkedin_url": None}, {"name": "B", "linkedin_url": None}]
+    assert table[-1:][0] == {"name": "B", "linkedin_url": None}
+    with pytest.raises(ValueError):
+        ColumnarRecords.from_records([])
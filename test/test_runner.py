@@ -0,0 +1,58 @@
+import os
+
+from linkedin_scraper import runner
+
+
+class Driver(object):
+    def __init__(self, directory):
+        self.directory = directory
+
+    def quit(self):
+        with open(os.path.join(self.directory, str(os.getpid())), "w"):
+            pass
+
+
+class Scraper(object):
+    def __init__(self, url, driver=None, close_on_complete=True):
+        if url.endswith("broken/"):
+            raise ValueError("broken page")
+        self.url = url
+
+    def detach(self):
+        return self
+
+
+def driver_factory(directory):
+    return lambda: Driver(directory)
+
+
+def test_run_batch_yields_results_and_quits_drivers(tmp_path, monkeypatch):
+    monkeypatch.setattr(runner, "SCRAPERS", {"person": Scraper})
+    urls = [f"https://www.linkedin.com/in/{i}/" for i in range(5)] + ["https://www.linkedin.com/in/broken/"]
+    results = list(runner.run_batch(urls, kind="person", workers=2, driver_factory=driver_factory(str(tmp_path))))
+
+    assert sorted(result.url for result in results) == sorted(urls)
+    assert [result.error for result in results if not result.ok] == ["ValueError: broken page"]
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_run_batch_fails_the_tasks_of_a_driver_that_cannot_start(monkeypatch):
+    monkeypatch.setattr(runner, "SCRAPERS", {"person": Scraper})
+
+    def driver_factory():
+        raise RuntimeError("no browser")
+
+    urls = [f"https://www.linkedin.com/in/{i}/" for i in range(3)]
+    results = list(runner.run_batch(urls, kind="person", workers=2, driver_factory=driver_factory))
+    assert sorted(result.url for result in results) == urls
+    assert {result.error for result in results} == {"driver failed to start: RuntimeError: no browser"}
+
+
+def test_run_batch_stopped_early_still_quits_drivers(tmp_path, monkeypatch):
+    monkeypatch.setattr(runner, "SCRAPERS", {"person": Scraper})
+    urls = [f"https://www.linkedin.com/in/{i}/" for i in range(50)]
+    results = runner.run_batch(urls, kind="person", workers=2, driver_factory=driver_factory(str(tmp_path)))
+    next(results)
+    results.close()
+
+    assert len(os.listdir(tmp_path)) == 2
@@ -0,0 +1,91 @@
+import threading
+
+import pytest
+
+from linkedin_scraper.deadline import DeadlineExceeded
+from linkedin_scraper.pool import DriverPool
+from linkedin_scraper.scheduler import Scheduler, page_boundary
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = Scheduler(DriverPool(["driver"]))
+    yield scheduler
+    scheduler.close()
+
+
+def block(scheduler):
+    """Occupy the only driver until the returned event is set."""
+    started, release = threading.Event(), threading.Event()
+    scheduler.submit(lambda driver: (started.set(), release.wait(5)))
+    assert started.wait(5)
+    return release
+
+
+def test_priority_then_tenant_turns_then_earliest_deadline(scheduler):
+    release = block(scheduler)
+    order = []
+
+    def run(driver, name):
+        order.append(name)
+
+    futures = [
+        scheduler.submit(run, "bulk", priority="bulk"),
+        scheduler.submit(run, "a-late", tenant="a", deadline=60),
+        scheduler.submit(run, "a-early", tenant="a", deadline=30),
+        scheduler.submit(run, "a-none", tenant="a"),
+        scheduler.submit(run, "b", tenant="b"),
+        scheduler.submit(run, "interactive", priority="interactive"),
+    ]
+    release.set()
+    for future in futures:
+        future.result(5)
+    assert order == ["interactive", "a-early", "b", "a-late", "a-none", "bulk"]
+
+
+def test_tasks_whose_deadline_passes_in_the_queue_fail(scheduler):
+    release = block(scheduler)
+    future = scheduler.submit(lambda driver: "too late", deadline=0)
+    release.set()
+    with pytest.raises(DeadlineExceeded):
+        future.result(5)
+    assert scheduler.stats()["expired"] == 1
+
+
+def test_page_boundary_runs_more_urgent_tasks_on_the_same_driver(scheduler):
+    started, queued, urgent = threading.Event(), threading.Event(), []
+
+    def enumerate_pages(driver):
+        started.set()
+        assert queued.wait(5)
+        return page_boundary(driver)
+
+    bulk = scheduler.submit(enumerate_pages, priority="bulk")
+    assert started.wait(5)
+    interactive = scheduler.submit(lambda driver: urgent.append(driver), priority="interactive")
+    queued.set()
+    assert bulk.result(5) is True
+    interactive.result(5)
+    assert urgent == ["driver"]
+    assert scheduler.stats()["preemptions"] == 1
+
+
+def test_page_boundary_outside_the_scheduler():
+    assert page_boundary("driver") is False
+
+
+def test_stats(scheduler):
+    release = block(scheduler)
+    scheduler.submit(lambda driver: None, priority="bulk", tenant="crawler")
+    stats = scheduler.stats()
+    assert stats["queued"] == 1
+    assert stats["depth"]["bulk"] == 1
+    assert stats["tenants"] == {"crawler": 1}
+    assert stats["running"] == 1
+    release.set()
+
+
+def test_closed_scheduler_rejects_tasks(scheduler):
+    scheduler.close()
+    with pytest.raises(RuntimeError):
+        scheduler.submit(lambda driver: None)
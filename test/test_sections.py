@@ -0,0 +1,140 @@
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+
+from linkedin_scraper import runner
+from linkedin_scraper.company import Company
+from linkedin_scraper.objects import Scraper
+from linkedin_scraper.page_state import AuthWallError
+from linkedin_scraper.person import Person
+from linkedin_scraper.work_queue import DONE, SQLiteWorkQueue
+
+
+class Sections(Scraper):
+    SECTION_FIELDS = {"items": ("items",)}
+    section_backoff = 0
+
+    def __init__(self):
+        self.items = []
+
+
+def test_run_section_retries_from_the_section_snapshot():
+    scraper = Sections()
+    calls = []
+
+    def fill():
+        calls.append(1)
+        scraper.items.append(len(calls))
+        if len(calls) < 2:
+            raise StaleElementReferenceException("re-rendered")
+        return "done"
+
+    assert scraper._run_section("items", fill) == "done"
+    assert scraper.items == [2]
+    assert scraper.section_status == {"items": "complete"}
+    assert scraper.failed_sections == []
+
+
+def test_run_section_records_failures():
+    scraper = Sections()
+
+    def fail():
+        raise ValueError("bad layout")
+
+    assert scraper._run_section("items", fail) is None
+    assert scraper.section_status == {"items": "failed"}
+    assert scraper.section_errors["items"] == "ValueError: bad layout"
+    assert scraper.failed_sections == ["items"]
+
+
+def test_run_section_raises_page_state_errors():
+    scraper = Sections()
+
+    def wall():
+        raise AuthWallError("https://www.linkedin.com/in/someone/")
+
+    with pytest.raises(AuthWallError):
+        scraper._run_section("items", wall)
+
+
+def person(status):
+    result = Person(driver=object(), get=False, scrape=False)
+    result.fingerprints = {"experience": "abc"}
+    result.section_status = {"experience": status}
+    return result
+
+
+@pytest.mark.parametrize("status, unchanged", [("complete", True), ("failed", False), ("timeout", False), ("skipped", False)])
+def test_person_reuses_only_completed_sections(status, unchanged):
+    assert person("complete")._is_unchanged("experience", person(status)) is unchanged
+
+
+def company(employees, status):
+    result = Company.__new__(Company)
+    result.headcount = len(employees)
+    result.employees = employees
+    result.section_status = {"employees": status}
+    return result
+
+
+@pytest.mark.parametrize("status, reused", [("complete", True), ("timeout", False)])
+def test_company_reuses_only_complete_employees(status, reused):
+    employees = [{"linkedin_url": f"https://www.linkedin.com/in/{i}/"} for i in range(20)]
+    previous = company(employees[:15], status)
+    current = company(employees, "complete")
+    current.headcount = 15
+    current.iter_employees = lambda wait_time=10: (employee for employee in employees)
+    assert (current.refresh_employees(previous) == employees[:15]) is reused
+    assert current.employees_reused is reused
+
+
+class Partial(object):
+    """A result whose sections have the given statuses, merged over `previous` like a scraper does."""
+
+    def __init__(self, status, previous=None, sections=None):
+        self.section_status = dict(previous.section_status if previous is not None else {})
+        self.section_status.update({name: value for name, value in status.items() if sections is None or name in sections})
+
+    @property
+    def failed_sections(self):
+        return [name for name, status in self.section_status.items() if status != "complete"]
+
+
+def test_run_queue_retries_only_the_failed_sections(tmp_path, monkeypatch):
+    work_queue = SQLiteWorkQueue(str(tmp_path / "queue.db"), max_attempts=3, retry_delay=0)
+    work_queue.put("person", "https://www.linkedin.com/in/someone/", {"connections": False})
+    attempts = [
+        {"top_card": "complete", "experience": "failed", "education": "timeout"},
+        {"top_card": "failed", "experience": "complete", "education": "failed"},
+        {"top_card": "failed", "experience": "failed", "education": "complete"},
+    ]
+    calls = []
+
+    def scrape(kind, url, driver, previous=None, sections=None, **options):
+        calls.append((sections, options))
+        return Partial(attempts[len(calls) - 1], previous, sections)
+
+    monkeypatch.setattr(runner, "scrape", scrape)
+    results = list(runner.run_queue(work_queue, driver=None, poll_interval=0))
+
+    assert [result.error for result in results] == [
+        "incomplete sections: experience, education", "incomplete sections: education", None,
+    ]
+    assert calls == [
+        (None, {"connections": False}),
+        (["experience", "education"], {"connections": False}),
+        (["education"], {"connections": False}),
+    ]
+    # the sections completed by earlier attempts are kept
+    assert results[-1].result.section_status == {"top_card": "complete", "experience": "complete", "education": "complete"}
+    assert work_queue.counts() == {DONE: 1}
+
+
+def test_run_queue_keeps_the_last_partial_attempt(tmp_path, monkeypatch):
+    work_queue = SQLiteWorkQueue(str(tmp_path / "queue.db"), max_attempts=2, retry_delay=0)
+    work_queue.put("job", "https://www.linkedin.com/jobs/view/1/")
+    monkeypatch.setattr(runner, "scrape_task", lambda task, driver: Partial({"details": "failed"}))
+
+    results = list(runner.run_queue(work_queue, driver=None, poll_interval=0))
+    assert [result.ok for result in results] == [False, True]
+    assert results[0].error == "incomplete sections: details"
+    assert work_queue.counts() == {DONE: 1}
@@ -0,0 +1,31 @@
+import pickle
+
+from linkedin_scraper import serialization
+from linkedin_scraper.objects import Experience
+from linkedin_scraper.person import Person
+
+
+def person():
+    result = Person("https://www.linkedin.com/in/alice/", "Alice", driver=lambda: None, get=False, scrape=False)
+    result.experiences = [Experience(position_title="Engineer")]
+    return result
+
+
+def test_round_trip_leaves_the_driver_out():
+    for compress in (True, False):
+        data = serialization.dumps(person(), compress=compress)
+        loaded = serialization.loads(data)
+        assert loaded.name == "Alice"
+        assert loaded.experiences == [Experience(position_title="Engineer")]
+        assert getattr(loaded, "driver", None) is None
+
+
+def test_compression_is_optional():
+    result = [person() for _ in range(20)]
+    assert len(serialization.dumps(result)) < len(serialization.dumps(result, compress=False))
+
+
+def test_detach():
+    result = person().detach()
+    assert result.driver is None
+    assert pickle.loads(pickle.dumps(result)).name == "Alice"
@@ -0,0 +1,20 @@
+from linkedin_scraper.stats import Throughput, percentile
+
+
+def test_percentile_by_nearest_rank():
+    values = [5, 1, 4, 2, 3]
+    assert percentile(values, 50) == 3
+    assert percentile(values, 95) == 5
+    assert percentile(values, 0) == 1
+    assert percentile([], 50) is None
+
+
+def test_throughput():
+    throughput = Throughput(window=3)
+    for elapsed in (1.0, 2.0, 3.0, 4.0):
+        throughput.record(elapsed)
+    throughput.record(None, ok=False)
+    summary = throughput.summary()
+    assert (summary["done"], summary["failed"]) == (5, 1)
+    assert (summary["p50"], summary["p95"]) == (3.0, 4.0)
+    assert str(throughput).startswith("5 done, 1 failed, ")
@@ -0,0 +1,72 @@
+from datetime import date
+
+from linkedin_scraper.company import Company, CompanySummary
+from linkedin_scraper.jobs import Job
+from linkedin_scraper.objects import Education, Experience
+from linkedin_scraper.person import Person
+from linkedin_scraper.storage import SQLiteSink
+
+ALICE = "https://www.linkedin.com/in/alice/"
+ACME = "https://www.linkedin.com/company/acme/"
+
+
+def person(url=ALICE, name="Alice", positions=("Engineer",)):
+    result = Person(url, name, driver=object(), get=False, scrape=False)
+    result.experiences = [
+        Experience(position_title=title, linkedin_url=ACME, start_date=date(2020, 1, 1)) for title in positions
+    ]
+    result.educations = [Education(institution_name="MIT", degree="BSc")]
+    return result
+
+
+def company(url=ACME, employees=()):
+    result = Company.__new__(Company)
+    result.linkedin_url = url
+    result.name = "Acme"
+    result.employees = [{"name": name, "designation": None, "linkedin_url": None} for name in employees]
+    result.showcase_pages = [CompanySummary("https://www.linkedin.com/showcase/acme-labs/", "Acme Labs", 10)]
+    result.affiliated_companies = []
+    return result
+
+
+def test_entities_and_children_are_written(tmp_path):
+    path = str(tmp_path / "results.db")
+    with SQLiteSink(path) as sink:
+        sink.write_many([
+            person(),
+            company(employees=["Alice", "Bob"]),
+            Job("https://www.linkedin.com/jobs/view/1/", "Engineer", "Acme", ACME, driver=object(), scrape=False),
+        ])
+        db = sink.db
+        assert db.execute("SELECT name FROM persons").fetchall() == [("Alice",)]
+        assert db.execute("SELECT position_title, start_date FROM experiences").fetchall() == [("Engineer", "2020-01-01")]
+        assert db.execute("SELECT degree FROM educations").fetchall() == [("BSc",)]
+        assert db.execute("SELECT name FROM employees ORDER BY position").fetchall() == [("Alice",), ("Bob",)]
+        assert db.execute("SELECT relation, followers FROM company_pages").fetchall() == [("showcase", 10)]
+        assert db.execute("SELECT job_title, company_linkedin_url FROM jobs").fetchall() == [("Engineer", ACME)]
+
+
+def test_rewrites_upsert_and_replace_children(tmp_path):
+    path = str(tmp_path / "results.db")
+    with SQLiteSink(path, batch_size=1) as sink:
+        sink.write(person(positions=("Engineer", "Intern")))
+        sink.write(person(url="https://de.linkedin.com/in/Alice?trk=x", name="Alice B", positions=("Manager",)))
+        db = sink.db
+        assert db.execute("SELECT linkedin_url, name FROM persons").fetchall() == [(ALICE, "Alice B")]
+        assert db.execute("SELECT position_title FROM experiences").fetchall() == [("Manager",)]
+
+
+def test_last_write_of_a_batch_wins(tmp_path):
+    with SQLiteSink(str(tmp_path / "results.db")) as sink:
+        sink.write(company(employees=["Alice"]))
+        sink.write(company(employees=["Bob", "Carol"]))
+        sink.flush()
+        assert sink.db.execute("SELECT name FROM employees ORDER BY position").fetchall() == [("Bob",), ("Carol",)]
+
+
+def test_reopening_keeps_rows(tmp_path):
+    path = str(tmp_path / "results.db")
+    with SQLiteSink(path) as sink:
+        sink.write(person())
+    with SQLiteSink(path) as sink:
+        assert sink.db.execute("SELECT COUNT(*) FROM persons").fetchone() == (1,)
@@ -0,0 +1,118 @@
+import json
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from linkedin_scraper.deadline import Deadline
+from linkedin_scraper.objects import Scraper
+from linkedin_scraper import timeouts as timeouts_module
+from linkedin_scraper.timeouts import AdaptiveTimeouts, default_timeouts
+
+
+def test_default_until_enough_samples():
+    timeouts = AdaptiveTimeouts(min_samples=3, factor=2, margin=0)
+    timeouts.observe("key", 1.0)
+    assert timeouts.timeout("key", 10) == 10
+    timeouts.observe("key", 1.0)
+    timeouts.observe("key", 1.0)
+    assert timeouts.timeout("key", 10) == 2.0
+
+
+def test_learned_timeout_is_clamped():
+    timeouts = AdaptiveTimeouts(min_samples=1, margin=0, minimum=0.5, maximum=5)
+    timeouts.observe("fast", 0.01)
+    timeouts.observe("slow", 60)
+    assert timeouts.timeout("fast", 10) == 0.5
+    assert timeouts.timeout("slow", 10) == 5
+
+
+def test_save_merges_observations_of_several_processes(tmp_path):
+    path = str(tmp_path / "timeouts.json")
+    first = AdaptiveTimeouts(path, save_every=1000)
+    second = AdaptiveTimeouts(path, save_every=1000)
+    first.observe("a", 1.0)
+    second.observe("a", 2.0)
+    second.observe("b", 3.0)
+    first.save()
+    second.save()
+
+    assert sorted(AdaptiveTimeouts(path)._latencies["a"]) == [1.0, 2.0]
+    assert list(AdaptiveTimeouts(path)._latencies["b"]) == [3.0]
+    # saving also picks up what the others saved
+    first.save()
+    assert sorted(first._latencies["a"]) == [1.0, 2.0]
+
+
+class Page(Scraper):
+    def __init__(self, timeouts, deadline=None):
+        self.driver = object()
+        self.timeouts = timeouts
+        self.deadline = deadline
+
+
+def never(locator):
+    return lambda driver: False
+
+
+def test_an_element_that_is_always_absent_keeps_its_default():
+    timeouts = AdaptiveTimeouts(min_samples=1)
+    page = Page(timeouts)
+    for _ in range(3):
+        with pytest.raises(TimeoutException):
+            page._wait_until(never, "class name", "interests", timeout=0.05)
+    key = "Page:class name=interests"
+    assert timeouts.timeout(key, 0.05) == 0.05
+    assert key not in timeouts._latencies
+    assert timeouts.stats()[key] == {"samples": 0, "timeouts": 3, "timeout": None}
+
+
+def test_the_timeout_grows_only_after_an_element_appeared_near_the_cap():
+    timeouts = AdaptiveTimeouts(min_samples=1, factor=1.5, margin=0, minimum=0)
+    timeouts.observe("key", 2.0, timeout=5)
+    timeouts.observe_timeout("key")
+    timeouts.observe("key", 3.8, timeout=5)
+    assert timeouts.timeout("key", 5) == 5
+    timeouts.observe("key", 4.5, timeout=5)
+    assert timeouts.timeout("key", 5) == pytest.approx(6.75)
+
+
+def test_timeouts_of_an_absent_element_shrink_with_fast_hits():
+    timeouts = AdaptiveTimeouts(min_samples=2, factor=1, margin=0, minimum=0)
+    for _ in range(5):
+        timeouts.observe_timeout("Page:class name=rare")
+    timeouts.observe("Page:class name=rare", 0.2, timeout=5)
+    timeouts.observe("Page:class name=rare", 0.3, timeout=5)
+    assert timeouts.timeout("Page:class name=rare", 5) == 0.3
+
+
+def test_the_default_timeouts_are_built_lazily(tmp_path, monkeypatch):
+    path = str(tmp_path / "timeouts.json")
+    monkeypatch.setattr(timeouts_module, "_default", None)
+    monkeypatch.setenv("LINKEDIN_SCRAPER_TIMEOUTS", path)
+    assert Scraper.timeouts is None
+    assert default_timeouts().path == path
+    assert default_timeouts() is default_timeouts()
+    monkeypatch.setattr(timeouts_module, "_default_pid", -1)
+    assert default_timeouts().path == path
+
+
+def test_counts_are_saved_and_old_files_load(tmp_path):
+    path = str(tmp_path / "timeouts.json")
+    with open(path, "w") as f:
+        json.dump({"old": [1.0, 2.0]}, f)
+    timeouts = AdaptiveTimeouts(path, save_every=1000)
+    assert list(timeouts._latencies["old"]) == [1.0, 2.0]
+    timeouts.observe_timeout("new")
+    timeouts.observe("new", 4.5, timeout=5)
+    timeouts.save()
+    loaded = AdaptiveTimeouts(path)
+    assert (loaded._timeouts["new"], loaded._near_cap["new"]) == (1, 1)
+    assert list(loaded._latencies["old"]) == [1.0, 2.0]
+
+
+def test_waits_cut_short_by_the_deadline_are_not_observed():
+    timeouts = AdaptiveTimeouts()
+    page = Page(timeouts, Deadline(0.1))
+    with pytest.raises(TimeoutException):
+        page._wait_until(never, "class name", "slow", timeout=1)
+    assert timeouts.stats() == {}
@@ -0,0 +1,147 @@
+import sqlite3
+import time
+
+import pytest
+
+from linkedin_scraper import runner
+from linkedin_scraper.work_queue import DEAD, DONE, LEASED, PENDING, SQLiteWorkQueue, WorkQueue
+
+URL = "https://www.linkedin.com/in/someone/"
+
+
+@pytest.fixture
+def work_queue(tmp_path):
+    work_queue = SQLiteWorkQueue(str(tmp_path / "queue.db"), max_attempts=2, retry_delay=0)
+    yield work_queue
+    work_queue.close()
+
+
+def test_put_is_idempotent(work_queue):
+    assert work_queue.put("person", URL) == 1
+    assert work_queue.put_many([("person", URL, None), ("company", URL, {"get_employees": False})]) == 1
+    assert work_queue.counts() == {PENDING: 2}
+
+
+def test_lease_ack(work_queue):
+    work_queue.put("company", URL, {"get_employees": False})
+    task = work_queue.lease("a")
+    assert (task.kind, task.target, task.options, task.attempts, task.lease_owner) == ("company", URL, {"get_employees": False}, 1, "a")
+    assert work_queue.lease("b") is None
+    assert work_queue.heartbeat(task)
+    assert work_queue.ack(task)
+    assert work_queue.counts() == {DONE: 1}
+    assert not work_queue.has_unfinished()
+
+
+def test_expired_lease_is_handed_out_again(work_queue):
+    work_queue.put("person", URL)
+    work_queue.lease("a", lease_time=-1)
+    task = work_queue.lease("b")
+    assert task.lease_owner == "b"
+    assert task.attempts == 2
+
+
+def test_lost_lease_changes_nothing(work_queue):
+    work_queue.put("person", URL)
+    stale = work_queue.lease("a", lease_time=-1)
+    live = work_queue.lease("b")
+
+    assert not work_queue.fail(stale, "too late")
+    assert not work_queue.heartbeat(stale)
+    assert not work_queue.ack(stale)
+    # still leased by b, so nobody else gets it
+    assert work_queue.counts() == {LEASED: 1}
+    assert work_queue.lease("c") is None
+    assert work_queue.ack(live)
+
+
+def test_fail_retries_then_dead_letters(work_queue):
+    work_queue.put("person", URL)
+    assert work_queue.fail(work_queue.lease("a"), "boom")
+    assert work_queue.counts() == {PENDING: 1}
+    assert work_queue.fail(work_queue.lease("a"), "boom")
+    assert work_queue.counts() == {DEAD: 1}
+    assert work_queue.requeue_dead() == 1
+    assert work_queue.lease("a").attempts == 1
+
+
+def test_fail_without_retry_dead_letters(work_queue):
+    work_queue.put("person", URL)
+    work_queue.fail(work_queue.lease("a"), "not found", retry=False)
+    assert work_queue.counts() == {DEAD: 1}
+
+
+def test_retry_waits_for_backoff(tmp_path):
+    work_queue = SQLiteWorkQueue(str(tmp_path / "queue.db"), retry_delay=60)
+    work_queue.put("person", URL)
+    work_queue.fail(work_queue.lease("a"), "boom")
+    assert work_queue.lease("a") is None
+    assert work_queue.has_unfinished()
+
+
+def test_run_queue_acks_and_fails(work_queue, monkeypatch):
+    work_queue.put("person", URL)
+    work_queue.put("person", URL + "gone/")
+
+    def scrape_task(task, driver):
+        if task.target.endswith("gone/"):
+            error = ValueError("removed")
+            error.retry = False
+            raise error
+        return task.target
+
+    monkeypatch.setattr(runner, "scrape_task", scrape_task)
+    results = list(runner.run_queue(work_queue, driver=None, poll_interval=0))
+    assert [(result.url, result.ok) for result in results] == [(URL, True), (URL + "gone/", False)]
+    assert work_queue.counts() == {DONE: 1, DEAD: 1}
+
+
+def broken_driver():
+    raise RuntimeError("chrome did not start")
+
+
+def test_run_queue_workers_ends_when_drivers_fail_to_start(tmp_path):
+    path = str(tmp_path / "queue.db")
+    SQLiteWorkQueue(path).put("person", URL)
+    start = time.time()
+    assert list(runner.run_queue_workers(path, workers=2, driver_factory=broken_driver)) == []
+    assert time.time() - start < 30
+
+
+def test_fail_carries_options_and_previous_to_the_retry(tmp_path):
+    work_queue = SQLiteWorkQueue(str(tmp_path / "queue.db"), retry_delay=0)
+    work_queue.put("person", "https://www.linkedin.com/in/someone/", {"connections": False})
+    task = work_queue.lease("a")
+    assert task.previous is None
+    assert work_queue.fail(task, "incomplete", options={"connections": False, "sections": ["education"]}, previous=b"partial")
+
+    task = work_queue.lease("a")
+    assert (task.options, task.previous) == ({"connections": False, "sections": ["education"]}, b"partial")
+    # a plain failure keeps both
+    work_queue.fail(task, "timeout")
+    task = work_queue.lease("a")
+    assert (task.options["sections"], task.previous) == (["education"], b"partial")
+
+
+def test_queues_without_the_previous_column_are_migrated(tmp_path):
+    path = str(tmp_path / "queue.db")
+    db = sqlite3.connect(path)
+    db.execute(
+        "CREATE TABLE tasks (id INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT NOT NULL, target TEXT NOT NULL, "
+        "options TEXT, status TEXT NOT NULL DEFAULT 'pending', attempts INTEGER NOT NULL DEFAULT 0, "
+        "available_at REAL NOT NULL DEFAULT 0, lease_owner TEXT, lease_expires REAL, error TEXT, updated_at REAL, "
+        "UNIQUE (kind, target))"
+    )
+    db.execute("INSERT INTO tasks (kind, target, options) VALUES ('person', 'https://www.linkedin.com/in/someone/', '{}')")
+    db.commit()
+    db.close()
+    assert SQLiteWorkQueue(path).lease("a").previous is None
+
+
+def test_an_incomplete_backend_fails_when_created():
+    class Incomplete(WorkQueue):
+        def put(self, kind, target, options=None):
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete()